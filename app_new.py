@@ -42,7 +42,7 @@ st.set_page_config(
 )
 
 # Import all modules - UI imports are lightweight, heavy deps are lazy-loaded
-from modules.utils import _cleanup_session_state, validate_secrets
+from modules.utils import _cleanup_session_state, validate_secrets, start_metrics_server, apply_admin_query_params, profile_if_enabled
 from modules.ui.styles import render_styles
 from modules.ui import (
     render_sidebar,
@@ -51,7 +51,8 @@ from modules.ui import (
     display_market_positioning_profile,
     display_refine_results_section,
     display_ranked_matches_table,
-    display_match_breakdown
+    display_match_breakdown,
+    display_diagnostics_page
 )
 
 # Render CSS styles (lightweight - no heavy imports)
@@ -69,8 +70,8 @@ if 'user_profile' not in st.session_state:
     st.session_state.user_profile = {}
 if 'generated_resume' not in st.session_state:
     st.session_state.generated_resume = None
-if 'selected_job' not in st.session_state:
-    st.session_state.selected_job = None
+if 'selected_job_id' not in st.session_state:
+    st.session_state.selected_job_id = None
 if 'show_resume_generator' not in st.session_state:
     st.session_state.show_resume_generator = False
 if 'resume_text' not in st.session_state:
@@ -105,10 +106,6 @@ if 'selected_job_index' not in st.session_state:
     st.session_state.selected_job_index = None
 if 'dashboard_ready' not in st.session_state:
     st.session_state.dashboard_ready = False
-if 'user_skills_embeddings_cache' not in st.session_state:
-    st.session_state.user_skills_embeddings_cache = {}
-if 'skill_embeddings_cache' not in st.session_state:
-    st.session_state.skill_embeddings_cache = {}
 
 # Limit search history size
 MAX_SEARCH_HISTORY = 20
@@ -121,10 +118,20 @@ try:
 except Exception:
     pass
 
+# Admin-only switches: ?admin=<ADMIN_TOKEN>&profile=1 / &diagnostics=1
+apply_admin_query_params()
+
+# Prometheus /metrics endpoint, once per process (no-op unless METRICS_PORT is set)
+start_metrics_server()
+
 
 def main():
     """Main application function"""
     try:
+        if st.session_state.get('show_diagnostics', False) and st.session_state.get('is_admin', False):
+            display_diagnostics_page()
+            return
+
         # Check if resume generator should be shown
         if st.session_state.get('show_resume_generator', False):
             display_resume_generator()
@@ -184,7 +191,9 @@ def main():
 if __name__ == "__main__":
     # Wrap main() in error handling to prevent crashes
     try:
-        main()
+        # cProfile/tracemalloc around the whole run when profiling is on for this session
+        with profile_if_enabled('run'):
+            main()
     except Exception as e:
         st.error(f"""
         ❌ **Startup Error**
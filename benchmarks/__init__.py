@@ -0,0 +1,8 @@
+"""Performance benchmarks, run against the local mock APIs (see mock_apis)
+
+    python -m benchmarks.e2e --jobs 25 --jobs 5000 --jobs 50000
+    python -m benchmarks.micro --filter search
+    python -m benchmarks.load --users 1 --users 4 --users 16
+    python -m benchmarks.coldstart --runs 5
+    python -m benchmarks.e2e compare benchmarks/results/e2e-<old>.json benchmarks/results/e2e-<new>.json
+"""
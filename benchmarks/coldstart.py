@@ -0,0 +1,106 @@
+"""Cold-start benchmark: wall time and import cost of the first app_new.py script run
+
+    python -m benchmarks.coldstart
+    python -m benchmarks.coldstart --runs 10 --budget-ms 1500
+
+Each run starts a fresh interpreter with -X importtime and executes
+app_new.py in bare mode (no server), which is what a new container pays
+before its first page. Reported per run: wall_ms for the whole process,
+import_ms across all imports and app_import_ms for the repo's own
+packages (including what they pull in). Heavy libraries that should only
+load on first use are listed under deferred_loaded if they appear.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from .harness import REPO_ROOT, results_header, save_results
+
+APP_SCRIPT = os.path.join(REPO_ROOT, 'app_new.py')
+APP_PACKAGES = ('modules',)
+# Only needed once a resume is parsed, a table is shown or a document is rendered
+DEFERRED_MODULES = ('pandas', 'numpy', 'pyarrow', 'PyPDF2', 'docx', 'reportlab', 'chromadb', 'tiktoken')
+
+
+def parse_importtime(stderr):
+    """[(module, depth, self_us, cumulative_us)] from -X importtime output, in the order printed."""
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        try:
+            fields = line[len('import time:'):].split('|')
+            self_us, cumulative_us, name = int(fields[0]), int(fields[1]), fields[2][1:].rstrip()
+        except (IndexError, ValueError):
+            continue
+        stripped = name.lstrip(' ')
+        entries.append((stripped, (len(name) - len(stripped)) // 2, self_us, cumulative_us))
+    return entries
+
+
+def summarize_imports(entries, top=10):
+    """Totals and the slowest top-level imports from parse_importtime() entries."""
+    top_level = [entry for entry in entries if entry[1] == 0]
+    app = [entry for entry in top_level if entry[0].split('.')[0] in APP_PACKAGES]
+    loaded = {entry[0] for entry in entries}
+    return {
+        'import_ms': round(sum(entry[3] for entry in top_level) / 1000, 1),
+        'app_import_ms': round(sum(entry[3] for entry in app) / 1000, 1),
+        'modules_loaded': len(loaded),
+        'deferred_loaded': sorted(name for name in DEFERRED_MODULES if name in loaded),
+        'slowest': [{'module': name, 'ms': round(cumulative / 1000, 1)}
+                    for name, _, _, cumulative in sorted(top_level, key=lambda e: e[3], reverse=True)[:top]],
+    }
+
+
+def import_profile(code=None, script=APP_SCRIPT, env=None, timeout=120):
+    """Run a fresh interpreter with -X importtime (code via -c, else script); returns (wall_ms, entries)."""
+    command = [sys.executable, '-X', 'importtime'] + (['-c', code] if code else [script])
+    start = time.perf_counter()
+    completed = subprocess.run(command, cwd=REPO_ROOT, capture_output=True, text=True, timeout=timeout,
+                               env=dict(os.environ, **(env or {})))
+    wall_ms = round((time.perf_counter() - start) * 1000, 1)
+    if completed.returncode != 0:
+        raise RuntimeError(f"{' '.join(command)} exited with {completed.returncode}: {completed.stderr[-500:]}")
+    return wall_ms, parse_importtime(completed.stderr)
+
+
+def run_cold_starts(runs=5):
+    results = []
+    for run in range(runs):
+        wall_ms, entries = import_profile()
+        results.append(dict(run=run, wall_ms=wall_ms, **summarize_imports(entries)))
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.coldstart', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, help='exit 1 if the median wall time exceeds this')
+    parser.add_argument('--output', help='results file (default benchmarks/results/coldstart-<commit>.json)')
+    args = parser.parse_args(argv)
+
+    results = results_header('coldstart', {'runs': args.runs})
+    results['runs'] = run_cold_starts(args.runs)
+    median = {key: statistics.median(run[key] for run in results['runs'])
+              for key in ('wall_ms', 'import_ms', 'app_import_ms')}
+    results['median'] = median
+    print(f"cold start (median of {args.runs}): {median['wall_ms']:.0f} ms wall, "
+          f"{median['import_ms']:.0f} ms imports, {median['app_import_ms']:.0f} ms in {', '.join(APP_PACKAGES)}")
+    last = results['runs'][-1]
+    for row in last['slowest']:
+        print(f"  {row['module']:<40} {row['ms']:>8.1f} ms")
+    if last['deferred_loaded']:
+        print(f"loaded at startup but should be deferred: {', '.join(last['deferred_loaded'])}")
+    print(f"Saved {save_results(results, args.output)}")
+    if args.budget_ms and median['wall_ms'] > args.budget_ms:
+        print(f"over budget: {median['wall_ms']:.0f} ms > {args.budget_ms:.0f} ms")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
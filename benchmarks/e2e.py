@@ -0,0 +1,352 @@
+"""End-to-end benchmark: fetch → filter → index → search → skill match → salary → render
+
+Every corpus size runs in a fresh worker process against a mock_apis server
+(itself a separate process, so its memory never counts towards the app's).
+The worker runs the real MatchingPipeline, calculate_salary_band and the
+tailored resume DOCX/PDF render, and records per stage:
+
+- wall_s: wall time (pipeline stages use MatchingPipeline.timings)
+- api_calls / rate_limited: requests the mock saw per service
+- tokens: embedding, prompt and completion tokens the mock counted
+- peak_rss_mb: process high-water mark at the end of the stage
+
+API calls and tokens are attributed to the stage window in which they were
+made, so with overlap the background resume embedding lands in 'fetch'.
+Results are saved as JSON tagged with the git commit:
+
+    python -m benchmarks.e2e --jobs 25 --jobs 5000 --runs 2 --set EMBEDDING_BATCH_DELAY=0
+    python -m benchmarks.e2e compare benchmarks/results/e2e-abc1234.json benchmarks/results/e2e-def5678.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+import requests
+
+from .fixtures import RESUME_TEXT, USER_PROFILE
+from .harness import (
+    MockProcess,
+    peak_rss_mb,
+    results_header,
+    save_results,
+    compare_main,
+    relative_change,
+    write_mock_secrets,
+    worker_env
+)
+
+MIN_JOBS = 25
+MAX_JOBS = 50000
+SERVICES = ('embeddings', 'chat', 'indeed')
+PIPELINE_STAGES = ('fetch', 'filter', 'index', 'embed_resume', 'search', 'skill_match', 'rank')
+STAGE_ORDER = PIPELINE_STAGES + ('salary', 'render')
+
+
+def _mock_stats(base_url):
+    return requests.get(f"{base_url}/__mock__/stats", timeout=10).json()
+
+
+def _empty_stage():
+    return {
+        'wall_s': 0.0,
+        'api_calls': {service: 0 for service in SERVICES},
+        'rate_limited': 0,
+        'tokens': {'embedding': 0, 'prompt': 0, 'completion': 0},
+        'peak_rss_mb': 0.0,
+    }
+
+
+class StageRecorder:
+    """Per-stage wall time, mock API counters and peak RSS.
+
+    Pipeline stages are delimited by MatchingPipeline progress callbacks
+    (a stage window closes when the next stage reports); stage() wraps
+    the stages the harness runs itself.
+    """
+    def __init__(self, mock_url):
+        self.mock_url = mock_url
+        self.stages = {}
+        self._open = None
+
+    def _begin(self, name):
+        self._open = (name, time.perf_counter(), _mock_stats(self.mock_url))
+
+    def _finish(self):
+        if self._open is None:
+            return
+        name, start, before = self._open
+        self._open = None
+        after = _mock_stats(self.mock_url)
+        record = self.stages.setdefault(name, _empty_stage())
+        record['wall_s'] += time.perf_counter() - start
+
+        def delta(service, key):
+            return after.get(service, {}).get(key, 0) - before.get(service, {}).get(key, 0)
+
+        for service in SERVICES:
+            record['api_calls'][service] += delta(service, 'requests')
+            record['rate_limited'] += delta(service, 'rate_limited')
+        record['tokens']['embedding'] += delta('embeddings', 'prompt_tokens')
+        record['tokens']['prompt'] += delta('chat', 'prompt_tokens')
+        record['tokens']['completion'] += delta('chat', 'completion_tokens')
+        record['peak_rss_mb'] = peak_rss_mb()
+
+    def on_progress(self, stage, percent, message):
+        if self._open is not None and self._open[0] == stage:
+            return
+        self._finish()
+        self._begin(stage)
+
+    def close_pipeline(self, timings):
+        """Close the last pipeline window and take wall times from the pipeline's own timings."""
+        self._finish()
+        for stage, seconds in timings.items():
+            if stage not in self.stages:
+                self.stages[stage] = dict(_empty_stage(), peak_rss_mb=peak_rss_mb())
+            self.stages[stage]['wall_s'] = seconds
+
+    @contextmanager
+    def stage(self, name):
+        self._begin(name)
+        try:
+            yield
+        finally:
+            self._finish()
+
+
+def _run_worker(spec):
+    """Runs in the worker process (cwd is a scratch dir holding the mock secrets)."""
+    started = time.perf_counter()
+    from modules.analysis import calculate_salary_band
+    from modules.pipeline import MatchingPipeline, MatchingRequest
+    from modules.resume_generator import generate_docx_from_json, generate_pdf_from_json
+    from modules.utils import get_embedding_generator, get_text_generator, get_job_scraper, get_token_tracker
+    import_s = time.perf_counter() - started
+
+    mock_url = spec['mock_url']
+    embedding_gen = get_embedding_generator()
+    text_gen = get_text_generator()
+    scraper = get_job_scraper()
+    endpoints = {
+        'embeddings': getattr(embedding_gen, 'endpoint', None),
+        'chat': getattr(text_gen, 'endpoint', None),
+        'indeed': getattr(scraper, 'base_url', None),
+    }
+    if any(endpoint != mock_url for endpoint in endpoints.values()):
+        raise SystemExit(f"Refusing to benchmark: clients are not pointed at the mock ({endpoints})")
+
+    runs = []
+    for run in range(spec['runs']):
+        recorder = StageRecorder(mock_url)
+        token_tracker = get_token_tracker()
+        token_tracker.reset()
+        run_start = time.perf_counter()
+
+        pipeline = MatchingPipeline(scraper, embedding_gen, progress_callback=recorder.on_progress,
+                                    overlap=spec['overlap'], use_persistent_store=spec['persistent'])
+        result = pipeline.run(
+            MatchingRequest(
+                search_query=spec['query'],
+                target_domains=spec['domains'],
+                salary_expectation=spec['salary_expectation'],
+                max_rows=spec['jobs'],
+                desired_matches=spec['desired_matches'],
+            ),
+            resume_text=RESUME_TEXT,
+            user_profile=USER_PROFILE,
+        )
+        recorder.close_pipeline(pipeline.timings)
+
+        documents = {}
+        if result.matches:
+            with recorder.stage('salary'):
+                salary_band = calculate_salary_band(result.matches)
+            with recorder.stage('render'):
+                resume_data = text_gen.generate_resume(USER_PROFILE, result.matches[0]['job'], RESUME_TEXT)
+                if resume_data:
+                    docx = generate_docx_from_json(resume_data)
+                    pdf = generate_pdf_from_json(resume_data)
+                    documents = {
+                        'docx_bytes': len(docx.getvalue()) if docx else 0,
+                        'pdf_bytes': len(pdf.getvalue()) if pdf else 0,
+                    }
+        else:
+            salary_band = None
+
+        stages = {name: recorder.stages[name] for name in STAGE_ORDER if name in recorder.stages}
+        stages.update({name: record for name, record in recorder.stages.items() if name not in stages})
+        for record in stages.values():
+            record['wall_s'] = round(record['wall_s'], 4)
+        runs.append({
+            'jobs': spec['jobs'],
+            'run': run,
+            'cache': 'cold' if run == 0 else 'warm',
+            'status': result.status,
+            'total_fetched': result.total_fetched,
+            'filtered_count': result.filtered_count,
+            'matches': len(result.matches),
+            'salary_band': list(salary_band) if salary_band else None,
+            'documents': documents,
+            'wall_s': round(time.perf_counter() - run_start, 4),
+            'import_s': round(import_s, 4) if run == 0 else 0.0,
+            'peak_rss_mb': peak_rss_mb(),
+            'api_calls': {service: sum(s['api_calls'][service] for s in stages.values()) for service in SERVICES},
+            'tokens': token_tracker.get_summary(),
+            'stages': stages,
+        })
+    return runs
+
+
+def _spawn_worker(spec, overrides):
+    """Run one corpus size in a fresh interpreter so peak RSS belongs to that size alone."""
+    with tempfile.TemporaryDirectory(prefix='careerlens-bench-') as workdir:
+        write_mock_secrets(workdir, spec['mock_url'], overrides)
+        spec_path = os.path.join(workdir, 'spec.json')
+        result_path = os.path.join(workdir, 'result.json')
+        with open(spec_path, 'w') as f:
+            json.dump(spec, f)
+        completed = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.e2e', 'worker', spec_path, result_path],
+            cwd=workdir, env=worker_env(overrides), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"Benchmark worker for {spec['jobs']} jobs failed:\n{completed.stderr[-4000:]}")
+        with open(result_path) as f:
+            return json.load(f)
+
+
+def _format_run(run):
+    lines = [f"{run['jobs']:>6} jobs ({run['cache']}): {run['wall_s']:.2f}s total, "
+             f"{run['matches']} matches, peak RSS {run['peak_rss_mb']:.0f} MB, status={run['status']}"]
+    for name, stage in run['stages'].items():
+        calls = ", ".join(f"{service}={count}" for service, count in stage['api_calls'].items() if count)
+        tokens = sum(stage['tokens'].values())
+        lines.append(f"    {name:<13} {stage['wall_s']:>8.3f}s  rss {stage['peak_rss_mb']:>7.1f} MB"
+                     f"  tokens {tokens:>7}  {calls}")
+    return "\n".join(lines)
+
+
+def run_benchmark(args):
+    overrides = dict(item.split('=', 1) for item in args.set or [])
+    job_counts = args.jobs or [MIN_JOBS, 1000]
+    results = results_header('e2e', {
+        'query': args.query,
+        'domains': args.domains,
+        'salary_expectation': args.salary_expectation,
+        'desired_matches': args.desired_matches,
+        'overlap': not args.no_overlap,
+        'persistent': args.persistent,
+        'mock_config': args.mock_config,
+        'seed': args.seed,
+        'overrides': overrides,
+    })
+    results['runs'] = []
+
+    with MockProcess(args.mock_config, args.seed) as mock:
+        for jobs in job_counts:
+            mock.reset()
+            spec = {
+                'mock_url': mock.base_url,
+                'jobs': jobs,
+                'runs': args.runs,
+                'query': args.query,
+                'domains': args.domains,
+                'salary_expectation': args.salary_expectation,
+                'desired_matches': args.desired_matches,
+                'overlap': not args.no_overlap,
+                'persistent': args.persistent,
+            }
+            for run in _spawn_worker(spec, overrides):
+                results['runs'].append(run)
+                print(_format_run(run))
+
+    print(f"Saved {save_results(results, args.output)}")
+    return results
+
+
+def compare_results(base, new, threshold=0.10):
+    """Per-stage wall time / API call / peak RSS changes between two result files.
+
+    Returns (lines, regressions); a regression is a stage (or run) that got
+    slower or bigger by more than threshold, or made more API calls.
+    """
+    lines = [f"{base.get('commit')} → {new.get('commit')}"]
+    regressions = []
+    base_runs = {(run['jobs'], run['run']): run for run in base.get('runs', [])}
+
+    for run in new.get('runs', []):
+        key = (run['jobs'], run['run'])
+        old_run = base_runs.get(key)
+        if old_run is None:
+            continue
+        label = f"{run['jobs']} jobs ({run['cache']})"
+        lines.append(f"{label}: {old_run['wall_s']:.2f}s → {run['wall_s']:.2f}s "
+                     f"({relative_change(old_run['wall_s'], run['wall_s']):+.0%}), peak RSS "
+                     f"{old_run['peak_rss_mb']:.0f} → {run['peak_rss_mb']:.0f} MB")
+        if relative_change(old_run['peak_rss_mb'], run['peak_rss_mb']) > threshold:
+            regressions.append(f"{label} peak RSS")
+        for name, stage in run['stages'].items():
+            old_stage = old_run['stages'].get(name)
+            if old_stage is None:
+                continue
+            wall = relative_change(old_stage['wall_s'], stage['wall_s'])
+            old_calls = sum(old_stage['api_calls'].values())
+            calls = sum(stage['api_calls'].values())
+            flag = ''
+            if wall > threshold and stage['wall_s'] - old_stage['wall_s'] > 0.005:
+                flag = '  ← slower'
+                regressions.append(f"{label} {name} wall time")
+            if calls > old_calls:
+                flag += '  ← more API calls'
+                regressions.append(f"{label} {name} API calls")
+            lines.append(f"    {name:<13} {old_stage['wall_s']:>8.3f}s → {stage['wall_s']:>8.3f}s ({wall:+.0%})"
+                         f"  calls {old_calls} → {calls}{flag}")
+    return lines, regressions
+
+
+def _job_count(value):
+    count = int(value)
+    if not MIN_JOBS <= count <= MAX_JOBS:
+        raise argparse.ArgumentTypeError(f"corpus size must be between {MIN_JOBS} and {MAX_JOBS}")
+    return count
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv[:1] == ['worker']:
+        with open(argv[1]) as f:
+            spec = json.load(f)
+        runs = _run_worker(spec)
+        with open(argv[2], 'w') as f:
+            json.dump(runs, f)
+        return 0
+
+    if argv[:1] == ['compare']:
+        return compare_main('python -m benchmarks.e2e', argv[1:], compare_results)
+
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.e2e', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--jobs', type=_job_count, action='append',
+                        help=f'synthetic corpus size ({MIN_JOBS}-{MAX_JOBS}); repeat for several sizes')
+    parser.add_argument('--runs', type=int, default=1, help='runs per size; runs after the first hit warm caches')
+    parser.add_argument('--query', default='data analyst')
+    parser.add_argument('--domains', nargs='*', default=['Data Analytics', 'FinTech', 'Technology'])
+    parser.add_argument('--salary-expectation', type=int, default=0)
+    parser.add_argument('--desired-matches', type=int, default=15)
+    parser.add_argument('--no-overlap', action='store_true', help='run the resume embedding after indexing')
+    parser.add_argument('--persistent', action='store_true', help='use a (scratch) persistent Chroma store')
+    parser.add_argument('--mock-config', help='JSON file with mock_apis MockConfig fields (latency, faults)')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--set', action='append', metavar='KEY=VALUE', help='app configuration override')
+    parser.add_argument('--output', help='results file (default benchmarks/results/e2e-<commit>.json)')
+    args = parser.parse_args(argv)
+    run_benchmark(args)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
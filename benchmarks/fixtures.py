@@ -0,0 +1,72 @@
+"""Sample resume, profile and tailored-resume JSON used as benchmark inputs"""
+
+RESUME_TEXT = """Alex Chan
+Senior Data Analyst | alex.chan@example.com | +852 5555 0000 | Hong Kong
+
+SUMMARY
+Data professional with 6 years of experience in analytics, data engineering and fintech reporting.
+
+EXPERIENCE
+Senior Data Analyst, Harbour Analytics (2020 - Present)
+- Built Power BI dashboards used by 200+ stakeholders
+- Automated SQL and Python reporting pipelines on AWS
+Data Analyst, Jade Financial (2018 - 2020)
+- Modelled credit risk with Python and Excel
+
+EDUCATION
+BSc Computer Science, University of Hong Kong (2018)
+
+SKILLS
+Python, SQL, Power BI, Tableau, AWS, Machine Learning, Stakeholder Management
+"""
+
+USER_PROFILE = {
+    'name': "Alex Chan",
+    'email': "alex.chan@example.com",
+    'phone': "+852 5555 0000",
+    'location': "Hong Kong",
+    'linkedin': "",
+    'portfolio': "",
+    'summary': "Data professional with 6 years of experience in analytics, data engineering and fintech reporting.",
+    'experience': "Senior Data Analyst, Harbour Analytics (2020 - Present); Data Analyst, Jade Financial (2018 - 2020)",
+    'education': "BSc Computer Science, University of Hong Kong (2018)",
+    'skills': "Python, SQL, Power BI, Tableau, AWS, Machine Learning, Stakeholder Management",
+    'certifications': "AWS Certified Cloud Practitioner",
+}
+
+RESUME_DATA = {
+    'header': {
+        'name': "Alex Chan",
+        'title': "Senior Data Analyst",
+        'email': "alex.chan@example.com",
+        'phone': "+852 5555 0000",
+        'location': "Hong Kong",
+        'linkedin': "linkedin.com/in/alexchan",
+        'portfolio': "",
+    },
+    'summary': USER_PROFILE['summary'],
+    'skills_highlighted': USER_PROFILE['skills'].split(", "),
+    'experience': [
+        {
+            'company': "Harbour Analytics",
+            'title': "Senior Data Analyst",
+            'dates': "2020 - Present",
+            'bullets': [
+                "Built Power BI dashboards used by 200+ stakeholders across Asia Pacific",
+                "Automated SQL and Python reporting pipelines on AWS, cutting reporting time by 40%",
+                "Partnered with product teams to define KPIs for digital banking launches",
+            ],
+        },
+        {
+            'company': "Jade Financial",
+            'title': "Data Analyst",
+            'dates': "2018 - 2020",
+            'bullets': [
+                "Modelled credit risk with Python and Excel for a HK$2B loan book",
+                "Prepared monthly regulatory reports for the HKMA",
+            ],
+        },
+    ],
+    'education': USER_PROFILE['education'],
+    'certifications': USER_PROFILE['certifications'],
+}
@@ -0,0 +1,169 @@
+"""Helpers shared by the benchmarks: mock server process, git tagging, RSS and result files"""
+import argparse
+import json
+import os
+import platform
+import resource
+import socket
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+import requests
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(REPO_ROOT, 'benchmarks', 'results')
+MOCK_KEY = "benchmark-mock-key-0123456789"
+
+
+def peak_rss_mb():
+    """Process RSS high-water mark in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is KiB on Linux and bytes on macOS
+    return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+
+def git_commit():
+    """(short commit hash, whether tracked files have uncommitted changes)."""
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=REPO_ROOT,
+                                    capture_output=True, text=True).stdout.strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown', False
+
+
+def results_header(benchmark, settings):
+    """Common metadata for a results file, so runs can be compared across commits."""
+    commit, dirty = git_commit()
+    return {
+        'benchmark': benchmark,
+        'commit': commit,
+        'dirty': dirty,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'settings': settings,
+    }
+
+
+def save_results(results, output=None):
+    """Write results as JSON (default benchmarks/results/<benchmark>-<commit>.json) and return the path."""
+    if not output:
+        suffix = '-dirty' if results.get('dirty') else ''
+        output = os.path.join(RESULTS_DIR, f"{results['benchmark']}-{results['commit']}{suffix}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    return output
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def relative_change(old, new):
+    return (new - old) / old if old else 0.0
+
+
+def compare_main(prog, argv, compare_results):
+    """The 'compare BASE NEW' subcommand: print compare_results' lines; exit status 1 on regressions."""
+    parser = argparse.ArgumentParser(prog=f'{prog} compare')
+    parser.add_argument('base')
+    parser.add_argument('new')
+    parser.add_argument('--threshold', type=float, default=0.10, help='relative change flagged as a regression')
+    args = parser.parse_args(argv)
+    lines, regressions = compare_results(load_results(args.base), load_results(args.new), args.threshold)
+    print("\n".join(lines))
+    if regressions:
+        print(f"{len(regressions)} regression(s): " + "; ".join(regressions))
+        return 1
+    return 0
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+class MockProcess:
+    """python -m mock_apis in a child process, for the duration of a benchmark.
+
+    Running the mock out of process keeps its memory and CPU out of the
+    measurements taken in the app process.
+    """
+    def __init__(self, config_path=None, seed=None):
+        self.port = _free_port()
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        command = [sys.executable, '-m', 'mock_apis', '--port', str(self.port)]
+        if config_path:
+            command += ['--config', os.path.abspath(config_path)]
+        if seed is not None:
+            command += ['--seed', str(seed)]
+        self._process = subprocess.Popen(command, cwd=REPO_ROOT, stdout=subprocess.DEVNULL)
+        self._wait_until_ready()
+
+    def _wait_until_ready(self, timeout=15):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError(f"mock_apis exited with code {self._process.returncode}")
+            try:
+                requests.get(f"{self.base_url}/__mock__/stats", timeout=1)
+                return
+            except requests.exceptions.ConnectionError:
+                time.sleep(0.1)
+        self.stop()
+        raise RuntimeError("mock_apis did not start in time")
+
+    def stats(self):
+        return requests.get(f"{self.base_url}/__mock__/stats", timeout=10).json()
+
+    def reset(self):
+        requests.post(f"{self.base_url}/__mock__/reset", timeout=10)
+
+    def stop(self):
+        if self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+
+def write_mock_secrets(workdir, mock_url, overrides=None):
+    """Point every API client at mock_url for a process started in workdir.
+
+    A project .streamlit/secrets.toml takes precedence over
+    ~/.streamlit/secrets.toml, so real credentials are never picked up.
+    """
+    settings = {
+        'AZURE_OPENAI_API_KEY': MOCK_KEY,
+        'AZURE_OPENAI_ENDPOINT': mock_url,
+        'RAPIDAPI_KEY': MOCK_KEY,
+        'INDEED_API_BASE_URL': mock_url,
+    }
+    settings.update(overrides or {})
+    os.makedirs(os.path.join(workdir, '.streamlit'), exist_ok=True)
+    with open(os.path.join(workdir, '.streamlit', 'secrets.toml'), 'w') as f:
+        for key, value in settings.items():
+            f.write(f"{key} = {json.dumps(str(value))}\n")
+
+
+def worker_env(overrides=None):
+    """Environment for a benchmark subprocess: repo importable, config overrides applied."""
+    env = dict(os.environ, **{key: str(value) for key, value in (overrides or {}).items()})
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [REPO_ROOT, env.get('PYTHONPATH')]))
+    return env
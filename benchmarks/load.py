@@ -0,0 +1,374 @@
+"""Multi-session load generator: N simulated users driving app_new.py through AppTest
+
+    python -m benchmarks.load --users 1 --users 4 --users 16
+    python -m benchmarks.load --users 8 --think-time 1 --ramp 10 --mock-config slow_apis.json
+    python -m benchmarks.load compare benchmarks/results/load-abc1234.json benchmarks/results/load-def5678.json
+
+Every user is its own Streamlit session (an AppTest instance on its own
+thread, all in one process like a real server) and runs this script, one
+timed script run per step:
+
+- open: first page load
+- upload: upload a resume (users alternate between PDF and DOCX)
+- analyze: enter keywords and click "Analyze Profile & Find Matches"
+- refine: click "Apply Filters & Refresh" on the dashboard
+- tailor: open the resume generator for the top match (AppTest cannot
+  select dataframe rows, so this sets the state the row click and the
+  "Tailor Resume" button set)
+- generate: click "Generate Tailored Resume"
+- export: rerun the generator page, as a download click does, rendering
+  the PDF, DOCX and TXT exports
+
+Each user count runs in a fresh worker process against a mock_apis server,
+reporting throughput, latency percentiles per step, errors, API calls per
+session and process memory (RSS sampled every 100 ms plus the high-water mark).
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .fixtures import RESUME_DATA
+from .harness import (
+    REPO_ROOT,
+    MockProcess,
+    peak_rss_mb,
+    results_header,
+    save_results,
+    compare_main,
+    relative_change,
+    write_mock_secrets,
+    worker_env
+)
+
+APP_PATH = os.path.join(REPO_ROOT, 'app_new.py')
+STEPS = ('open', 'upload', 'analyze', 'refine', 'tailor', 'generate', 'export')
+PERCENTILES = (50, 90, 95, 99)
+SERVICES = ('embeddings', 'chat', 'indeed')
+RSS_SAMPLE_INTERVAL = 0.1
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile (values need not be sorted)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, -(-pct * len(ordered) // 100))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def latency_summary(latencies):
+    summary = {f"p{pct}": round(percentile(latencies, pct), 4) for pct in PERCENTILES}
+    summary['mean'] = round(statistics.mean(latencies), 4) if latencies else 0.0
+    summary['max'] = round(max(latencies), 4) if latencies else 0.0
+    summary['count'] = len(latencies)
+    return summary
+
+
+def _current_rss_mb():
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return round(pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024), 1)
+    except (OSError, ValueError, IndexError):
+        return peak_rss_mb()
+
+
+class RssSampler:
+    """Samples process RSS on a background thread while a load level runs."""
+    def __init__(self, interval=RSS_SAMPLE_INTERVAL):
+        self.interval = interval
+        self.samples = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='rss-sampler', daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.samples.append(_current_rss_mb())
+            self._stop.wait(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._stop.set()
+        self._thread.join()
+
+    def summary(self):
+        samples = self.samples or [_current_rss_mb()]
+        return {'rss_mean_mb': round(statistics.mean(samples), 1), 'rss_max_sampled_mb': max(samples)}
+
+
+def _resume_files():
+    from modules.resume_generator import generate_docx_from_json, generate_pdf_from_json
+    return [
+        ("resume.pdf", generate_pdf_from_json(RESUME_DATA).getvalue(), "application/pdf"),
+        ("resume.docx", generate_docx_from_json(RESUME_DATA).getvalue(),
+         "application/vnd.openxmlformats-officedocument.wordprocessingml.document"),
+    ]
+
+
+def _app_errors(at):
+    """Error messages the app rendered plus uncaught exceptions."""
+    messages = [element.value for element in at.error] + [element.value for element in at.exception]
+    return [" ".join(str(message).split())[:200] for message in messages]
+
+
+def _button(at, label):
+    for button in at.button:
+        if label in button.label:
+            return button
+    return None
+
+
+class SimulatedUser:
+    """One session running the scenario; step latencies and errors go into records."""
+    def __init__(self, user_id, resume_file, spec):
+        self.user_id = user_id
+        self.resume_file = resume_file
+        self.spec = spec
+        self.records = []
+
+    def _step(self, at, name, action=None):
+        start = time.perf_counter()
+        error = None
+        try:
+            if action is not None:
+                action(at)
+            at.run()
+            app_errors = _app_errors(at)
+            if app_errors:
+                error = app_errors[0]
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"[:200]
+        self.records.append({
+            'user': self.user_id,
+            'step': name,
+            'latency_s': time.perf_counter() - start,
+            'ok': error is None,
+            'error': error,
+        })
+        if self.spec['think_time']:
+            time.sleep(self.spec['think_time'])
+
+    def run(self):
+        from streamlit.testing.v1 import AppTest
+        from modules.jobs import job_hash
+
+        at = AppTest.from_file(APP_PATH, default_timeout=self.spec['step_timeout'])
+        self._step(at, 'open')
+        self._step(at, 'upload', lambda at: at.sidebar.file_uploader[0].set_value(self.resume_file))
+
+        def analyze(at):
+            at.sidebar.text_input(key='sidebar_job_keywords').set_value(self.spec['query'])
+            at.sidebar.button(key='careerlens_analyze').click()
+        self._step(at, 'analyze', analyze)
+
+        refine = _button(at, "Apply Filters & Refresh")
+        if refine is not None:
+            self._step(at, 'refine', lambda at: refine.click())
+
+        matched_jobs = at.session_state['matched_jobs'] if 'matched_jobs' in at.session_state else []
+        if not matched_jobs:
+            return self.records
+
+        def tailor(at):
+            at.session_state['selected_job_index'] = 0
+            at.session_state['selected_job_id'] = job_hash(matched_jobs[0]['job'])
+            at.session_state['show_resume_generator'] = True
+        self._step(at, 'tailor', tailor)
+
+        generate = _button(at, "Generate Tailored Resume")
+        if generate is not None:
+            self._step(at, 'generate', lambda at: generate.click())
+            self._step(at, 'export')
+        return self.records
+
+
+def _run_level(spec):
+    """Runs in the worker process (cwd is a scratch dir holding the mock secrets)."""
+    started = time.perf_counter()
+    resume_files = _resume_files()
+    setup_s = time.perf_counter() - started
+    rss_before = _current_rss_mb()
+
+    users = [SimulatedUser(i, resume_files[i % len(resume_files)], spec) for i in range(spec['users'])]
+    ramp_delay = spec['ramp'] / spec['users'] if spec['users'] else 0
+
+    def start_user(user):
+        time.sleep(user.user_id * ramp_delay)
+        return user.run()
+
+    with RssSampler() as sampler:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=spec['users'], thread_name_prefix='user') as pool:
+            records = [record for user_records in pool.map(start_user, users) for record in user_records]
+        wall_s = time.perf_counter() - start
+
+    completed = sum(1 for user in users if any(r['step'] == 'export' and r['ok'] for r in user.records))
+
+    steps = {}
+    for step in STEPS:
+        step_records = [r for r in records if r['step'] == step]
+        if step_records:
+            steps[step] = dict(latency_summary([r['latency_s'] for r in step_records]),
+                               errors=sum(1 for r in step_records if not r['ok']))
+    errors = [r for r in records if not r['ok']]
+    return {
+        'users': spec['users'],
+        'wall_s': round(wall_s, 3),
+        'setup_s': round(setup_s, 3),
+        'steps_completed': len(records),
+        'sessions_completed': completed,
+        'throughput': {
+            'sessions_per_min': round(completed / wall_s * 60, 2) if wall_s else 0.0,
+            'steps_per_sec': round(len(records) / wall_s, 3) if wall_s else 0.0,
+        },
+        'latency': latency_summary([r['latency_s'] for r in records]),
+        'steps': steps,
+        'errors': len(errors),
+        'error_samples': sorted({r['error'] for r in errors})[:5],
+        'memory': dict(sampler.summary(), rss_before_mb=rss_before, rss_after_mb=_current_rss_mb(),
+                       peak_rss_mb=peak_rss_mb()),
+    }
+
+
+def _add_api_calls(level, stats):
+    """Mock API traffic for the level; calls per session show work repeated across users."""
+    calls = {service: stats.get(service, {}).get('requests', 0) for service in SERVICES}
+    level['api_calls'] = calls
+    level['api_calls_per_session'] = {service: round(count / level['users'], 2) for service, count in calls.items()}
+    level['rate_limited'] = sum(stats.get(service, {}).get('rate_limited', 0) for service in SERVICES)
+
+
+def _spawn_level(spec, overrides):
+    """Run one user count in a fresh interpreter so its memory figures stand alone."""
+    with tempfile.TemporaryDirectory(prefix='careerlens-load-') as workdir:
+        write_mock_secrets(workdir, spec['mock_url'], overrides)
+        spec_path = os.path.join(workdir, 'spec.json')
+        result_path = os.path.join(workdir, 'result.json')
+        with open(spec_path, 'w') as f:
+            json.dump(spec, f)
+        completed = subprocess.run(
+            [sys.executable, '-m', 'benchmarks.load', 'worker', spec_path, result_path],
+            cwd=workdir, env=worker_env(overrides), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+        )
+        if completed.returncode != 0:
+            raise RuntimeError(f"Load worker for {spec['users']} users failed:\n{completed.stderr[-4000:]}")
+        with open(result_path) as f:
+            return json.load(f)
+
+
+def _format_level(level):
+    latency = level['latency']
+    memory = level['memory']
+    calls = ", ".join(f"{service}={count}" for service, count in level['api_calls_per_session'].items())
+    lines = [
+        f"{level['users']:>4} users: {level['throughput']['sessions_per_min']:.1f} sessions/min, "
+        f"{level['throughput']['steps_per_sec']:.2f} steps/s, p50 {latency['p50']:.2f}s p95 {latency['p95']:.2f}s "
+        f"p99 {latency['p99']:.2f}s, peak RSS {memory['peak_rss_mb']:.0f} MB "
+        f"(+{memory['peak_rss_mb'] - memory['rss_before_mb']:.0f}), errors {level['errors']}, per session: {calls}"
+    ]
+    for step, summary in level['steps'].items():
+        lines.append(f"      {step:<9} p50 {summary['p50']:>7.3f}s  p95 {summary['p95']:>7.3f}s  "
+                     f"max {summary['max']:>7.3f}s  errors {summary['errors']}")
+    for sample in level['error_samples']:
+        lines.append(f"      ! {sample}")
+    return "\n".join(lines)
+
+
+def run_load(args):
+    overrides = dict(item.split('=', 1) for item in args.set or [])
+    results = results_header('load', {
+        'query': args.query,
+        'think_time': args.think_time,
+        'ramp': args.ramp,
+        'step_timeout': args.step_timeout,
+        'mock_config': args.mock_config,
+        'seed': args.seed,
+        'overrides': overrides,
+    })
+    results['levels'] = []
+    with MockProcess(args.mock_config, args.seed) as mock:
+        for users in args.users or [1, 4]:
+            mock.reset()
+            spec = {
+                'mock_url': mock.base_url,
+                'users': users,
+                'query': args.query,
+                'think_time': args.think_time,
+                'ramp': args.ramp,
+                'step_timeout': args.step_timeout,
+            }
+            level = _spawn_level(spec, overrides)
+            _add_api_calls(level, mock.stats())
+            results['levels'].append(level)
+            print(_format_level(level))
+    print(f"Saved {save_results(results, args.output)}")
+    return results
+
+
+def compare_results(base, new, threshold=0.10):
+    """Per-level throughput, p95 latency and peak RSS changes; returns (lines, regressions)."""
+    lines = [f"{base.get('commit')} → {new.get('commit')}"]
+    regressions = []
+    base_levels = {level['users']: level for level in base.get('levels', [])}
+    for level in new.get('levels', []):
+        old = base_levels.get(level['users'])
+        if old is None:
+            continue
+        label = f"{level['users']} users"
+        throughput = relative_change(old['throughput']['sessions_per_min'], level['throughput']['sessions_per_min'])
+        p95 = relative_change(old['latency']['p95'], level['latency']['p95'])
+        rss = relative_change(old['memory']['peak_rss_mb'], level['memory']['peak_rss_mb'])
+        if throughput < -threshold:
+            regressions.append(f"{label} throughput")
+        if p95 > threshold:
+            regressions.append(f"{label} p95 latency")
+        if rss > threshold:
+            regressions.append(f"{label} peak RSS")
+        lines.append(
+            f"{label:>10}: {old['throughput']['sessions_per_min']:.1f} → {level['throughput']['sessions_per_min']:.1f} "
+            f"sessions/min ({throughput:+.0%}), p95 {old['latency']['p95']:.2f}s → {level['latency']['p95']:.2f}s "
+            f"({p95:+.0%}), peak RSS {old['memory']['peak_rss_mb']:.0f} → {level['memory']['peak_rss_mb']:.0f} MB ({rss:+.0%})"
+        )
+    return lines, regressions
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv[:1] == ['worker']:
+        with open(argv[1]) as f:
+            spec = json.load(f)
+        level = _run_level(spec)
+        with open(argv[2], 'w') as f:
+            json.dump(level, f)
+        return 0
+
+    if argv[:1] == ['compare']:
+        return compare_main('python -m benchmarks.load', argv[1:], compare_results)
+
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.load', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--users', type=int, action='append', help='concurrent sessions; repeat to ramp (default 1, 4)')
+    parser.add_argument('--query', default='data analyst')
+    parser.add_argument('--think-time', type=float, default=0.0, help='seconds each user waits between steps')
+    parser.add_argument('--ramp', type=float, default=0.0, help='seconds over which users are started')
+    parser.add_argument('--step-timeout', type=float, default=300.0, help='AppTest timeout per script run')
+    parser.add_argument('--mock-config', help='JSON file with mock_apis MockConfig fields (latency, faults)')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--set', action='append', metavar='KEY=VALUE', help='app configuration override')
+    parser.add_argument('--output', help='results file (default benchmarks/results/load-<commit>.json)')
+    args = parser.parse_args(argv)
+    run_load(args)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""Micro-benchmarks for the CPU hot paths: ops/sec and allocations per call
+
+    python -m benchmarks.micro
+    python -m benchmarks.micro --filter search --sizes 1000 10000 50000
+    python -m benchmarks.micro compare benchmarks/results/micro-abc1234.json benchmarks/results/micro-def5678.json
+
+Each benchmark is warmed up once, then timed in batches long enough to
+measure (at least --min-time seconds) --repeats times; ops/sec comes from
+the median batch. Allocations are measured separately, under tracemalloc,
+over a few single calls: alloc_peak_kb is the most memory the call had
+allocated at once, alloc_retained_kb what it still held on return.
+Inputs that vary per call (postings, salary strings, skill lists) are
+cycled so every run sees the same mix.
+"""
+import argparse
+import gc
+import itertools
+import statistics
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from .fixtures import RESUME_TEXT, USER_PROFILE, RESUME_DATA
+from .harness import results_header, save_results, compare_main, relative_change
+
+DEFAULT_SIZES = (100, 1000, 10000)
+EMBEDDING_DIMENSIONS = 1536
+ALLOCATION_SAMPLES = 10
+POSTINGS = 200
+
+
+@dataclass
+class MicroBenchmark:
+    """name and a setup() that returns the zero-argument operation to time."""
+    name: str
+    setup: object
+
+
+def time_batch(op, number):
+    start = time.perf_counter()
+    for _ in range(number):
+        op()
+    return time.perf_counter() - start
+
+
+def measure(op, min_time=0.2, repeats=5):
+    """ops/sec (median of repeats) and the spread between the fastest and slowest batch."""
+    op()
+    number = 1
+    while True:
+        elapsed = time_batch(op, number)
+        if elapsed >= min_time:
+            break
+        # Aim straight for min_time, growing at least 2x per step
+        number = max(number * 2, int(number * min_time / max(elapsed, 1e-9)) + 1)
+
+    timings = [elapsed] + [time_batch(op, number) for _ in range(repeats - 1)]
+    median = statistics.median(timings)
+    return {
+        'ops_per_sec': round(number / median, 2),
+        'us_per_op': round(median / number * 1e6, 2),
+        'spread': round((max(timings) - min(timings)) / median, 3),
+        'calls': number * repeats,
+    }
+
+
+def measure_allocations(op, samples=ALLOCATION_SAMPLES):
+    """Mean peak and retained traced memory per call, over samples single calls."""
+    peaks = []
+    retained = []
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for _ in range(samples):
+            base, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            op()
+            current, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - base)
+            retained.append(current - base)
+    finally:
+        tracemalloc.stop()
+    return {
+        'alloc_peak_kb': round(statistics.mean(peaks) / 1024, 2),
+        'alloc_retained_kb': round(statistics.mean(retained) / 1024, 2),
+    }
+
+
+def _cycle(values, fn):
+    values = itertools.cycle(values)
+    return lambda: fn(next(values))
+
+
+def _postings():
+    from mock_apis import synthetic_postings
+    return synthetic_postings(POSTINGS, query='data analyst', seed=0)
+
+
+def _scraper():
+    from modules.utils.api_clients import IndeedScraperAPI
+    return IndeedScraperAPI("benchmark-key-0123456789", base_url="http://127.0.0.1:9")
+
+
+def _jobs(count):
+    scraper = _scraper()
+    postings = _postings()
+    return [scraper._parse_job(postings[i % len(postings)] | {'jobUrl': f"https://jobs.example/{i}"})
+            for i in range(count)]
+
+
+def _setup_search(size):
+    def setup():
+        import numpy as np
+        from modules.semantic_search import SemanticJobSearch, JobCorpus
+        rng = np.random.default_rng(size)
+        ids = [f"bench-{i}" for i in range(size)]
+        corpus = JobCorpus(max_jobs=max(size, 100))
+        corpus.add(ids, rng.standard_normal((size, EMBEDDING_DIMENSIONS), dtype=np.float32))
+        engine = SemanticJobSearch(None, use_persistent_store=False)
+        engine.view = corpus.view(ids)
+        engine.jobs = [{'title': f"Job {i}"} for i in range(size)]
+        query = rng.standard_normal(EMBEDDING_DIMENSIONS).tolist()
+        return lambda: engine.search(top_k=15, resume_embedding=query)
+    return setup
+
+
+def _setup_skill_match():
+    from modules.semantic_search import SemanticJobSearch
+    engine = SemanticJobSearch(None, use_persistent_store=False)
+    user_skills = [s.strip() for s in USER_PROFILE['skills'].split(',')]
+    job_skills = [posting['attributes'] for posting in _postings()]
+    return _cycle(job_skills, lambda skills: engine._calculate_skill_match_string_based(user_skills, skills))
+
+
+def _setup_filter_domains(count):
+    def setup():
+        from modules.analysis import filter_jobs_by_domains
+        jobs = _jobs(count)
+        domains = ['Data Analytics', 'FinTech', 'ESG & Sustainability']
+        return lambda: filter_jobs_by_domains(jobs, domains)
+    return setup
+
+
+def _setup_salary_regex():
+    from modules.analysis import extract_salary_from_text_regex
+    texts = []
+    for index, posting in enumerate(_postings()):
+        salary = posting['salary']
+        if salary and index % 2:
+            texts.append(f"HKD {salary['salaryMin']:,} - {salary['salaryMax']:,} per month")
+        elif salary:
+            texts.append(f"{salary['salaryMin'] // 1000}k - {salary['salaryMax'] // 1000}k HKD")
+        else:
+            texts.append(posting['descriptionText'])
+    return _cycle(texts, extract_salary_from_text_regex)
+
+
+def _setup_resume_sections():
+    from modules.resume_upload import extract_relevant_resume_sections
+    # More distinct resumes than the section splitter memoizes, so every call parses
+    resumes = [f"{RESUME_TEXT}\nREFERENCES\nAvailable on request ({i})\n" for i in range(64)]
+    return _cycle(resumes, extract_relevant_resume_sections)
+
+
+def _setup_extract_skills():
+    from modules.skills import extract_skills_from_text
+    postings = _postings()
+    return _cycle(postings, lambda posting: extract_skills_from_text(posting['descriptionText'], posting['title']))
+
+
+def _setup_parse_job():
+    scraper = _scraper()
+    return _cycle(_postings(), scraper._parse_job)
+
+
+def _setup_docx():
+    from modules.resume_generator import generate_docx_from_json
+    return lambda: generate_docx_from_json(RESUME_DATA)
+
+
+def _setup_pdf():
+    from modules.resume_generator import generate_pdf_from_json
+    return lambda: generate_pdf_from_json(RESUME_DATA)
+
+
+def build_benchmarks(sizes=DEFAULT_SIZES):
+    benchmarks = [MicroBenchmark(f"SemanticJobSearch.search[{size}]", _setup_search(size)) for size in sizes]
+    benchmarks += [
+        MicroBenchmark("_calculate_skill_match_string_based", _setup_skill_match),
+        MicroBenchmark("filter_jobs_by_domains[1000]", _setup_filter_domains(1000)),
+        MicroBenchmark("extract_salary_from_text_regex", _setup_salary_regex),
+        MicroBenchmark("extract_relevant_resume_sections", _setup_resume_sections),
+        MicroBenchmark("extract_skills_from_text", _setup_extract_skills),
+        MicroBenchmark("IndeedScraperAPI._parse_job", _setup_parse_job),
+        MicroBenchmark("generate_docx_from_json", _setup_docx),
+        MicroBenchmark("generate_pdf_from_json", _setup_pdf),
+    ]
+    return benchmarks
+
+
+def run_benchmarks(benchmarks, min_time=0.2, repeats=5, report=print):
+    results = []
+    for benchmark in benchmarks:
+        op = benchmark.setup()
+        result = {'name': benchmark.name}
+        result.update(measure(op, min_time, repeats))
+        result.update(measure_allocations(op))
+        results.append(result)
+        report(_format_result(result))
+    return results
+
+
+def _format_result(result):
+    return (f"{result['name']:<40} {result['ops_per_sec']:>12,.1f} ops/s {result['us_per_op']:>12,.1f} µs/op"
+            f"  ±{result['spread']:.0%}  peak {result['alloc_peak_kb']:>9,.1f} KB"
+            f"  retained {result['alloc_retained_kb']:>8,.1f} KB")
+
+
+def compare_results(base, new, threshold=0.10):
+    """Per-benchmark ops/sec and allocation changes; returns (lines, regressions)."""
+    lines = [f"{base.get('commit')} → {new.get('commit')}"]
+    regressions = []
+    base_results = {result['name']: result for result in base.get('results', [])}
+    for result in new.get('results', []):
+        old = base_results.get(result['name'])
+        if old is None:
+            continue
+        speed = relative_change(old['ops_per_sec'], result['ops_per_sec'])
+        allocations = relative_change(old['alloc_peak_kb'], result['alloc_peak_kb'])
+        flag = ''
+        if speed < -threshold:
+            flag = '  ← slower'
+            regressions.append(f"{result['name']} ops/sec")
+        if allocations > threshold and result['alloc_peak_kb'] - old['alloc_peak_kb'] > 1:
+            flag += '  ← allocates more'
+            regressions.append(f"{result['name']} allocations")
+        lines.append(f"{result['name']:<40} {old['ops_per_sec']:>12,.1f} → {result['ops_per_sec']:>12,.1f} ops/s "
+                     f"({speed:+.0%})  peak {old['alloc_peak_kb']:,.1f} → {result['alloc_peak_kb']:,.1f} KB{flag}")
+    return lines, regressions
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv[:1] == ['compare']:
+        return compare_main('python -m benchmarks.micro', argv[1:], compare_results)
+
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.micro', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--filter', help='only run benchmarks whose name contains this text')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help='corpus sizes for search')
+    parser.add_argument('--min-time', type=float, default=0.2, help='seconds per timed batch')
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--output', help='results file (default benchmarks/results/micro-<commit>.json)')
+    args = parser.parse_args(argv)
+
+    benchmarks = [b for b in build_benchmarks(args.sizes) if not args.filter or args.filter in b.name]
+    results = results_header('micro', {'sizes': args.sizes, 'min_time': args.min_time, 'repeats': args.repeats,
+                                       'filter': args.filter})
+    results['results'] = run_benchmarks(benchmarks, args.min_time, args.repeats)
+    print(f"Saved {save_results(results, args.output)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,23 @@
+"""Local stand-ins for the external APIs, for offline load tests and benchmarks
+
+    python -m mock_apis --port 8765 --latency chat=lognormal:400:0.5 --rate-429 indeed=0.1
+
+then point the app at it (the keys can be any non-placeholder value):
+
+    AZURE_OPENAI_ENDPOINT = "http://127.0.0.1:8765"
+    INDEED_API_BASE_URL = "http://127.0.0.1:8765"
+"""
+from .config import SERVICES, LatencyModel, ServiceFaults, MockConfig
+from .fixtures import synthetic_posting, synthetic_postings, embed_text
+from .server import MockAPIServer
+
+__all__ = [
+    'SERVICES',
+    'LatencyModel',
+    'ServiceFaults',
+    'MockConfig',
+    'synthetic_posting',
+    'synthetic_postings',
+    'embed_text',
+    'MockAPIServer'
+]
@@ -0,0 +1,62 @@
+"""Run the mock API server from the command line"""
+import argparse
+import json
+from .config import SERVICES, MockConfig
+from .server import MockAPIServer
+
+
+def _per_service(values, cast):
+    """Parse ["chat=0.1", "0.05"] into {service: value}; a bare value applies to every service."""
+    parsed = {}
+    for value in values or []:
+        service, _, setting = value.rpartition('=')
+        for name in ([service] if service else SERVICES):
+            if name not in SERVICES:
+                raise SystemExit(f"Unknown service '{name}' (expected one of {', '.join(SERVICES)})")
+            parsed[name] = cast(setting)
+    return parsed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m mock_apis', description=MockAPIServer.__doc__)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--config', help='JSON file with MockConfig fields')
+    parser.add_argument('--seed', type=int)
+    parser.add_argument('--latency', action='append', metavar='[SERVICE=]SPEC',
+                        help="e.g. chat=lognormal:400:0.5, indeed=uniform:800:2000, fixed:50")
+    parser.add_argument('--rate-429', action='append', metavar='[SERVICE=]P')
+    parser.add_argument('--retry-after', action='append', metavar='[SERVICE=]SECONDS')
+    parser.add_argument('--rpm', action='append', metavar='[SERVICE=]N', help='per-minute quota before 429s')
+    parser.add_argument('--timeout-rate', action='append', metavar='[SERVICE=]P')
+    parser.add_argument('--hang-seconds', action='append', metavar='[SERVICE=]SECONDS')
+    args = parser.parse_args(argv)
+
+    data = {}
+    if args.config:
+        with open(args.config) as f:
+            data = json.load(f)
+    if args.seed is not None:
+        data['seed'] = args.seed
+    overrides = {
+        'latency': _per_service(args.latency, str),
+        'error_rate_429': _per_service(args.rate_429, float),
+        'retry_after': _per_service(args.retry_after, int),
+        'requests_per_minute': _per_service(args.rpm, int),
+        'timeout_rate': _per_service(args.timeout_rate, float),
+        'hang_seconds': _per_service(args.hang_seconds, float),
+    }
+    for field_name, per_service in overrides.items():
+        for service, value in per_service.items():
+            data.setdefault(service, {})[field_name] = value
+
+    server = MockAPIServer(MockConfig.from_dict(data), host=args.host, port=args.port)
+    print(f"Mock APIs listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Latency and fault-injection settings for the mock API server"""
+import random
+from dataclasses import dataclass, field, asdict
+
+SERVICES = ('embeddings', 'chat', 'indeed')
+
+
+@dataclass
+class LatencyModel:
+    """Response delay distribution in milliseconds.
+
+    kind is 'none', 'fixed' (a), 'uniform' (a..b) or 'lognormal'
+    (median a, sigma b).
+    """
+    kind: str = 'none'
+    a: float = 0.0
+    b: float = 0.0
+
+    @classmethod
+    def parse(cls, spec):
+        """Build from 'none', 'fixed:120', 'uniform:50:200' or 'lognormal:150:0.6'."""
+        if isinstance(spec, LatencyModel):
+            return spec
+        if isinstance(spec, dict):
+            return cls(**spec)
+        parts = str(spec or 'none').split(':')
+        kind = parts[0].strip().lower()
+        values = [float(p) for p in parts[1:]]
+        if kind not in ('none', 'fixed', 'uniform', 'lognormal'):
+            raise ValueError(f"Unknown latency distribution: {spec}")
+        return cls(kind, *(values + [0.0, 0.0])[:2])
+
+    def sample(self, rng):
+        """Delay in seconds."""
+        if self.kind == 'fixed':
+            ms = self.a
+        elif self.kind == 'uniform':
+            ms = rng.uniform(self.a, max(self.a, self.b))
+        elif self.kind == 'lognormal':
+            ms = rng.lognormvariate(0.0, self.b) * self.a
+        else:
+            ms = 0.0
+        return max(0.0, ms) / 1000.0
+
+
+@dataclass
+class ServiceFaults:
+    """Per-service behaviour: latency, random 429s, a per-minute quota and hangs.
+
+    A hang holds the request for hang_seconds and then drops the connection,
+    which the clients see the same way as a timed-out call.
+    """
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    error_rate_429: float = 0.0
+    retry_after: int = 1
+    requests_per_minute: int = 0
+    timeout_rate: float = 0.0
+    hang_seconds: float = 5.0
+
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data or {})
+        if 'latency' in data:
+            data['latency'] = LatencyModel.parse(data['latency'])
+        return cls(**data)
+
+
+@dataclass
+class MockConfig:
+    """Settings for a MockAPIServer; seed makes every response and fault reproducible."""
+    seed: int = 0
+    embedding_dimensions: int = 1536
+    embeddings: ServiceFaults = field(default_factory=ServiceFaults)
+    chat: ServiceFaults = field(default_factory=ServiceFaults)
+    indeed: ServiceFaults = field(default_factory=ServiceFaults)
+
+    @classmethod
+    def from_dict(cls, data):
+        data = dict(data or {})
+        for service in SERVICES:
+            if service in data:
+                data[service] = ServiceFaults.from_dict(data[service])
+        return cls(**data)
+
+    def to_dict(self):
+        return asdict(self)
+
+    def faults(self, service):
+        return getattr(self, service)
+
+    def rng(self, *parts):
+        """Deterministic random stream for one request."""
+        return random.Random("|".join(str(p) for p in (self.seed,) + parts))
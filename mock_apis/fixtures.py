@@ -0,0 +1,206 @@
+"""Deterministic payloads: synthetic Indeed postings, hashed embeddings and canned completions"""
+import hashlib
+import json
+import math
+import random
+import re
+
+TITLES = (
+    'Data Analyst', 'Data Engineer', 'Software Engineer', 'Backend Developer', 'Frontend Developer',
+    'Machine Learning Engineer', 'Product Manager', 'Business Analyst', 'Financial Analyst',
+    'Risk Analyst', 'Compliance Officer', 'Marketing Manager', 'Project Manager', 'DevOps Engineer',
+    'Cloud Architect', 'ESG Analyst', 'Investment Associate', 'Operations Manager', 'HR Business Partner',
+    'UX Designer',
+)
+SENIORITY = ('Junior', '', '', 'Senior', 'Lead', 'Principal')
+COMPANIES = (
+    'Harbour Analytics', 'Victoria Capital', 'Kowloon Digital', 'Pearl River Tech', 'Lantau Systems',
+    'Peak Ventures', 'Star Ferry Labs', 'Tsim Sha Tsui Consulting', 'Central Bank Partners',
+    'Jade Financial', 'Dragon Cloud', 'Lion Rock Health', 'Sai Kung Energy', 'Admiralty Legal',
+    'Causeway Retail', 'Sha Tin Robotics', 'Wan Chai Media', 'Cyberport Fintech', 'Aberdeen Logistics',
+    'Mong Kok Commerce',
+)
+LOCATIONS = (
+    'Central, Hong Kong', 'Kowloon Bay, Hong Kong', 'Quarry Bay, Hong Kong', 'Tsim Sha Tsui, Hong Kong',
+    'Wan Chai, Hong Kong', 'Sha Tin, Hong Kong', 'Cyberport, Hong Kong', 'Hong Kong',
+)
+SKILLS = (
+    'Python', 'SQL', 'Excel', 'Power BI', 'Tableau', 'AWS', 'Azure', 'GCP', 'Docker', 'Kubernetes',
+    'JavaScript', 'TypeScript', 'React', 'Node.js', 'Java', 'Go', 'Machine Learning', 'Deep Learning',
+    'NLP', 'Spark', 'Kafka', 'Airflow', 'Financial Modeling', 'Risk Management', 'Agile', 'Scrum',
+    'Project Management', 'Stakeholder Management', 'Cantonese', 'Mandarin', 'CI/CD', 'Terraform',
+    'Data Analysis', 'Statistics', 'ESG Reporting', 'Compliance', 'Figma', 'REST APIs', 'PostgreSQL',
+    'MongoDB',
+)
+BENEFITS = (
+    'Medical insurance', 'Dental insurance', 'Performance bonus', 'Flexible working hours',
+    'Work from home', 'Education allowance', 'Double pay', 'Annual leave',
+)
+SENTENCES = (
+    "You will partner with stakeholders across the business to deliver {focus} initiatives.",
+    "The team builds {focus} products used by customers across Asia Pacific.",
+    "Responsibilities include designing, testing and maintaining {focus} solutions.",
+    "You will mentor colleagues and champion best practices in {focus}.",
+    "We value curiosity, ownership and clear communication.",
+    "Experience with {skill} and {skill2} is highly regarded.",
+    "You will analyse data, prepare reports and present findings to senior management.",
+    "The role requires strong problem solving skills and attention to detail.",
+    "Our hybrid workplace offers flexibility and a collaborative culture.",
+    "Hands-on knowledge of {skill} is required; {skill2} is a plus.",
+)
+FOCUS = ('fintech', 'data analytics', 'digital transformation', 'ESG and sustainability', 'cloud platform',
+         'payments', 'risk and compliance', 'e-commerce', 'healthcare technology', 'consulting')
+
+_TOKEN = re.compile(r"[a-z0-9+#.]+")
+
+
+def _seed(*parts):
+    return hashlib.md5("|".join(str(p) for p in parts).encode()).hexdigest()
+
+
+def synthetic_posting(rng, index, query=''):
+    """One posting in the Indeed Scraper API response format."""
+    title = f"{rng.choice(SENIORITY)} {rng.choice(TITLES)}".strip()
+    if query and query.lower() != 'jobs' and rng.random() < 0.5:
+        title = f"{title} ({query.title()})"
+    company = rng.choice(COMPANIES)
+    skills = rng.sample(SKILLS, rng.randint(3, 10))
+    focus = rng.choice(FOCUS)
+    sentences = [
+        rng.choice(SENTENCES).format(focus=focus, skill=rng.choice(skills), skill2=rng.choice(skills))
+        for _ in range(rng.randint(8, 40))
+    ]
+    salary = {}
+    if rng.random() < 0.6:
+        low = rng.randrange(18, 90) * 1000
+        salary = {'salaryMin': low, 'salaryMax': low + rng.randrange(5, 40) * 1000, 'salaryCurrency': 'HKD'}
+        if rng.random() < 0.3:
+            sentences.append(f"Salary: HK${low:,} - HK${salary['salaryMax']:,} per month.")
+    job_key = _seed(title, company, index)[:16]
+    return {
+        'title': title,
+        'companyName': company,
+        'location': {'city': 'Hong Kong', 'country': 'Hong Kong', 'formattedAddressShort': rng.choice(LOCATIONS)},
+        'jobType': [rng.choice(('Full-time', 'Full-time', 'Contract', 'Part-time'))],
+        'salary': salary,
+        'benefits': rng.sample(BENEFITS, rng.randint(0, 5)),
+        'attributes': skills,
+        'descriptionText': f"{title} at {company}.\n\n" + " ".join(sentences),
+        'rating': {'rating': round(rng.uniform(2.5, 4.9), 1)},
+        'jobUrl': f"https://hk.indeed.com/viewjob?jk={job_key}",
+        'applyUrl': f"https://hk.indeed.com/applystart?jk={job_key}",
+        'age': f"{rng.randint(1, 14)} days ago",
+        'isRemote': rng.random() < 0.15,
+        'companyLogoUrl': '',
+    }
+
+
+def synthetic_postings(count, query='', location='', country='', seed=0):
+    """Deterministic list of postings for one search."""
+    rng = random.Random(_seed(seed, query.lower(), location.lower(), country.lower()))
+    return [synthetic_posting(rng, index, query) for index in range(count)]
+
+
+def indeed_response(postings):
+    return {'returnvalue': {'data': postings}}
+
+
+def count_tokens(text):
+    """Rough token count (~4 characters per token), used for usage reporting."""
+    return max(1, math.ceil(len(text or '') / 4))
+
+
+def embed_text(text, dimensions=1536, seed=0):
+    """Deterministic unit vector: hashed bag of words, so shared words mean higher cosine similarity."""
+    vector = [0.0] * dimensions
+    tokens = _TOKEN.findall((text or '').lower()) or ['']
+    for token in tokens:
+        digest = hashlib.md5(f"{seed}:{token}".encode()).digest()
+        for offset in (0, 4, 8):
+            bucket = int.from_bytes(digest[offset:offset + 3], 'little') % dimensions
+            vector[bucket] += 1.0 if digest[offset + 3] & 1 else -1.0
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+def _profile():
+    return {
+        "name": "Alex Chan",
+        "email": "alex.chan@example.com",
+        "phone": "+852 5555 0000",
+        "location": "Hong Kong",
+        "linkedin": "",
+        "portfolio": "",
+        "summary": "Data professional with 6 years of experience in analytics and engineering.",
+        "experience": "- Senior Data Analyst, Harbour Analytics (2020 - Present)\n- Data Analyst, Jade Financial (2018 - 2020)",
+        "education": "BSc Computer Science, University of Hong Kong (2018)",
+        "skills": "Python, SQL, Power BI, AWS, Machine Learning, Stakeholder Management",
+        "certifications": "AWS Certified Cloud Practitioner",
+    }
+
+
+def _resume(user_text):
+    title = re.search(r"Title: (.+)", user_text)
+    profile = _profile()
+    return {
+        "header": dict(
+            {key: profile[key] for key in ("name", "email", "phone", "location", "linkedin", "portfolio")},
+            title=title.group(1).strip() if title else "Data Professional",
+        ),
+        "summary": profile["summary"],
+        "skills_highlighted": profile["skills"].split(", "),
+        "experience": [
+            {"company": "Harbour Analytics", "title": "Senior Data Analyst", "dates": "2020 - Present",
+             "bullets": ["Built dashboards used by 200+ stakeholders.", "Cut reporting time by 40%."]},
+        ],
+        "education": profile["education"],
+        "certifications": profile["certifications"],
+    }
+
+
+def _keywords(user_text):
+    lowered = user_text.lower()
+    found = [skill for skill in SKILLS if skill.lower() in lowered]
+    return found[:15] or ["Communication", "Teamwork"]
+
+
+def _salary(user_text):
+    amounts = [int(a.replace(',', '')) for a in re.findall(r"HK\$\s?([\d,]{4,})", user_text)]
+    if not amounts:
+        return {"min_salary_hkd_monthly": None, "max_salary_hkd_monthly": None, "found": False, "raw_text": ""}
+    return {"min_salary_hkd_monthly": min(amounts), "max_salary_hkd_monthly": max(amounts), "found": True,
+            "raw_text": f"HK${min(amounts):,} - HK${max(amounts):,}"}
+
+
+def chat_content(messages, json_mode):
+    """Canned completion text for the prompts the app sends, chosen by system prompt."""
+    system = next((m.get('content', '') for m in messages if m.get('role') == 'system'), '').lower()
+    user_text = "\n".join(m.get('content', '') for m in messages if m.get('role') == 'user')
+    if not system and messages:
+        system = messages[0].get('content', '').lower()
+
+    if 'resume parser' in system:
+        data = _profile()
+    elif 'quality checker' in system:
+        profile = _profile()
+        data = {"experience": profile["experience"], "education": profile["education"]}
+    elif 'salary extraction' in system:
+        data = _salary(user_text)
+    elif 'keyword extraction' in system:
+        data = {"keywords": _keywords(user_text)}
+    elif 'career analyst' in system:
+        data = {"seniority": "Mid-Senior Level", "confidence": "medium"}
+    elif 'career advisor' in system:
+        data = {"accreditation": "AWS Certified Solutions Architect", "reason": "Frequently requested in these roles."}
+    elif 'recruiter' in system and json_mode:
+        ids = [int(i) for i in re.findall(r"^\[(\d+)\] Job Title:", user_text, flags=re.MULTILINE)]
+        data = {"notes": [{"id": i, "note": f"Strong match for role {i}: relevant analytics and cloud experience."} for i in ids]}
+    elif 'recruiter' in system:
+        return "Strong match: the candidate's analytics and cloud experience align with the core requirements."
+    elif 'resume writer' in system or 'expert resume' in system:
+        data = _resume(user_text)
+    elif json_mode:
+        data = {}
+    else:
+        return "Delivered measurable improvements by applying data-driven analysis to key business processes."
+    return json.dumps(data)
@@ -0,0 +1,242 @@
+"""Threaded HTTP stand-in for Azure OpenAI (embeddings, chat) and the RapidAPI Indeed Scraper"""
+import json
+import re
+import threading
+import time
+from collections import Counter, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from .config import MockConfig, SERVICES
+from .fixtures import synthetic_postings, indeed_response, count_tokens, embed_text, chat_content
+
+_AZURE_PATH = re.compile(r"^/openai/deployments/(?P<deployment>[^/]+)/(?P<operation>embeddings|chat/completions)$")
+INDEED_PATH = '/api/job'
+CONTROL_PREFIX = '/__mock__/'
+
+
+class MockAPIServer:
+    """Serves the endpoints APIMEmbeddingGenerator, AzureOpenAITextGenerator and
+    IndeedScraperAPI call, on one port.
+
+    Point AZURE_OPENAI_ENDPOINT and INDEED_API_BASE_URL at base_url. Responses
+    are deterministic for a given seed; latency, 429s (with Retry-After), a
+    per-minute quota and hung requests are injected per service as configured.
+    GET /__mock__/stats returns request, fault and token counts;
+    POST /__mock__/config replaces the configuration and /__mock__/reset
+    clears the counters.
+    """
+    def __init__(self, config=None, host='127.0.0.1', port=0):
+        self.config = config if isinstance(config, MockConfig) else MockConfig.from_dict(config)
+        self._lock = threading.Lock()
+        self._request_counter = Counter()
+        self._recent = {service: deque() for service in SERVICES}
+        self.reset_stats()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name='mock-apis', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {service: Counter() for service in SERVICES}
+            self._request_counter.clear()
+            for recent in self._recent.values():
+                recent.clear()
+
+    def stats(self):
+        """Counters per service: requests, ok, rate_limited, hangs, unauthorized, items and tokens."""
+        with self._lock:
+            return {service: dict(counter) for service, counter in self._stats.items()}
+
+    def _count(self, service, **increments):
+        with self._lock:
+            for key, value in increments.items():
+                self._stats[service][key] += value
+
+    def _fault(self, service, key):
+        """Latency, 429 or hang for the next request to service (deterministic per request number)."""
+        faults = self.config.faults(service)
+        with self._lock:
+            self._request_counter[service] += 1
+            number = self._request_counter[service]
+            rejected = False
+            if faults.requests_per_minute > 0:
+                now = time.monotonic()
+                recent = self._recent[service]
+                while recent and now - recent[0] > 60:
+                    recent.popleft()
+                if len(recent) >= faults.requests_per_minute:
+                    rejected = True
+                else:
+                    recent.append(now)
+        rng = self.config.rng(service, number, key)
+        delay = faults.latency.sample(rng)
+        if rejected or rng.random() < faults.error_rate_429:
+            return delay, 429
+        if rng.random() < faults.timeout_rate:
+            return delay, 'hang'
+        return delay, None
+
+    def _embeddings(self, body):
+        inputs = body.get('input', [])
+        if isinstance(inputs, str):
+            inputs = [inputs]
+        dimensions = self.config.embedding_dimensions
+        data = [
+            {'object': 'embedding', 'index': index, 'embedding': embed_text(text, dimensions, self.config.seed)}
+            for index, text in enumerate(inputs)
+        ]
+        tokens = sum(count_tokens(text) for text in inputs)
+        return {
+            'object': 'list',
+            'data': data,
+            'model': body.get('model', 'text-embedding-3-small'),
+            'usage': {'prompt_tokens': tokens, 'total_tokens': tokens},
+        }, len(inputs), tokens, 0
+
+    def _chat(self, body):
+        messages = body.get('messages', [])
+        json_mode = (body.get('response_format') or {}).get('type') == 'json_object'
+        content = chat_content(messages, json_mode)
+        prompt_tokens = sum(count_tokens(m.get('content', '')) for m in messages)
+        completion_tokens = count_tokens(content)
+        return {
+            'id': f"chatcmpl-mock-{count_tokens(content)}",
+            'object': 'chat.completion',
+            'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content}, 'finish_reason': 'stop'}],
+            'usage': {
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': completion_tokens,
+                'total_tokens': prompt_tokens + completion_tokens,
+            },
+        }, 1, prompt_tokens, completion_tokens
+
+    def _indeed(self, body):
+        scraper = body.get('scraper', {})
+        postings = synthetic_postings(
+            int(scraper.get('maxRows', 15) or 15),
+            query=scraper.get('query', ''),
+            location=scraper.get('location', ''),
+            country=scraper.get('country', ''),
+            seed=self.config.seed,
+        )
+        return indeed_response(postings), len(postings), 0, 0
+
+    def _route(self, path):
+        path = path.split('?', 1)[0]
+        if path == INDEED_PATH:
+            return 'indeed', self._indeed, 'x-rapidapi-key'
+        match = _AZURE_PATH.match(path)
+        if match:
+            if match.group('operation') == 'embeddings':
+                return 'embeddings', self._embeddings, 'api-key'
+            return 'chat', self._chat, 'api-key'
+        return None, None, None
+
+    def _control(self, method, path, body):
+        command = path[len(CONTROL_PREFIX):].split('?', 1)[0]
+        if command == 'stats' and method == 'GET':
+            return 200, self.stats()
+        if command == 'config':
+            if method == 'POST':
+                self.config = MockConfig.from_dict(body)
+            return 200, self.config.to_dict()
+        if command == 'reset' and method == 'POST':
+            self.reset_stats()
+            return 200, {'reset': True}
+        return 404, {'error': f"Unknown control endpoint: {command}"}
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def _read_json(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                raw = self.rfile.read(length) if length else b''
+                return json.loads(raw or b'{}')
+
+            def _send(self, status, payload, headers=None):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                if self.path.startswith(CONTROL_PREFIX):
+                    self._send(*server._control('GET', self.path, {}))
+                else:
+                    self._send(404, {'error': 'Not found'})
+
+            def do_POST(self):
+                try:
+                    body = self._read_json()
+                except ValueError:
+                    self._send(400, {'error': 'Invalid JSON body'})
+                    return
+                if self.path.startswith(CONTROL_PREFIX):
+                    self._send(*server._control('POST', self.path, body))
+                    return
+
+                service, handler, key_header = server._route(self.path)
+                if service is None:
+                    self._send(404, {'error': 'Not found'})
+                    return
+                server._count(service, requests=1)
+                if not self.headers.get(key_header):
+                    server._count(service, unauthorized=1)
+                    self._send(401, {'error': {'code': '401', 'message': 'Access denied due to missing key'}})
+                    return
+
+                delay, fault = server._fault(service, json.dumps(body, sort_keys=True)[:256])
+                faults = server.config.faults(service)
+                if fault == 'hang':
+                    server._count(service, hangs=1)
+                    time.sleep(faults.hang_seconds)
+                    self.close_connection = True
+                    return
+                if delay:
+                    time.sleep(delay)
+                if fault == 429:
+                    server._count(service, rate_limited=1)
+                    self._send(429, {'error': {'code': '429', 'message': 'Rate limit is exceeded. Try again later.'}},
+                               headers={'Retry-After': str(faults.retry_after)})
+                    return
+
+                payload, items, prompt_tokens, completion_tokens = handler(body)
+                server._count(service, ok=1, items=items, prompt_tokens=prompt_tokens,
+                              completion_tokens=completion_tokens)
+                self._send(200, payload)
+
+        return Handler
@@ -6,11 +6,14 @@ from .match_analysis import (
     filter_jobs_by_domains,
     filter_jobs_by_salary
 )
+from .recruiter_notes import prefetch_recruiter_notes, get_recruiter_note
 
 __all__ = [
     'extract_salary_from_text',
     'extract_salary_from_text_regex',
     'calculate_salary_band',
     'filter_jobs_by_domains',
-    'filter_jobs_by_salary'
+    'filter_jobs_by_salary',
+    'prefetch_recruiter_notes',
+    'get_recruiter_note'
 ]
@@ -1,23 +1,95 @@
 """Job match analysis functions including salary extraction and filtering"""
+import hashlib
 import json
 import re
+import threading
+from collections import OrderedDict
 import streamlit as st
 import requests
-import numpy as np
-from modules.utils import get_text_generator, api_call_with_retry
+from modules.utils import get_text_generator, api_call_with_retry, estimate_bytes, register_process_cache
+from modules.utils.config import SALARY_CACHE_SIZE
+from modules.utils.metrics import record_cache_lookup
+from modules.utils.tracing import traced, current_span
 
+# Process-wide salary memo keyed by a digest of the text. The same posting is
+# priced by every session that sees it and again on each dashboard render.
+_salary_cache = OrderedDict()
+_salary_lock = threading.Lock()
 
+
+def _salary_key(text):
+    return hashlib.sha1(text.encode('utf-8', 'ignore')).hexdigest()
+
+
+def _get_cached_salary(key):
+    with _salary_lock:
+        salary = _salary_cache.get(key)
+        if salary is not None:
+            _salary_cache.move_to_end(key)
+        return salary
+
+
+def _store_salary(key, salary):
+    if SALARY_CACHE_SIZE <= 0:
+        return
+    with _salary_lock:
+        _salary_cache[key] = salary
+        _salary_cache.move_to_end(key)
+        while len(_salary_cache) > SALARY_CACHE_SIZE:
+            _salary_cache.popitem(last=False)
+
+
+def _salary_nbytes():
+    with _salary_lock:
+        return estimate_bytes(dict(_salary_cache))
+
+
+def _trim_salaries(max_bytes):
+    freed = 0
+    with _salary_lock:
+        size = estimate_bytes(dict(_salary_cache))
+        while _salary_cache and size - freed > max_bytes:
+            key, salary = _salary_cache.popitem(last=False)
+            freed += estimate_bytes(key) + estimate_bytes(salary)
+    return freed
+
+
+register_process_cache('salary', _salary_nbytes, _trim_salaries)
+
+
+@traced('api.chat', operation='extract_salary')
 def extract_salary_from_text(text):
-    """Extract salary information from job description text using LLM"""
+    """Extract salary information from job description text using LLM
+
+    Answers are memoized per text for the whole process; results that fell
+    back to the regex because the API call failed are not, so they are
+    retried next time.
+    """
     if not text:
         return None, None
     
+    key = _salary_key(text)
+    cached = _get_cached_salary(key)
+    if cached is not None:
+        current_span().set(cache_hit=True)
+        record_cache_lookup('salary', hits=1)
+        return cached
+    record_cache_lookup('salary', misses=1)
+    
+    salary, answered = _extract_salary_with_llm(text)
+    if answered:
+        _store_salary(key, salary)
+    return salary
+
+
+def _extract_salary_with_llm(text):
+    """((min, max), whether the model answered) - the regex fallback fills in either way."""
     text_for_extraction = text[:3000] if len(text) > 3000 else text
     
     try:
         text_gen = get_text_generator()
         if text_gen is None:
-            return None, None
+            return (None, None), False
         
         prompt = f"""Extract salary information from this job description text. 
 Look for salary ranges, amounts, and compensation details. Normalize everything to monthly HKD (Hong Kong Dollars).
@@ -59,7 +131,7 @@ Rules:
                 timeout=30
             )
         
-        response = api_call_with_retry(make_request, max_retries=2)
+        response = api_call_with_retry(make_request, max_retries=2, provider='azure_openai', endpoint='chat')
         
         if response and response.status_code == 200:
             result = response.json()
@@ -77,16 +149,17 @@ Rules:
                     min_sal = salary_data.get('min_salary_hkd_monthly')
                     max_sal = salary_data.get('max_salary_hkd_monthly')
                     if min_sal is not None and max_sal is not None:
-                        return int(min_sal), int(max_sal)
+                        return (int(min_sal), int(max_sal)), True
                     elif min_sal is not None:
-                        return int(min_sal), int(min_sal * 1.2)
+                        return (int(min_sal), int(min_sal * 1.2)), True
             except (json.JSONDecodeError, ValueError, TypeError) as e:
                 pass
+            return extract_salary_from_text_regex(text), True
         
-        return extract_salary_from_text_regex(text)
+        return extract_salary_from_text_regex(text), False
         
     except Exception as e:
-        return extract_salary_from_text_regex(text)
+        return extract_salary_from_text_regex(text), False
 
 
 def extract_salary_from_text_regex(text):
@@ -125,9 +198,11 @@ def extract_salary_from_text_regex(text):
     return None, None
 
 
+@traced('analysis.salary_band')
 def calculate_salary_band(matched_jobs):
     """Calculate estimated salary band from matched jobs"""
     salaries = []
+    current_span().set(jobs=len(matched_jobs))
     
     for result in matched_jobs:
         job = result['job']
@@ -146,8 +221,8 @@ def calculate_salary_band(matched_jobs):
     if not salaries:
         return 45000, 55000
     
-    avg_min = int(np.mean([s[0] for s in salaries]))
-    avg_max = int(np.mean([s[1] for s in salaries]))
+    avg_min = int(sum(s[0] for s in salaries) / len(salaries))
+    avg_max = int(sum(s[1] for s in salaries) / len(salaries))
     
     return avg_min, avg_max
 
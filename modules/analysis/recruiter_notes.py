@@ -0,0 +1,179 @@
+"""Recruiter note generation with batching, prefetch and caching"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from modules.utils import get_text_generator, run_in_background, estimate_bytes, register_process_cache
+from modules.utils.config import RECRUITER_NOTES_PREFETCH_COUNT, RECRUITER_NOTES_CACHE_SIZE
+from modules.utils.metrics import record_cache_lookup
+from modules.semantic_search import get_job_hash
+
+# Process-wide note cache keyed by (job hash, profile hash, rounded scores).
+# The key covers everything the prompt depends on, so sessions can share it.
+_notes_cache = OrderedDict()
+_pending_notes = {}
+# Keys whose last generation failed, mapped to when they may be retried, oldest first
+_failed_notes = OrderedDict()
+_notes_lock = threading.Lock()
+
+# How long a click waits for an in-flight batch before generating its own note
+PENDING_NOTE_TIMEOUT = 45
+# After a failed call (API down, rate limited) its notes use the template
+# until this many seconds have passed, instead of calling again every rerun
+FAILED_NOTE_RETRY_AFTER = 60
+
+
+def _profile_hash(user_profile):
+    """Hash the profile fields that recruiter notes are written from."""
+    profile_str = f"{user_profile.get('summary', '')[:500]}_{user_profile.get('experience', '')[:500]}"
+    return hashlib.md5(profile_str.encode()).hexdigest()
+
+
+def recruiter_note_key(job, user_profile, semantic_score, skill_score):
+    return (get_job_hash(job), _profile_hash(user_profile), round(semantic_score, 2), round(skill_score, 2))
+
+
+def _store_note(key, note):
+    if RECRUITER_NOTES_CACHE_SIZE <= 0:
+        return
+    with _notes_lock:
+        _notes_cache[key] = note
+        _notes_cache.move_to_end(key)
+        while len(_notes_cache) > RECRUITER_NOTES_CACHE_SIZE:
+            _notes_cache.popitem(last=False)
+
+
+def _notes_nbytes():
+    with _notes_lock:
+        return estimate_bytes(dict(_notes_cache))
+
+
+def _trim_notes(max_bytes):
+    freed = 0
+    with _notes_lock:
+        size = estimate_bytes(dict(_notes_cache))
+        while _notes_cache and size - freed > max_bytes:
+            key, note = _notes_cache.popitem(last=False)
+            freed += estimate_bytes(key) + estimate_bytes(note)
+    return freed
+
+
+register_process_cache('recruiter_notes', _notes_nbytes, _trim_notes)
+
+
+def _mark_failed(keys):
+    retry_at = time.monotonic() + FAILED_NOTE_RETRY_AFTER
+    with _notes_lock:
+        for key in keys:
+            _failed_notes.pop(key, None)
+            _failed_notes[key] = retry_at
+        while len(_failed_notes) > max(RECRUITER_NOTES_CACHE_SIZE, len(keys)):
+            _failed_notes.popitem(last=False)
+
+
+def _recently_failed(key):
+    """True while key is backing off after a failure (caller holds the lock)."""
+    now = time.monotonic()
+    while _failed_notes and next(iter(_failed_notes.values())) <= now:
+        _failed_notes.popitem(last=False)
+    return key in _failed_notes
+
+
+def _get_cached_note(key):
+    with _notes_lock:
+        note = _notes_cache.get(key)
+        if note is not None:
+            _notes_cache.move_to_end(key)
+        return note
+
+
+def _run_batch(text_gen, keys, matches, user_profile):
+    try:
+        batch_notes = text_gen.generate_recruiter_notes_batch(matches, user_profile)
+    except Exception:
+        batch_notes = {}
+    try:
+        if not batch_notes:
+            # Nothing came back: back off rather than resend the batch on the next rerun
+            _mark_failed(keys)
+        for idx, note in batch_notes.items():
+            _store_note(keys[idx], note)
+    finally:
+        with _notes_lock:
+            for key in keys:
+                _pending_notes.pop(key, None)
+
+
+def prefetch_recruiter_notes(matched_jobs, user_profile, top_n=None):
+    """Generate notes for the top matches in the background with one batched call.
+
+    Safe to call on every rerun: matches that are cached or already being
+    generated are skipped, so a batch is only sent for new results.
+    """
+    top_n = RECRUITER_NOTES_PREFETCH_COUNT if top_n is None else top_n
+    if not matched_jobs or not user_profile or top_n <= 0:
+        return None
+
+    text_gen = get_text_generator()
+    if text_gen is None:
+        return None
+
+    keys = []
+    matches = []
+    with _notes_lock:
+        for result in matched_jobs[:top_n]:
+            job = result['job']
+            semantic_score = result.get('similarity_score', 0.0)
+            skill_score = result.get('skill_match_score', 0.0)
+            key = recruiter_note_key(job, user_profile, semantic_score, skill_score)
+            if key in _notes_cache or key in _pending_notes or key in keys or _recently_failed(key):
+                continue
+            keys.append(key)
+            matches.append((job, semantic_score, skill_score))
+        if not matches:
+            return None
+        future = run_in_background(_run_batch, text_gen, keys, matches, user_profile)
+        for key in keys:
+            _pending_notes[key] = future
+    return future
+
+
+def get_recruiter_note(job, user_profile, semantic_score, skill_score):
+    """Return the recruiter note for a match, waiting on a prefetch if one is running.
+
+    While the match is backing off after a failed call the template note is
+    returned without calling the API.
+    """
+    text_gen = get_text_generator()
+    if text_gen is None:
+        return "AI analysis unavailable. Please configure Azure OpenAI credentials."
+
+    key = recruiter_note_key(job, user_profile, semantic_score, skill_score)
+    note = _get_cached_note(key)
+    if note is not None:
+        record_cache_lookup('recruiter_notes', hits=1)
+        return note
+    record_cache_lookup('recruiter_notes', misses=1)
+
+    with _notes_lock:
+        future = _pending_notes.get(key)
+    if future is not None:
+        try:
+            future.result(timeout=PENDING_NOTE_TIMEOUT)
+        except Exception:
+            pass
+        note = _get_cached_note(key)
+        if note is not None:
+            return note
+
+    with _notes_lock:
+        failed = _recently_failed(key)
+    if failed:
+        return text_gen.fallback_recruiter_note(job, semantic_score)
+
+    note = text_gen.generate_recruiter_note(job, user_profile, semantic_score, skill_score)
+    if note != text_gen.fallback_recruiter_note(job, semantic_score):
+        _store_note(key, note)
+    else:
+        _mark_failed([key])
+    return note
@@ -0,0 +1,14 @@
+"""Job records and the process-wide job store"""
+from .record import JOB_FIELDS, SNIPPET_CHARS, Job, job_hash, make_snippet, job_snippet
+from .store import JobStore, get_job_store
+
+__all__ = [
+    'JOB_FIELDS',
+    'SNIPPET_CHARS',
+    'Job',
+    'job_hash',
+    'make_snippet',
+    'job_snippet',
+    'JobStore',
+    'get_job_store'
+]
@@ -0,0 +1,222 @@
+"""Compact job record shared by every session that sees the same posting"""
+import hashlib
+import re
+import sys
+import zlib
+from functools import lru_cache
+
+# Fields produced by IndeedScraperAPI._parse_job, in display order
+JOB_FIELDS = (
+    'title',
+    'company',
+    'location',
+    'description',
+    'salary',
+    'job_type',
+    'url',
+    'apply_url',
+    'posted_date',
+    'benefits',
+    'skills',
+    'skill_ids',
+    'company_rating',
+    'is_remote',
+    'company_logo',
+)
+
+# Low-cardinality strings repeated across thousands of postings
+_INTERNED_FIELDS = frozenset(('company', 'location', 'job_type'))
+
+# Descriptions are stored zlib-compressed; short ones are not worth it
+SNIPPET_CHARS = 2000
+_COMPRESS_MIN_CHARS = 512
+_COMPRESS_LEVEL = 6
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def job_hash(job):
+    """Stable ID for a job: md5 of title, company and URL (cached on Job records)."""
+    job_id = getattr(job, 'job_id', None)
+    if job_id:
+        return job_id
+    job_str = f"{job.get('title', '')}_{job.get('company', '')}_{job.get('url', '')}"
+    return hashlib.md5(job_str.encode()).hexdigest()
+
+
+def make_snippet(description, limit=SNIPPET_CHARS):
+    """Whitespace-collapsed lead of a description, cut at a word boundary."""
+    text = _WHITESPACE.sub(' ', description or '').strip()
+    if len(text) <= limit:
+        return text
+    cut = text.rfind(' ', 0, limit)
+    return text[:cut if cut > limit // 2 else limit].rstrip() + '…'
+
+
+def job_snippet(job):
+    """Precomputed snippet for a Job, computed on the fly for plain dicts."""
+    snippet = getattr(job, 'snippet', None)
+    if snippet is not None:
+        return snippet
+    return make_snippet(job.get('description', ''))
+
+
+def _deflate(description):
+    if len(description) < _COMPRESS_MIN_CHARS:
+        return description
+    return zlib.compress(description.encode('utf-8'), _COMPRESS_LEVEL)
+
+
+@lru_cache(maxsize=64)
+def _inflate(blob):
+    # bytes cache their hash, so repeated reads of a hot description are cheap
+    return zlib.decompress(blob).decode('utf-8')
+
+
+def _compact_value(key, value):
+    if key in _INTERNED_FIELDS and isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+class Job:
+    """Slotted job record that still reads like the dicts it replaces.
+
+    job['title'], job.get('salary', 'N/A') and 'skills' in job keep working,
+    so UI code is unchanged. Fields that were never set behave like missing
+    dict keys. Keys outside JOB_FIELDS go to a small overflow dict that is
+    only allocated when used.
+
+    The description is held zlib-compressed and only inflated when read;
+    job.snippet keeps a short plain-text lead for embedding and previews.
+    """
+    __slots__ = ('job_id', '_extra', '_description_z', 'snippet') + tuple(
+        key for key in JOB_FIELDS if key != 'description'
+    )
+
+    def __init__(self, job_id=None, **fields):
+        self._extra = None
+        for key, value in fields.items():
+            self[key] = value
+        self.job_id = job_id or job_hash(self)
+
+    @classmethod
+    def from_mapping(cls, data):
+        """Build a Job from a parsed-job dict (a Job is returned unchanged)."""
+        if isinstance(data, Job):
+            return data
+        return cls(**data)
+
+    @property
+    def description(self):
+        try:
+            blob = self._description_z
+        except AttributeError:
+            raise AttributeError('description') from None
+        return blob if isinstance(blob, str) else _inflate(blob)
+
+    @description.setter
+    def description(self, value):
+        value = value if isinstance(value, str) else str(value or '')
+        self._description_z = _deflate(value)
+        self.snippet = make_snippet(value)
+
+    @property
+    def description_nbytes(self):
+        """Bytes held for the description (compressed size when compressed)."""
+        blob = getattr(self, '_description_z', '')
+        return len(blob) if isinstance(blob, bytes) else len(blob.encode('utf-8'))
+
+    @property
+    def nbytes(self):
+        """Approximate bytes owned by this record (interned strings are shared)."""
+        total = sys.getsizeof(self) + self.description_nbytes + sys.getsizeof(getattr(self, 'snippet', ''))
+        for key in JOB_FIELDS:
+            if key == 'description' or key in _INTERNED_FIELDS or not hasattr(self, key):
+                continue
+            value = getattr(self, key)
+            total += sys.getsizeof(value)
+            if isinstance(value, (list, tuple)):
+                total += sum(sys.getsizeof(item) for item in value if isinstance(item, str))
+        if self._extra:
+            total += sys.getsizeof(self._extra)
+        return total
+
+    def _has(self, key):
+        return hasattr(self, '_description_z' if key == 'description' else key)
+
+    def __getitem__(self, key):
+        if key in _FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is not None and key in self._extra:
+            return self._extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in _FIELD_SET:
+            setattr(self, key, _compact_value(key, value))
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __contains__(self, key):
+        if key in _FIELD_SET:
+            return self._has(key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def __eq__(self, other):
+        if isinstance(other, Job):
+            return self.to_dict() == other.to_dict()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Job({self.get('title', '')!r} at {self.get('company', '')!r}, id={self.job_id[:8]})"
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def keys(self):
+        keys = [key for key in JOB_FIELDS if self._has(key)]
+        if self._extra:
+            keys.extend(self._extra)
+        return keys
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def update(self, fields):
+        if isinstance(fields, Job):
+            # Copy stored values as-is so descriptions are not re-compressed
+            for slot in Job.__slots__:
+                if slot not in ('job_id', '_extra') and hasattr(fields, slot):
+                    setattr(self, slot, getattr(fields, slot))
+            if fields._extra:
+                for key, value in fields._extra.items():
+                    self[key] = value
+            return
+        for key, value in fields.items():
+            self[key] = value
+
+    def to_dict(self):
+        """Plain dict copy, e.g. for serialization."""
+        return dict(self.items())
+
+
+_FIELD_SET = frozenset(JOB_FIELDS)
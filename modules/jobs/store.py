@@ -0,0 +1,117 @@
+"""Process-wide job store: one Job instance per posting, keyed by job hash"""
+import threading
+from collections import OrderedDict
+from .record import Job
+
+DEFAULT_MAX_JOBS = 5000
+
+
+class JobStore:
+    """Bounded LRU map of job hash -> Job shared by every session.
+
+    Sessions keep job IDs (or references to the stored instances) instead of
+    their own copies of each posting. Evicting a job only drops it from the
+    index; sessions that still reference it keep it alive, while ID lookups
+    for it miss and callers refetch.
+    """
+    def __init__(self, max_jobs=DEFAULT_MAX_JOBS):
+        self.max_jobs = max_jobs
+        self._jobs = OrderedDict()
+        self._sizes = {}
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._jobs)
+
+    def __contains__(self, job_id):
+        return job_id in self._jobs
+
+    @property
+    def nbytes(self):
+        """Approximate bytes held by stored records."""
+        return self._nbytes
+
+    def _track(self, record):
+        size = record.nbytes
+        self._nbytes += size - self._sizes.get(record.job_id, 0)
+        self._sizes[record.job_id] = size
+
+    def _evict_oldest(self):
+        job_id, _ = self._jobs.popitem(last=False)
+        freed = self._sizes.pop(job_id, 0)
+        self._nbytes -= freed
+        return freed
+
+    def add(self, job):
+        """Store job (a Job or parsed-job dict) and return the shared instance.
+
+        A posting seen again is refreshed in place, so every session keeps
+        pointing at a single copy.
+        """
+        record = Job.from_mapping(job)
+        with self._lock:
+            existing = self._jobs.get(record.job_id)
+            if existing is not None:
+                if existing is not record:
+                    existing.update(record)
+                    self._track(existing)
+                self._jobs.move_to_end(record.job_id)
+                return existing
+            self._jobs[record.job_id] = record
+            self._track(record)
+            while len(self._jobs) > self.max_jobs:
+                self._evict_oldest()
+        return record
+
+    def add_many(self, jobs):
+        return [self.add(job) for job in jobs]
+
+    def get(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is not None:
+                self._jobs.move_to_end(job_id)
+            return job
+
+    def get_many(self, job_ids):
+        """Jobs for job_ids in order, or None if any of them has been evicted."""
+        with self._lock:
+            jobs = []
+            for job_id in job_ids:
+                job = self._jobs.get(job_id)
+                if job is None:
+                    return None
+                self._jobs.move_to_end(job_id)
+                jobs.append(job)
+            return jobs
+
+    def trim_to(self, max_bytes):
+        """Evict least recently used records until nbytes <= max_bytes; returns bytes freed."""
+        freed = 0
+        with self._lock:
+            while self._jobs and self._nbytes > max_bytes:
+                freed += self._evict_oldest()
+        return freed
+
+    def clear(self):
+        with self._lock:
+            self._jobs.clear()
+            self._sizes.clear()
+            self._nbytes = 0
+
+
+_job_store = None
+_job_store_lock = threading.Lock()
+
+
+def get_job_store():
+    """Get the process-wide job store, created on first use."""
+    global _job_store
+    if _job_store is None:
+        # Imported here: modules.utils imports this package at load time
+        from modules.utils.config import JOB_STORE_MAX_JOBS
+        with _job_store_lock:
+            if _job_store is None:
+                _job_store = JobStore(max_jobs=JOB_STORE_MAX_JOBS)
+    return _job_store
@@ -0,0 +1,18 @@
+"""Job matching pipeline module"""
+from .matching import (
+    MatchingPipeline,
+    MatchingRequest,
+    PipelineResult,
+    STAGES,
+    build_search_query,
+    build_profile_query
+)
+
+__all__ = [
+    'MatchingPipeline',
+    'MatchingRequest',
+    'PipelineResult',
+    'STAGES',
+    'build_search_query',
+    'build_profile_query'
+]
@@ -0,0 +1,263 @@
+"""Headless job matching pipeline: fetch → filter → index → embed resume → search → skill match → rank"""
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from modules.analysis import filter_jobs_by_domains, filter_jobs_by_salary
+from modules.semantic_search import SemanticJobSearch, fetch_jobs_with_cache
+from modules.utils import get_token_tracker, run_in_background
+from modules.utils.config import _determine_index_limit
+from modules.utils.metrics import inc_counter, observe, dump_metrics
+from modules.utils.tracing import trace_span
+from modules.utils.profiling import profile_if_enabled
+
+STAGES = ('fetch', 'filter', 'index', 'embed_resume', 'search', 'skill_match', 'rank')
+
+# Progress (0-100) reported when each stage starts
+STAGE_PROGRESS = {
+    'fetch': 10,
+    'filter': 30,
+    'index': 50,
+    'embed_resume': 70,
+    'search': 80,
+    'skill_match': 90,
+    'rank': 99,
+}
+
+# Combined match score weights
+SEMANTIC_WEIGHT = 0.6
+SKILL_WEIGHT = 0.4
+
+
+def build_search_query(job_keywords, target_domains):
+    """Search with job keywords if provided, otherwise with the target domains."""
+    if job_keywords and job_keywords.strip():
+        return job_keywords.strip()
+    if target_domains:
+        return " ".join(target_domains)
+    return "jobs"
+
+
+def build_profile_query(resume_text, user_profile):
+    """Text query used for search when no resume embedding is available."""
+    user_profile = user_profile or {}
+    if resume_text:
+        if user_profile.get('summary'):
+            profile_data = f"{user_profile.get('summary', '')} {user_profile.get('experience', '')} {user_profile.get('skills', '')}"
+            return f"{resume_text} {profile_data}"
+        return resume_text
+    return f"{user_profile.get('summary', '')} {user_profile.get('experience', '')} {user_profile.get('skills', '')} {user_profile.get('education', '')}"
+
+
+@dataclass
+class MatchingRequest:
+    """Search and filter parameters for one pipeline run"""
+    search_query: str
+    location: str = "Hong Kong"
+    country: str = "hk"
+    target_domains: list = field(default_factory=list)
+    salary_expectation: int = 0
+    max_rows: int = 25
+    job_type: str = "fulltime"
+    force_refresh: bool = False
+    desired_matches: int = 15
+
+
+@dataclass
+class PipelineResult:
+    """Outcome of a pipeline run.
+
+    status is one of 'ok', 'no_jobs' (fetch returned nothing),
+    'no_filtered_jobs' (filters removed every job) or 'no_matches'.
+    """
+    status: str = 'ok'
+    matches: list = field(default_factory=list)
+    total_fetched: int = 0
+    filtered_count: int = 0
+    resume_embedding: list = None
+    timings: dict = field(default_factory=dict)
+
+
+class MatchingPipeline:
+    """Runs the matching stages without touching the UI.
+
+    progress_callback(stage, percent, message) is called as stages start and
+    during skill matching. With overlap=True the resume embedding and the
+    skill-vocabulary warm-up run in the background while jobs are fetched,
+    filtered and indexed, and are joined right before the stages that need them.
+    """
+    def __init__(self, scraper, embedding_generator, progress_callback=None, overlap=False,
+                 use_persistent_store=True):
+        self.scraper = scraper
+        self.embedding_gen = embedding_generator
+        self.progress_callback = progress_callback
+        self.overlap = overlap
+        self.search_engine = SemanticJobSearch(embedding_generator, use_persistent_store=use_persistent_store)
+        self.timings = {}
+
+    def _report(self, stage, message, percent=None):
+        if self.progress_callback:
+            self.progress_callback(stage, STAGE_PROGRESS[stage] if percent is None else percent, message)
+
+    @contextmanager
+    def _stage(self, stage, message=None):
+        if message:
+            self._report(stage, message)
+        start = time.perf_counter()
+        try:
+            with trace_span(f"pipeline.{stage}") as span, profile_if_enabled(stage):
+                yield span
+        finally:
+            elapsed = time.perf_counter() - start
+            self.timings[stage] = self.timings.get(stage, 0.0) + elapsed
+            observe('careerlens_stage_seconds', elapsed, stage=stage)
+
+    def _embed_resume(self, resume_text):
+        start = time.perf_counter()
+        try:
+            with trace_span('pipeline.embed_resume', overlapped=self.overlap):
+                embedding, tokens_used = self.embedding_gen.get_embedding(resume_text)
+                token_tracker = get_token_tracker()
+                if token_tracker:
+                    token_tracker.add_embedding_tokens(tokens_used)
+                return embedding or None
+        finally:
+            self.timings['embed_resume'] = time.perf_counter() - start
+            observe('careerlens_stage_seconds', self.timings['embed_resume'], stage='embed_resume')
+
+    def _warm_up_skills(self, user_skills):
+        start = time.perf_counter()
+        try:
+            with trace_span('pipeline.skill_warm_up'):
+                self.search_engine.warm_up_skill_embeddings(user_skills)
+        finally:
+            self.timings['skill_warm_up'] = time.perf_counter() - start
+            observe('careerlens_stage_seconds', self.timings['skill_warm_up'], stage='skill_warm_up')
+
+    def run(self, request, resume_text=None, user_profile=None, resume_embedding=None):
+        """Run every stage for request and return a PipelineResult.
+
+        The run is traced as one pipeline.run span and recorded in the
+        metrics registry (outcome, duration, tokens per successful analysis).
+        """
+        token_tracker = get_token_tracker()
+        tokens_before = token_tracker.total_tokens if token_tracker else 0
+        start = time.perf_counter()
+        with trace_span('pipeline.run', query=request.search_query, location=request.location,
+                        overlap=self.overlap) as span:
+            result = self._run(request, resume_text, user_profile, resume_embedding)
+            span.set(status=result.status, fetched=result.total_fetched, filtered=result.filtered_count,
+                     matches=len(result.matches))
+        inc_counter('careerlens_analyses_total', status=result.status)
+        observe('careerlens_analysis_seconds', time.perf_counter() - start)
+        if result.status == 'ok' and token_tracker:
+            observe('careerlens_analysis_tokens', token_tracker.total_tokens - tokens_before)
+        dump_metrics()
+        return result
+
+    def _finish_embedding(self, result, embedding_future):
+        """Wait for the overlapped resume embedding and record it on result."""
+        try:
+            result.resume_embedding = embedding_future.result()
+        except Exception:
+            result.resume_embedding = None
+        return result.resume_embedding
+
+    def _run(self, request, resume_text, user_profile, resume_embedding):
+        self.timings = {}
+        result = PipelineResult(timings=self.timings)
+        user_profile = user_profile or {}
+
+        embedding_future = None
+        warm_up_future = None
+        if self.overlap:
+            # Independent network waits: start them before the (slow) job fetch
+            if not resume_embedding and resume_text:
+                embedding_future = run_in_background(self._embed_resume, resume_text)
+            if user_profile.get('skills'):
+                warm_up_future = run_in_background(self._warm_up_skills, user_profile.get('skills'))
+
+        with self._stage('fetch', f"📡 Fetching jobs from Indeed ({request.location}, {request.country.upper()})..."):
+            jobs = fetch_jobs_with_cache(
+                self.scraper,
+                request.search_query,
+                location=request.location,
+                max_rows=request.max_rows,
+                job_type=request.job_type,
+                country=request.country,
+                force_refresh=request.force_refresh
+            )
+
+        if not jobs:
+            result.status = 'no_jobs'
+            if embedding_future is not None:
+                # Already paid for: hand it back so a retry does not embed again
+                self._finish_embedding(result, embedding_future)
+            return result
+        result.total_fetched = len(jobs)
+
+        with self._stage('filter', f"✅ Found {len(jobs)} jobs, applying filters..."):
+            if request.target_domains:
+                jobs = filter_jobs_by_domains(jobs, request.target_domains)
+            if request.salary_expectation > 0:
+                jobs = filter_jobs_by_salary(jobs, request.salary_expectation)
+
+        result.filtered_count = len(jobs)
+        if not jobs:
+            result.status = 'no_filtered_jobs'
+            if embedding_future is not None:
+                self._finish_embedding(result, embedding_future)
+            return result
+
+        desired_matches = min(request.desired_matches, len(jobs))
+        jobs_to_index_limit = _determine_index_limit(len(jobs), desired_matches)
+        top_match_count = min(desired_matches, jobs_to_index_limit)
+
+        with self._stage('index', f"🔗 Creating job embeddings ({jobs_to_index_limit} jobs)...") as span:
+            span.set(limit=jobs_to_index_limit)
+            self.search_engine.index_jobs(jobs, max_jobs_to_index=jobs_to_index_limit)
+
+        if embedding_future is not None:
+            self._report('embed_resume', "🔗 Finishing resume embedding...")
+            resume_embedding = self._finish_embedding(result, embedding_future)
+        elif not resume_embedding and resume_text:
+            self._report('embed_resume', "🔗 Creating resume embedding...")
+            resume_embedding = self._embed_resume(resume_text)
+            result.resume_embedding = resume_embedding
+
+        resume_query = None if resume_embedding else build_profile_query(resume_text, user_profile)
+
+        with self._stage('search', "🎯 Finding best matches...") as span:
+            span.set(top_k=top_match_count, query_embedding=resume_embedding is not None)
+            matches = self.search_engine.search(query=resume_query, top_k=top_match_count, resume_embedding=resume_embedding)
+
+        if not matches:
+            result.status = 'no_matches'
+            return result
+
+        if warm_up_future is not None:
+            try:
+                warm_up_future.result()
+            except Exception:
+                pass  # Skill matching embeds the user's skills itself
+
+        with self._stage('skill_match', "📈 Calculating skill matches..."):
+            skill_matches = self.search_engine.calculate_skill_matches(
+                user_profile.get('skills', ''),
+                [match['job'].get('skills', []) for match in matches]
+            )
+            total_results = len(matches)
+            for i, (match, (skill_score, missing_skills)) in enumerate(zip(matches, skill_matches)):
+                match['skill_match_score'] = skill_score
+                match['missing_skills'] = missing_skills
+
+                semantic_score = match.get('similarity_score', 0.0)
+                match['combined_match_score'] = (semantic_score * SEMANTIC_WEIGHT) + (skill_score * SKILL_WEIGHT)
+
+                self._report('skill_match', f"📈 Analyzing job {i + 1}/{total_results}...",
+                             percent=90 + int((i + 1) / total_results * 9))
+
+        with self._stage('rank'):
+            matches.sort(key=lambda x: x.get('combined_match_score', 0.0), reverse=True)
+
+        result.matches = matches
+        return result
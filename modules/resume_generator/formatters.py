@@ -7,6 +7,8 @@ from docx.enum.text import WD_ALIGN_PARAGRAPH
 from docx.enum.table import WD_TABLE_ALIGNMENT
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
+from modules.utils.metrics import inc_counter, timed
+from modules.utils.tracing import traced
 
 
 def set_cell_shading(cell, color):
@@ -34,6 +36,8 @@ def add_horizontal_line(doc, color="2B5797"):
     pPr.append(pBdr)
 
 
+@traced('render.docx')
+@timed('careerlens_render_seconds', format='docx')
 def generate_docx_from_json(resume_data, filename="resume.docx"):
     """Generate a modern professional .docx file from structured resume JSON"""
     try:
@@ -237,6 +241,7 @@ def generate_docx_from_json(resume_data, filename="resume.docx"):
         doc_io = BytesIO()
         doc.save(doc_io)
         doc_io.seek(0)
+        inc_counter('careerlens_documents_rendered_total', format='docx')
         return doc_io
         
     except Exception as e:
@@ -244,6 +249,8 @@ def generate_docx_from_json(resume_data, filename="resume.docx"):
         return None
 
 
+@traced('render.pdf')
+@timed('careerlens_render_seconds', format='pdf')
 def generate_pdf_from_json(resume_data, filename="resume.pdf"):
     """Generate a modern professional PDF file from structured resume JSON"""
     try:
@@ -472,6 +479,7 @@ def generate_pdf_from_json(resume_data, filename="resume.pdf"):
         # Build PDF
         doc.build(elements)
         pdf_io.seek(0)
+        inc_counter('careerlens_documents_rendered_total', format='pdf')
         return pdf_io
         
     except Exception as e:
@@ -1,9 +1,17 @@
 """Resume upload and profile extraction module"""
 from .file_extraction import extract_text_from_resume
-from .profile_extraction import extract_profile_from_resume, extract_relevant_resume_sections
+from .profile_extraction import (
+    extract_profile_from_resume,
+    extract_profile_with_embedding,
+    extract_relevant_resume_sections
+)
+from .sections import iter_resume_sections, SECTION_NAMES
 
 __all__ = [
     'extract_text_from_resume',
     'extract_profile_from_resume',
-    'extract_relevant_resume_sections'
+    'extract_profile_with_embedding',
+    'extract_relevant_resume_sections',
+    'iter_resume_sections',
+    'SECTION_NAMES'
 ]
@@ -1,24 +1,175 @@
 """File extraction functions for resume upload"""
+import hashlib
+import io
+import multiprocessing
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 import streamlit as st
-import PyPDF2
-from docx import Document
+from modules.utils.config import PDF_EXTRACTION_WORKERS, PDF_PARALLEL_MIN_PAGES, PDF_PAGE_CACHE_SIZE
+from modules.utils.tracing import traced, current_span
 
+# Process-wide page text cache keyed by page content digest.
+# Re-uploads of the same CV (or CVs sharing pages) skip text extraction entirely.
+_page_text_cache = OrderedDict()
+_page_text_cache_lock = threading.Lock()
 
+# Worker pool is created lazily on the first large PDF and reused afterwards
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+
+
+def _extract_page_range(pdf_bytes, page_indices):
+    """Extract text for a range of pages (runs inside a worker process)."""
+    import PyPDF2
+    reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+    texts = []
+    for index in page_indices:
+        try:
+            texts.append(reader.pages[index].extract_text() or "")
+        except Exception:
+            texts.append("")
+    return texts
+
+
+def _get_pdf_pool():
+    """Get the shared PDF extraction worker pool, or None if it cannot be started."""
+    global _pdf_pool
+    if PDF_EXTRACTION_WORKERS <= 1:
+        return None
+    with _pdf_pool_lock:
+        if _pdf_pool is None:
+            try:
+                # forkserver/spawn avoid forking the multi-threaded Streamlit server
+                methods = multiprocessing.get_all_start_methods()
+                context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+                _pdf_pool = ProcessPoolExecutor(max_workers=PDF_EXTRACTION_WORKERS, mp_context=context)
+            except Exception:
+                _pdf_pool = None
+        return _pdf_pool
+
+
+def _reset_pdf_pool():
+    """Drop a broken worker pool so the next PDF starts a fresh one."""
+    global _pdf_pool
+    with _pdf_pool_lock:
+        if _pdf_pool is not None:
+            _pdf_pool.shutdown(wait=False, cancel_futures=True)
+        _pdf_pool = None
+
+
+def _page_digest(page):
+    """Digest a page's content stream and font mappings, or None if unreadable."""
+    try:
+        digest = hashlib.sha1()
+        contents = page.get_contents()
+        if contents is None:
+            return None
+        digest.update(contents.get_data())
+        resources = page.get('/Resources')
+        fonts = resources.get_object().get('/Font') if resources else None
+        if fonts:
+            fonts = fonts.get_object()
+            for name in sorted(fonts.keys()):
+                font = fonts[name].get_object()
+                digest.update(f"{name}:{font.get('/BaseFont', '')}".encode())
+                to_unicode = font.get('/ToUnicode')
+                if to_unicode is not None:
+                    digest.update(to_unicode.get_object().get_data())
+        return digest.hexdigest()
+    except Exception:
+        return None
+
+
+def _get_cached_page_text(digest):
+    if digest is None:
+        return None
+    with _page_text_cache_lock:
+        text = _page_text_cache.get(digest)
+        if text is not None:
+            _page_text_cache.move_to_end(digest)
+        return text
+
+
+def _store_page_text(digest, text):
+    if digest is None or PDF_PAGE_CACHE_SIZE <= 0:
+        return
+    with _page_text_cache_lock:
+        _page_text_cache[digest] = text
+        _page_text_cache.move_to_end(digest)
+        while len(_page_text_cache) > PDF_PAGE_CACHE_SIZE:
+            _page_text_cache.popitem(last=False)
+
+
+def _chunk_pages(page_indices, chunk_count):
+    """Split page indices into contiguous chunks so early pages finish first."""
+    chunk_size = max(1, -(-len(page_indices) // chunk_count))
+    return [page_indices[i:i + chunk_size] for i in range(0, len(page_indices), chunk_size)]
+
+
+def iter_pdf_page_texts(pdf_bytes):
+    """Yield the text of each PDF page in order, as soon as that page is available.
+
+    Cached pages are yielded immediately. Uncached pages of large PDFs are
+    extracted in parallel worker processes; small PDFs are extracted in-process
+    since starting workers would cost more than it saves.
+    """
+    import PyPDF2
+    reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+    pages = reader.pages
+    digests = [_page_digest(page) for page in pages]
+    cached = [_get_cached_page_text(d) for d in digests]
+    missing = [i for i, text in enumerate(cached) if text is None]
+
+    pool = _get_pdf_pool() if len(missing) >= PDF_PARALLEL_MIN_PAGES else None
+    current_span().set(pages=len(pages), cached_pages=len(pages) - len(missing), parallel=pool is not None)
+    pending = {}
+    if pool is not None:
+        try:
+            for chunk in _chunk_pages(missing, PDF_EXTRACTION_WORKERS * 2):
+                future = pool.submit(_extract_page_range, pdf_bytes, chunk)
+                for position, index in enumerate(chunk):
+                    pending[index] = (future, position)
+        except Exception:
+            _reset_pdf_pool()
+            pending = {}
+
+    for index, page in enumerate(pages):
+        text = cached[index]
+        if text is None:
+            if index in pending:
+                future, position = pending[index]
+                try:
+                    text = future.result()[position]
+                    current_span().add('worker_pages')
+                except Exception:
+                    # Worker crashed - finish the remaining pages in-process
+                    _reset_pdf_pool()
+                    pending = {}
+            if text is None:
+                try:
+                    text = page.extract_text() or ""
+                except Exception:
+                    text = ""
+            _store_page_text(digests[index], text)
+        yield text
+
+
+@traced('resume.extract_text')
 def extract_text_from_resume(uploaded_file):
     """Extract text from uploaded resume file (PDF, DOCX, or TXT)"""
     try:
         file_type = uploaded_file.name.split('.')[-1].lower()
+        current_span().set(file_type=file_type)
         
         if file_type == 'pdf':
             uploaded_file.seek(0)
-            pdf_reader = PyPDF2.PdfReader(uploaded_file)
-            text = ""
-            for page in pdf_reader.pages:
-                text += page.extract_text() + "\n"
-            return text
+            page_texts = [text + "\n" for text in iter_pdf_page_texts(uploaded_file.read())]
+            return "".join(page_texts)
         
         elif file_type == 'docx':
             uploaded_file.seek(0)
+            from docx import Document
             doc = Document(uploaded_file)
             
             text_parts = []
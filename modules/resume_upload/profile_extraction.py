@@ -3,8 +3,11 @@ import json
 import re
 import streamlit as st
 import requests
-from modules.utils import get_text_generator, api_call_with_retry, _websocket_keepalive
+from modules.utils import get_text_generator, api_call_with_retry, _websocket_keepalive, run_in_background
+from modules.utils.tracing import traced
 from modules.utils.config import ENABLE_PROFILE_PASS2
+from modules.semantic_search.embeddings import generate_and_store_resume_embedding
+from .sections import iter_resume_sections, extract_dated_lines
 
 
 def extract_relevant_resume_sections(resume_text):
@@ -12,78 +15,18 @@ def extract_relevant_resume_sections(resume_text):
     if not resume_text:
         return ""
     
-    experience_keywords = [
-        r'experience', r'work experience', r'employment', r'employment history',
-        r'professional experience', r'work history', r'career history', r'positions held'
+    relevant_sections = [
+        f"{heading}\n{body}\n" if body else f"{heading}\n"
+        for name, heading, body in iter_resume_sections(resume_text)
+        if name in ('experience', 'education')
     ]
-    education_keywords = [
-        r'education', r'academic background', r'academic qualifications',
-        r'educational background', r'qualifications', r'degrees'
-    ]
-    
-    lines = resume_text.split('\n')
-    relevant_sections = []
-    current_section = None
-    in_experience = False
-    in_education = False
-    
-    for i, line in enumerate(lines):
-        line_stripped = line.strip()
-        if not line_stripped:
-            continue
-        
-        line_lower = line_stripped.lower()
-        
-        if any(re.search(rf'\b{kw}\b', line_lower) for kw in experience_keywords):
-            if not in_experience:
-                in_experience = True
-                in_education = False
-                if current_section:
-                    relevant_sections.append(current_section)
-                current_section = line + '\n'
-            continue
-        
-        if any(re.search(rf'\b{kw}\b', line_lower) for kw in education_keywords):
-            if not in_education:
-                in_education = True
-                if current_section:
-                    relevant_sections.append(current_section)
-                current_section = line + '\n'
-            continue
-        
-        major_sections = [r'summary', r'objective', r'skills', r'certifications', 
-                         r'awards', r'publications', r'projects', r'contact', r'personal']
-        if any(re.search(rf'\b{section}\b', line_lower) for section in major_sections):
-            if in_experience or in_education:
-                if current_section:
-                    relevant_sections.append(current_section)
-                current_section = None
-                in_experience = False
-                in_education = False
-            continue
-        
-        if in_experience or in_education:
-            if current_section:
-                current_section += line + '\n'
-    
-    if current_section and (in_experience or in_education):
-        relevant_sections.append(current_section)
     
     result = '\n'.join(relevant_sections)
     
     if not result or len(result) < 100:
-        date_pattern = r'\b(19|20)\d{2}\b|\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}'
-        result_lines = []
-        for line in lines:
-            if re.search(date_pattern, line, re.IGNORECASE):
-                result_lines.append(line)
-            elif result_lines:
-                if len([l for l in result_lines[-3:] if l.strip()]) < 3:
-                    result_lines.append(line)
-                else:
-                    break
-        if result_lines:
-            result = '\n'.join(result_lines[:50])
+        dated_lines = extract_dated_lines(resume_text)
+        if dated_lines:
+            result = dated_lines
     
     if result:
         return result[:2000] if len(result) > 2000 else result
@@ -91,6 +34,83 @@ def extract_relevant_resume_sections(resume_text):
     return ""
 
 
+# Fields re-checked by the verification pass; everything else comes from pass 1
+PASS2_FIELDS = ('experience', 'education')
+
+
+def _verify_experience_and_education(text_gen, resume_text):
+    """Pass 2: re-extract experience and education from their resume sections.
+    
+    Returns a dict with the verified fields, or None if the call failed.
+    """
+    relevant_resume_sections = extract_relevant_resume_sections(resume_text)
+    
+    if relevant_resume_sections:
+        resume_context = f"""RELEVANT RESUME SECTIONS (Experience and Education only):
+{relevant_resume_sections}"""
+    else:
+        resume_context = f"""RELEVANT RESUME SECTIONS (limited):
+{resume_text[:1500]}"""
+    
+    prompt_pass2 = f"""You are a resume quality checker. Extract the work experience and education from the resume sections below, verifying accuracy, especially for dates and company names.
+
+{resume_context}
+
+Pay special attention to:
+1. **Dates** - Verify all employment dates and education dates are accurate
+2. **Company Names** - Verify all company/organization names are spelled correctly
+3. **Job Titles** - Verify job titles are accurate
+4. **Education Institutions** - Verify institution names are correct
+
+Return ONLY valid JSON with this structure:
+{{
+    "experience": "Work experience in chronological order with job titles, companies, dates, and key achievements (formatted as bullet points)",
+    "education": "Education details including degrees, institutions, and graduation dates"
+}}
+
+If a section is not found, use "N/A". Return ONLY valid JSON, no additional text or markdown."""
+    
+    payload_pass2 = {
+        "messages": [
+            {"role": "system", "content": "You are a resume quality checker. Verify and correct extracted data, especially dates and company names. Return only valid JSON."},
+            {"role": "user", "content": prompt_pass2}
+        ],
+        "max_tokens": 1200,
+        "temperature": 0.1,
+        "response_format": {"type": "json_object"}
+    }
+    
+    _websocket_keepalive("Verifying profile data...")
+    
+    def make_request_pass2():
+        return requests.post(
+            text_gen.url,
+            headers=text_gen.headers,
+            json=payload_pass2,
+            timeout=45
+        )
+    
+    try:
+        response_pass2 = api_call_with_retry(make_request_pass2, max_retries=3, provider='azure_openai', endpoint='chat')
+        if not response_pass2 or response_pass2.status_code != 200:
+            return None
+        
+        result_pass2 = response_pass2.json()
+        content_pass2 = result_pass2['choices'][0]['message']['content']
+        
+        if text_gen.token_tracker and 'usage' in result_pass2:
+            usage = result_pass2['usage']
+            prompt_tokens = usage.get('prompt_tokens', 0)
+            completion_tokens = usage.get('completion_tokens', 0)
+            text_gen.token_tracker.add_completion_tokens(prompt_tokens, completion_tokens)
+        
+        verified = json.loads(content_pass2)
+        return verified if isinstance(verified, dict) else None
+    except Exception:
+        return None
+
+
+@traced('api.chat', operation='extract_profile')
 def extract_profile_from_resume(resume_text):
     """Use Azure OpenAI to extract structured profile information from resume text with two-pass self-correction"""
     try:
@@ -100,6 +120,12 @@ def extract_profile_from_resume(resume_text):
             st.error("⚠️ Azure OpenAI is not configured. Please configure AZURE_OPENAI_API_KEY and AZURE_OPENAI_ENDPOINT in your Streamlit secrets.")
             return None
         
+        # SECOND PASS runs speculatively alongside pass 1: it only re-extracts the
+        # fields it verifies, so it does not need to wait for pass 1's output
+        pass2_future = None
+        if ENABLE_PROFILE_PASS2:
+            pass2_future = run_in_background(_verify_experience_and_education, text_gen, resume_text)
+        
         # FIRST PASS: Initial extraction
         prompt_pass1 = f"""You are an expert at parsing resumes. Extract structured information from the following resume text.
 
@@ -148,7 +174,7 @@ Important:
                 timeout=45
             )
         
-        response_pass1 = api_call_with_retry(make_request_pass1, max_retries=3)
+        response_pass1 = api_call_with_retry(make_request_pass1, max_retries=3, provider='azure_openai', endpoint='chat')
         
         if not response_pass1 or response_pass1.status_code != 200:
             if response_pass1 and response_pass1.status_code == 429:
@@ -178,93 +204,42 @@ Important:
                 st.error("Could not parse extracted profile data from first pass. Please try again.")
                 return None
         
-        # SECOND PASS: Self-correction (optional)
-        if not ENABLE_PROFILE_PASS2:
+        if pass2_future is None:
             return profile_data_pass1
         
-        relevant_resume_sections = extract_relevant_resume_sections(resume_text)
-        
-        if relevant_resume_sections:
-            resume_context = f"""RELEVANT RESUME SECTIONS (Experience and Education only):
-{relevant_resume_sections}"""
-        else:
-            resume_context = f"""RELEVANT RESUME SECTIONS (limited):
-{resume_text[:1500]}"""
-        
-        prompt_pass2 = f"""You are a resume quality checker. Review the extracted profile data against the relevant resume sections and verify accuracy, especially for dates and company names.
-
-{resume_context}
-
-EXTRACTED PROFILE DATA (from first pass):
-{json.dumps(profile_data_pass1, indent=2)}
-
-Please review and correct the extracted data, paying special attention to:
-1. **Dates** - Verify all employment dates, education dates, and certification dates are accurate
-2. **Company Names** - Verify all company/organization names are spelled correctly
-3. **Job Titles** - Verify job titles are accurate
-4. **Education Institutions** - Verify institution names are correct
-
-Return the corrected profile data in the same JSON format. If everything is correct, return the data as-is. If corrections are needed, return the corrected version.
-
-Return ONLY valid JSON with this structure:
-{{
-    "name": "Full name",
-    "email": "Email address",
-    "phone": "Phone number",
-    "location": "City, State/Country",
-    "linkedin": "LinkedIn URL if mentioned",
-    "portfolio": "Portfolio/website URL if mentioned",
-    "summary": "Professional summary or objective (2-3 sentences)",
-    "experience": "Work experience in chronological order with job titles, companies, dates, and key achievements (formatted as bullet points)",
-    "education": "Education details including degrees, institutions, and graduation dates",
-    "skills": "Comma-separated list of technical and soft skills",
-    "certifications": "Professional certifications, awards, publications, or other achievements"
-}}
-
-Return ONLY valid JSON, no additional text or markdown."""
-        
-        payload_pass2 = {
-            "messages": [
-                {"role": "system", "content": "You are a resume quality checker. Verify and correct extracted data, especially dates and company names. Return only valid JSON."},
-                {"role": "user", "content": prompt_pass2}
-            ],
-            "max_tokens": 2000,
-            "temperature": 0.1,
-            "response_format": {"type": "json_object"}
-        }
-        
-        _websocket_keepalive("Verifying profile data...")
-        
-        def make_request_pass2():
-            return requests.post(
-                text_gen.url,
-                headers=text_gen.headers,
-                json=payload_pass2,
-                timeout=45
-            )
-        
-        response_pass2 = api_call_with_retry(make_request_pass2, max_retries=3)
-        
-        if response_pass2 and response_pass2.status_code == 200:
-            result_pass2 = response_pass2.json()
-            content_pass2 = result_pass2['choices'][0]['message']['content']
-            
-            if text_gen.token_tracker and 'usage' in result_pass2:
-                usage = result_pass2['usage']
-                prompt_tokens = usage.get('prompt_tokens', 0)
-                completion_tokens = usage.get('completion_tokens', 0)
-                text_gen.token_tracker.add_completion_tokens(prompt_tokens, completion_tokens)
-            
-            try:
-                profile_data_corrected = json.loads(content_pass2)
-                return profile_data_corrected
-            except json.JSONDecodeError:
-                st.warning("⚠️ Self-correction pass failed, using initial extraction. Some details may need manual verification.")
-                return profile_data_pass1
-        else:
+        # SECOND PASS: merge the field-scoped verification that ran alongside pass 1
+        try:
+            verified_fields = pass2_future.result()
+        except Exception:
+            verified_fields = None
+        if not verified_fields:
             st.warning("⚠️ Self-correction pass failed, using initial extraction. Some details may need manual verification.")
             return profile_data_pass1
+        
+        profile_data_corrected = dict(profile_data_pass1)
+        for field in PASS2_FIELDS:
+            value = verified_fields.get(field)
+            if isinstance(value, str) and value.strip() and value.strip() != "N/A":
+                profile_data_corrected[field] = value
+        return profile_data_corrected
             
     except Exception as e:
         st.error(f"Error extracting profile: {e}")
         return None
+
+
+@traced('resume.extract_profile')
+def extract_profile_with_embedding(resume_text):
+    """Extract the profile and create the resume search embedding concurrently.
+    
+    The embedding is built from the resume text alone, so it no longer has to
+    wait for profile extraction; upload-to-ready latency becomes the slowest
+    of the calls instead of their sum. Returns (profile_data, resume_embedding).
+    """
+    embedding_future = run_in_background(generate_and_store_resume_embedding, resume_text)
+    profile_data = extract_profile_from_resume(resume_text)
+    try:
+        resume_embedding = embedding_future.result()
+    except Exception:
+        resume_embedding = None
+    return profile_data, resume_embedding
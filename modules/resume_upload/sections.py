@@ -0,0 +1,87 @@
+"""Resume section segmentation for profile extraction"""
+import re
+from functools import lru_cache
+
+# One precompiled alternation per section class. Order matters: a heading is
+# assigned to the first class that matches it.
+SECTION_PATTERNS = {
+    'experience': re.compile(
+        r'\b(?:experience|work experience|employment|employment history|professional experience'
+        r'|work history|career history|positions held)\b'
+    ),
+    'education': re.compile(
+        r'\b(?:education|academic background|academic qualifications|educational background'
+        r'|qualifications|degrees)\b'
+    ),
+    'summary': re.compile(r'\b(?:summary|objective|profile|about me)\b'),
+    'skills': re.compile(r'\b(?:skills|technical skills|core competencies|competencies|expertise)\b'),
+    'certifications': re.compile(r'\b(?:certifications|certificates|licenses)\b'),
+    'awards': re.compile(r'\b(?:awards|honors|honours|achievements)\b'),
+    'publications': re.compile(r'\bpublications\b'),
+    'projects': re.compile(r'\bprojects\b'),
+    'contact': re.compile(r'\b(?:contact|personal)\b'),
+}
+
+SECTION_NAMES = tuple(SECTION_PATTERNS)
+
+# Text before the first recognised heading (usually name and contact details)
+PREAMBLE = 'preamble'
+
+# Headings are short lines; longer lines that mention "experience" etc. are body text
+MAX_HEADING_WORDS = 6
+
+_DATE_PATTERN = re.compile(
+    r'\b(19|20)\d{2}\b|\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}',
+    re.IGNORECASE
+)
+
+
+def _classify_heading(line_lower):
+    """Return the section class for a heading line, or None for body text."""
+    if len(line_lower.split()) > MAX_HEADING_WORDS:
+        return None
+    for name, pattern in SECTION_PATTERNS.items():
+        if pattern.search(line_lower):
+            return name
+    return None
+
+
+@lru_cache(maxsize=32)
+def _segment(resume_text):
+    blocks = []
+    name, heading, body = PREAMBLE, '', []
+    for line in resume_text.split('\n'):
+        line_stripped = line.strip()
+        if not line_stripped:
+            continue
+        section = _classify_heading(line_stripped.lower())
+        if section is None:
+            body.append(line)
+            continue
+        if heading or body:
+            blocks.append((name, heading, '\n'.join(body)))
+        name, heading, body = section, line, []
+    if heading or body:
+        blocks.append((name, heading, '\n'.join(body)))
+    return tuple(blocks)
+
+
+def iter_resume_sections(resume_text):
+    """Yield (section_name, heading_line, body) for each section in document order."""
+    if not resume_text:
+        return iter(())
+    return iter(_segment(resume_text))
+
+
+def extract_dated_lines(resume_text, max_lines=50):
+    """Fallback for resumes without recognisable headings: lines around dates."""
+    result_lines = []
+    for line in resume_text.split('\n'):
+        if _DATE_PATTERN.search(line):
+            result_lines.append(line)
+        elif result_lines:
+            if len([l for l in result_lines[-3:] if l.strip()]) < 3:
+                result_lines.append(line)
+            else:
+                break
+    return '\n'.join(result_lines[:max_lines])
@@ -1,11 +1,21 @@
 """Semantic search module for job matching"""
-from .job_search import SemanticJobSearch
+from .job_search import SemanticJobSearch, get_job_hash
 from .cache import fetch_jobs_with_cache, is_cache_valid
-from .embeddings import generate_and_store_resume_embedding
+from .embeddings import generate_and_store_resume_embedding, get_job_embedding
+from .skill_store import SkillEmbeddingStore, get_skill_embedding_store
+from .corpus import CorpusSnapshot, CorpusView, JobCorpus, get_job_corpus
 
 __all__ = [
     'SemanticJobSearch',
     'fetch_jobs_with_cache',
     'is_cache_valid',
-    'generate_and_store_resume_embedding'
+    'generate_and_store_resume_embedding',
+    'get_job_embedding',
+    'get_job_hash',
+    'SkillEmbeddingStore',
+    'get_skill_embedding_store',
+    'CorpusSnapshot',
+    'CorpusView',
+    'JobCorpus',
+    'get_job_corpus'
 ]
@@ -2,6 +2,9 @@
 import streamlit as st
 from datetime import datetime, timedelta
 from modules.utils.helpers import _websocket_keepalive
+from modules.utils.tracing import current_span
+from modules.utils.metrics import record_cache_lookup
+from modules.jobs import get_job_store
 
 
 def is_cache_valid(cache_entry):
@@ -64,17 +67,34 @@ def _get_cached_jobs(query, location, max_rows, job_type, country):
     if not is_cache_valid(cache_entry):
         st.session_state.jobs_cache.pop(cache_key, None)
         return None
+    if _resolve_cached_jobs(cache_entry) is None:
+        # Some postings were evicted from the shared job store - refetch
+        st.session_state.jobs_cache.pop(cache_key, None)
+        return None
+    cache_entry['last_used'] = datetime.now().isoformat()
     return cache_entry
 
 
+def _resolve_cached_jobs(cache_entry):
+    """Jobs for a cache entry from the shared job store (None if any were evicted)."""
+    if 'job_ids' in cache_entry:
+        return get_job_store().get_many(cache_entry['job_ids'])
+    return cache_entry.get('jobs', [])
+
+
 def _store_jobs_in_cache(query, location, max_rows, job_type, country, jobs, cache_ttl_hours=168):
-    """Persist job results in cache with TTL metadata."""
+    """Persist job results in cache with TTL metadata.
+    
+    Only job IDs are kept in the session; the postings themselves live in the
+    process-wide job store.
+    """
     _ensure_jobs_cache_structure()
     cache_key = _build_jobs_cache_key(query, location, max_rows, job_type, country)
     now = datetime.now()
     expires_at = now + timedelta(hours=cache_ttl_hours)
+    jobs = get_job_store().add_many(jobs)
     st.session_state.jobs_cache[cache_key] = {
-        'jobs': jobs,
+        'job_ids': [job.job_id for job in jobs],
         'count': len(jobs),
         'timestamp': now.isoformat(),
         'query': query,
@@ -129,13 +149,18 @@ def fetch_jobs_with_cache(scraper, query, location="Hong Kong", max_rows=25, job
             remaining_text = f" (~{expires_in_minutes} min left)" if expires_in_minutes is not None else ""
             st.caption(f"♻️ Using cached job results from {human_ts}{remaining_text}")
             _websocket_keepalive()
-            return cache_entry.get('jobs', [])
+            current_span().set(cache_hit=True)
+            record_cache_lookup('jobs', hits=1)
+            return _resolve_cached_jobs(cache_entry)
     
+    current_span().set(cache_hit=False)
+    record_cache_lookup('jobs', misses=1)
     _websocket_keepalive("Fetching jobs from API...")
     jobs = scraper.search_jobs(query, location, max_rows, job_type, country)
     
     if jobs:
         _websocket_keepalive("Caching job results...")
+        jobs = get_job_store().add_many(jobs)
         _store_jobs_in_cache(query, location, max_rows, job_type, country, jobs, cache_ttl_hours)
     
     _websocket_keepalive("Job fetch complete", force=True)
@@ -0,0 +1,221 @@
+"""Process-wide job vector corpus shared read-only by every session"""
+import itertools
+import threading
+from dataclasses import dataclass
+import streamlit as st
+from modules.utils import register_process_cache
+from modules.utils.config import JOB_CORPUS_MAX_JOBS
+
+# Lazy import for numpy - only load when needed
+_np = None
+
+
+def _get_numpy():
+    """Lazy load numpy"""
+    global _np
+    if _np is None:
+        import numpy as np
+        _np = np
+    return _np
+
+
+@dataclass(frozen=True)
+class CorpusSnapshot:
+    """Immutable state of the corpus at one point in time.
+
+    index maps job hash -> row and is never mutated once published. Rows
+    below size never change either; writers only fill rows past it (or move
+    to a new buffer), so a snapshot stays valid for as long as it is held.
+    """
+    index: dict
+    matrix: object
+    size: int
+    version: int
+
+    def row(self, job_id):
+        return self.index.get(job_id, -1)
+
+
+class CorpusView:
+    """A session's read-only window onto one snapshot, for an ordered list of job IDs.
+
+    present is aligned with job_ids; vectors and similarities cover only the
+    present jobs, in order.
+    """
+    def __init__(self, snapshot, job_ids):
+        np = _get_numpy()
+        self.snapshot = snapshot
+        self.job_ids = list(job_ids)
+        rows = [snapshot.row(job_id) for job_id in self.job_ids]
+        self.present = [row >= 0 for row in rows]
+        self.rows = np.array([row for row in rows if row >= 0], dtype=np.int64)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def vectors(self):
+        """Unit-normalized float32 rows for the present jobs (a fresh array)."""
+        np = _get_numpy()
+        if self.snapshot.matrix is None or not len(self.rows):
+            return np.empty((0, 0), dtype=np.float32)
+        return self.snapshot.matrix[self.rows]
+
+    def similarities(self, query_embedding):
+        """Cosine similarity of query_embedding against every present job."""
+        np = _get_numpy()
+        if not len(self.rows):
+            return np.empty(0, dtype=np.float32)
+        query = np.asarray(query_embedding, dtype=np.float32).ravel()
+        query /= max(float(np.linalg.norm(query)), 1e-12)
+        return self.vectors() @ query
+
+
+class JobCorpus:
+    """Job vectors held as rows of one unit-normalized float32 matrix.
+
+    Shared by every session through st.cache_resource. Readers take the
+    current CorpusSnapshot without locking; writers build the next snapshot
+    under a lock (copy-on-write index, append-only rows) and publish it with
+    a single assignment. When max_jobs is reached the corpus starts a new
+    buffer, leaving older snapshots intact for the sessions holding them.
+    trim_to() compacts the least recently used rows away the same way.
+    """
+    def __init__(self, max_jobs=JOB_CORPUS_MAX_JOBS):
+        self.max_jobs = max_jobs
+        self._snapshot = CorpusSnapshot({}, None, 0, 0)
+        self._lock = threading.Lock()
+        # job hash -> tick of its last add or view, for trim_to()
+        self._last_used = {}
+        self._ticks = itertools.count()
+
+    def _touch(self, job_ids, index):
+        """Mark the jobs in index as used now."""
+        tick = next(self._ticks)
+        for job_id in job_ids:
+            if job_id in index:
+                self._last_used[job_id] = tick
+
+    def __len__(self):
+        return self._snapshot.size
+
+    def __contains__(self, job_id):
+        return job_id in self._snapshot.index
+
+    @property
+    def snapshot(self):
+        return self._snapshot
+
+    @property
+    def nbytes(self):
+        """Bytes held by the rows in use (spare buffer capacity is not counted)."""
+        snapshot = self._snapshot
+        return 0 if snapshot.matrix is None else snapshot.size * snapshot.matrix[0].nbytes
+
+    def view(self, job_ids):
+        snapshot = self._snapshot
+        job_ids = list(job_ids)
+        self._touch(job_ids, snapshot.index)
+        return CorpusView(snapshot, job_ids)
+
+    def vector(self, job_id):
+        """Read-only vector for job_id, or None if it is not in the corpus."""
+        snapshot = self._snapshot
+        row = snapshot.row(job_id)
+        if row < 0:
+            return None
+        vector = snapshot.matrix[row]
+        vector.flags.writeable = False
+        return vector
+
+    def add(self, job_ids, embeddings, keep=(), pinned=None):
+        """Add vectors for jobs not yet in the corpus and return the new snapshot.
+
+        keep lists the job IDs the caller is about to view. They survive the
+        switch to a new buffer when max_jobs is reached, and any that were
+        trimmed since the caller looked are restored from pinned (the snapshot
+        it looked at), so a view of keep on the returned snapshot has them all.
+        """
+        np = _get_numpy()
+        with self._lock:
+            snapshot = self._snapshot
+            new_rows = {}
+            for job_id, embedding in zip(job_ids, embeddings):
+                if embedding is not None and len(embedding) and job_id not in snapshot.index:
+                    new_rows.setdefault(job_id, embedding)
+            if pinned is not None and pinned.matrix is not None:
+                for job_id in keep:
+                    row = pinned.row(job_id)
+                    if row >= 0 and job_id not in snapshot.index and job_id not in new_rows:
+                        new_rows[job_id] = pinned.matrix[row]
+            if not new_rows:
+                self._touch(keep, snapshot.index)
+                return snapshot
+
+            ids = list(new_rows)
+            vectors = np.asarray(list(new_rows.values()), dtype=np.float32)
+            vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+            matrix, size, index = snapshot.matrix, snapshot.size, snapshot.index
+            if matrix is not None and matrix.shape[1] != vectors.shape[1]:
+                matrix, size, index = None, 0, {}
+            if size + len(vectors) > self.max_jobs:
+                # New buffer, seeded with the kept rows so the caller's view stays complete
+                carried = [job_id for job_id in dict.fromkeys(keep) if job_id in index]
+                if carried:
+                    ids = carried + ids
+                    vectors = np.concatenate([matrix[[index[job_id] for job_id in carried]], vectors])
+                matrix, size, index = None, 0, {}
+                self._last_used = {job_id: self._last_used[job_id] for job_id in ids if job_id in self._last_used}
+
+            needed = size + len(vectors)
+            if matrix is None or needed > len(matrix):
+                capacity = min(self.max_jobs, max(needed, 256, 2 * (0 if matrix is None else len(matrix))))
+                grown = np.empty((max(capacity, needed), vectors.shape[1]), dtype=np.float32)
+                if matrix is not None:
+                    grown[:size] = matrix[:size]
+                matrix = grown
+
+            matrix[size:needed] = vectors
+            index = dict(index)
+            for offset, job_id in enumerate(ids):
+                index[job_id] = size + offset
+            self._snapshot = CorpusSnapshot(index, matrix, needed, snapshot.version + 1)
+            self._touch(list(keep) + ids, index)
+            return self._snapshot
+
+    def trim_to(self, max_bytes):
+        """Keep the most recently used rows that fit in max_bytes, in a new compacted buffer.
+
+        Returns bytes freed. Sessions holding the previous snapshot keep it.
+        """
+        np = _get_numpy()
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot.matrix is None or self.nbytes <= max_bytes:
+                return 0
+            row_bytes = snapshot.matrix[0].nbytes
+            kept = sorted(snapshot.index, key=lambda job_id: self._last_used.get(job_id, -1), reverse=True)
+            kept = kept[:max(0, int(max_bytes // row_bytes))]
+            if kept:
+                # Rows keep their relative order in the new buffer
+                kept.sort(key=snapshot.index.get)
+                matrix = np.ascontiguousarray(snapshot.matrix[[snapshot.index[job_id] for job_id in kept]])
+            else:
+                matrix = None
+            index = {job_id: row for row, job_id in enumerate(kept)}
+            self._last_used = {job_id: self._last_used.get(job_id, -1) for job_id in kept}
+            self._snapshot = CorpusSnapshot(index, matrix, len(kept), snapshot.version + 1)
+            return (snapshot.size - len(kept)) * row_bytes
+
+    def clear(self):
+        with self._lock:
+            self._snapshot = CorpusSnapshot({}, None, 0, self._snapshot.version + 1)
+            self._last_used = {}
+
+
+@st.cache_resource(show_spinner=False)
+def get_job_corpus():
+    """Get the process-wide job corpus."""
+    corpus = JobCorpus()
+    register_process_cache('job_corpus', lambda: corpus.nbytes, corpus.trim_to)
+    return corpus
@@ -1,6 +1,8 @@
 """Resume embedding generation and storage"""
 import streamlit as st
 from modules.utils import get_embedding_generator, get_token_tracker
+from .job_search import get_job_hash, build_job_text
+from .corpus import get_job_corpus
 
 
 def generate_and_store_resume_embedding(resume_text, user_profile=None):
@@ -37,3 +39,38 @@ def generate_and_store_resume_embedding(resume_text, user_profile=None):
         return embedding
     
     return None
+
+
+def get_job_embedding(job):
+    """Return the vector for a job, reusing the one stored when it was indexed.
+    
+    Jobs that were never indexed are embedded once with the same text used by
+    the index and added to the shared job corpus.
+    """
+    if not job:
+        return None
+    
+    job_hash = get_job_hash(job)
+    corpus = get_job_corpus()
+    vector = corpus.vector(job_hash)
+    if vector is not None:
+        return vector
+    
+    embedding_gen = get_embedding_generator()
+    if not embedding_gen:
+        return None
+    
+    try:
+        embedding, tokens_used = embedding_gen.get_embedding(build_job_text(job))
+    except (KeyError, TypeError):
+        return None
+    
+    token_tracker = get_token_tracker()
+    if token_tracker:
+        token_tracker.add_embedding_tokens(tokens_used)
+    
+    if embedding:
+        corpus.add([job_hash], [embedding])
+        return embedding
+    
+    return None
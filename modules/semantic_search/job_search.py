@@ -1,13 +1,17 @@
 """Semantic job search functionality"""
 import os
-import hashlib
 import streamlit as st
 from modules.utils import get_token_tracker, _is_streamlit_cloud, _websocket_keepalive, _ensure_websocket_alive
 from modules.utils.config import DEFAULT_MAX_JOBS_TO_INDEX, USE_FAST_SKILL_MATCHING
+from modules.skills import get_skill_index, canonicalize_skills, match_skills_by_id
+from modules.jobs import job_hash, job_snippet
+from .skill_store import get_skill_embedding_store
+from .corpus import CorpusView, get_job_corpus
+from modules.utils.tracing import trace_span, current_span
+from modules.utils.metrics import record_cache_lookup
 
 # Lazy imports for heavy modules - only load when needed
 _np = None
-_cosine_similarity = None
 _chromadb = None
 
 
@@ -20,15 +24,6 @@ def _get_numpy():
     return _np
 
 
-def _get_cosine_similarity():
-    """Lazy load sklearn cosine_similarity"""
-    global _cosine_similarity
-    if _cosine_similarity is None:
-        from sklearn.metrics.pairwise import cosine_similarity
-        _cosine_similarity = cosine_similarity
-    return _cosine_similarity
-
-
 def _get_chromadb():
     """Lazy load chromadb"""
     global _chromadb
@@ -38,11 +33,21 @@ def _get_chromadb():
     return _chromadb
 
 
+def get_job_hash(job):
+    """Generate a stable hash for a job to use as its ID."""
+    return job_hash(job)
+
+
+def build_job_text(job):
+    """Text that is embedded to represent a job in the index (description lead only)."""
+    return f"{job['title']} at {job['company']}. {job_snippet(job)} Skills: {', '.join(job['skills'][:5])}"
+
+
 class SemanticJobSearch:
     """Semantic job search using embeddings"""
     def __init__(self, embedding_generator, use_persistent_store=True):
         self.embedding_gen = embedding_generator
-        self.job_embeddings = []
+        self.view = None
         self.jobs = []
         self.chroma_client = None
         self.collection = None
@@ -59,6 +64,10 @@ class SemanticJobSearch:
             return
         
         self._chroma_initialized = True
+        with trace_span('chroma.init', persistent=self.use_persistent_store):
+            self._init_chroma()
+    
+    def _init_chroma(self):
         chromadb = _get_chromadb()
         
         if self.use_persistent_store:
@@ -86,8 +95,7 @@ class SemanticJobSearch:
     
     def _get_job_hash(self, job):
         """Generate a hash for a job to use as ID."""
-        job_str = f"{job.get('title', '')}_{job.get('company', '')}_{job.get('url', '')}"
-        return hashlib.md5(job_str.encode()).hexdigest()
+        return get_job_hash(job)
     
     def index_jobs(self, jobs, max_jobs_to_index=None):
         """Simplified job indexing: Check if job exists, if not, embed and store.
@@ -97,7 +105,7 @@ class SemanticJobSearch:
         if not jobs:
             st.warning("⚠️ No jobs available to index.")
             self.jobs = []
-            self.job_embeddings = []
+            self.view = None
             return
         
         _websocket_keepalive("Starting job indexing...", force=True)
@@ -111,81 +119,97 @@ class SemanticJobSearch:
         
         _ensure_websocket_alive()
         
-        job_texts = [
-            f"{job['title']} at {job['company']}. {job['description']} Skills: {', '.join(job['skills'][:5])}"
-            for job in jobs_to_index
-        ]
+        job_hashes = [self._get_job_hash(job) for job in jobs_to_index]
+        corpus = get_job_corpus()
+        pinned = corpus.snapshot
+        missing = [idx for idx, job_hash in enumerate(job_hashes) if pinned.row(job_hash) < 0]
+        current_span().set(jobs=len(job_hashes), corpus_hits=len(job_hashes) - len(missing))
+        record_cache_lookup('embeddings', hits=len(job_hashes) - len(missing))
         
         st.info(f"📊 Indexing {len(jobs_to_index)} jobs...")
-        _websocket_keepalive("Preparing embeddings...")
         
+        if missing:
+            _websocket_keepalive("Preparing embeddings...")
+            missing_hashes = [job_hashes[idx] for idx in missing]
+            missing_texts = [build_job_text(jobs_to_index[idx]) for idx in missing]
+            hash_to_emb = self._load_or_embed(missing_hashes, missing_texts)
+        else:
+            hash_to_emb = {}
+        # Passing every hash as keep (with the snapshot checked above) means a
+        # buffer reset or a trim by another session cannot drop jobs that were
+        # already embedded
+        snapshot = corpus.add(list(hash_to_emb), list(hash_to_emb.values()), keep=job_hashes, pinned=pinned)
+        
+        # The view pins one corpus snapshot for this session's search
+        self.view = CorpusView(snapshot, job_hashes)
+        self.jobs = [job for job, present in zip(jobs_to_index, self.view.present) if present]
+        source = " (using persistent store)" if self.use_persistent_store and self.collection else ""
+        st.success(f"✅ Indexed {len(self.view)} jobs{source}")
+    
+    def _embed_texts(self, job_texts):
+        """Embed job texts, returning vectors aligned with job_texts (None where embedding failed)."""
+        record_cache_lookup('embeddings', misses=len(job_texts))
+        embeddings, tokens_used = self.embedding_gen.get_embeddings_batch(job_texts)
+        token_tracker = get_token_tracker()
+        if token_tracker:
+            token_tracker.add_embedding_tokens(tokens_used)
+        if len(embeddings) == len(job_texts):
+            return embeddings
+        
+        # A skipped batch leaves the result misaligned - embed one by one instead
+        embeddings = []
+        for text in job_texts:
+            emb, tokens = self.embedding_gen.get_embedding(text)
+            if token_tracker:
+                token_tracker.add_embedding_tokens(tokens)
+            embeddings.append(emb or None)
+        return embeddings
+    
+    def _load_or_embed(self, job_hashes, job_texts):
+        """Vectors for jobs missing from the shared corpus: persistent store first, then the API."""
         # Lazy init ChromaDB only when actually indexing
         self._init_chroma_lazy()
+        hash_to_emb = {}
         
         if self.use_persistent_store and self.collection:
             try:
-                job_hashes = [self._get_job_hash(job) for job in jobs_to_index]
-                existing_data = self.collection.get(ids=job_hashes, include=['embeddings'])
-                existing_ids = set(existing_data.get('ids', [])) if existing_data else set()
+                with trace_span('chroma.get', ids=len(job_hashes)) as span:
+                    existing_data = self.collection.get(ids=job_hashes, include=['embeddings'])
+                    if existing_data and existing_data.get('embeddings') is not None:
+                        hash_to_emb.update(zip(existing_data['ids'], existing_data['embeddings']))
+                    span.set(hits=len(hash_to_emb))
+                record_cache_lookup('embeddings', hits=len(hash_to_emb))
                 
-                jobs_to_embed = []
-                indices_to_embed = []
-                for idx, job_hash in enumerate(job_hashes):
-                    if job_hash not in existing_ids:
-                        jobs_to_embed.append(job_texts[idx])
-                        indices_to_embed.append(idx)
-                
-                if jobs_to_embed:
-                    st.info(f"🔄 Generating embeddings for {len(jobs_to_embed)} new jobs...")
-                    new_embeddings, tokens_used = self.embedding_gen.get_embeddings_batch(jobs_to_embed)
-                    
-                    token_tracker = get_token_tracker()
-                    if token_tracker:
-                        token_tracker.add_embedding_tokens(tokens_used)
-                    
-                    for idx, emb in zip(indices_to_embed, new_embeddings):
-                        if emb:
-                            job_hash = job_hashes[idx]
+                to_embed = [idx for idx, job_hash in enumerate(job_hashes) if job_hash not in hash_to_emb]
+                if to_embed:
+                    st.info(f"🔄 Generating embeddings for {len(to_embed)} new jobs...")
+                    new_embeddings = self._embed_texts([job_texts[idx] for idx in to_embed])
+                    upserts = [(job_hashes[idx], emb, job_texts[idx]) for idx, emb in zip(to_embed, new_embeddings) if emb]
+                    if upserts:
+                        with trace_span('chroma.upsert', ids=len(upserts)):
                             self.collection.upsert(
-                                ids=[job_hash],
-                                embeddings=[emb],
-                                documents=[job_texts[idx]],
-                                metadatas=[{"job_index": idx}]
+                                ids=[job_hash for job_hash, _, _ in upserts],
+                                embeddings=[emb for _, emb, _ in upserts],
+                                documents=[text for _, _, text in upserts],
+                                metadatas=[{"job_index": idx} for idx, _ in enumerate(upserts)]
                             )
-                
-                retrieved = self.collection.get(ids=job_hashes, include=['embeddings'])
-                if retrieved and 'embeddings' in retrieved and retrieved['embeddings'] is not None and len(retrieved['embeddings']) > 0:
-                    hash_to_emb = {h: e for h, e in zip(retrieved['ids'], retrieved['embeddings'])}
-                    self.job_embeddings = [hash_to_emb.get(h, None) for h in job_hashes]
-                    self.job_embeddings = [e for e in self.job_embeddings if e is not None]
-                    st.success(f"✅ Indexed {len(self.job_embeddings)} jobs (using persistent store)")
-                else:
-                    self.job_embeddings, tokens_used = self.embedding_gen.get_embeddings_batch(job_texts)
-                    token_tracker = get_token_tracker()
-                    if token_tracker:
-                        token_tracker.add_embedding_tokens(tokens_used)
-                    st.success(f"✅ Indexed {len(self.job_embeddings)} jobs")
+                        hash_to_emb.update((job_hash, emb) for job_hash, emb, _ in upserts)
+                return hash_to_emb
             except Exception as e:
                 st.warning(f"⚠️ Error using persistent store: {e}. Generating new embeddings...")
-                self.job_embeddings, tokens_used = self.embedding_gen.get_embeddings_batch(job_texts)
-                token_tracker = get_token_tracker()
-                if token_tracker:
-                    token_tracker.add_embedding_tokens(tokens_used)
                 self.use_persistent_store = False
-                st.success(f"✅ Indexed {len(self.job_embeddings)} jobs")
-        else:
-            self.job_embeddings, tokens_used = self.embedding_gen.get_embeddings_batch(job_texts)
-            token_tracker = get_token_tracker()
-            if token_tracker:
-                token_tracker.add_embedding_tokens(tokens_used)
-            st.success(f"✅ Indexed {len(self.job_embeddings)} jobs")
+        
+        to_embed = [idx for idx, job_hash in enumerate(job_hashes) if job_hash not in hash_to_emb]
+        new_embeddings = self._embed_texts([job_texts[idx] for idx in to_embed])
+        hash_to_emb.update((job_hashes[idx], emb) for idx, emb in zip(to_embed, new_embeddings) if emb)
+        return hash_to_emb
     
     def search(self, query=None, top_k=10, resume_embedding=None):
         """Simplified search: Use pre-computed resume embedding if available, otherwise generate from query.
         
         Includes WebSocket keepalive during search operations.
         """
-        if not self.job_embeddings:
+        if self.view is None or not len(self.view):
             return []
         
         _websocket_keepalive("Searching jobs...", force=True)
@@ -206,12 +230,8 @@ class SemanticJobSearch:
         _ensure_websocket_alive()
         
         np = _get_numpy()
-        cosine_similarity = _get_cosine_similarity()
         
-        query_emb = np.array(query_embedding).reshape(1, -1)
-        job_embs = np.array(self.job_embeddings)
-        
-        similarities = cosine_similarity(query_emb, job_embs)[0]
+        similarities = self.view.similarities(query_embedding)
         top_indices = np.argsort(similarities)[::-1][:top_k]
         
         _websocket_keepalive("Ranking results...")
@@ -226,96 +246,134 @@ class SemanticJobSearch:
         
         return results
     
+    def warm_up_skill_embeddings(self, user_skills):
+        """Embed the user's skills ahead of skill matching so it only waits on job skills.
+        
+        No-op when fast string-based skill matching is enabled.
+        """
+        if USE_FAST_SKILL_MATCHING or not user_skills:
+            return
+        user_skills_list = [s.strip() for s in str(user_skills).split(',') if s.strip()]
+        if user_skills_list:
+            get_skill_embedding_store().get_vectors(user_skills_list, self.embedding_gen)
+    
     def calculate_skill_match(self, user_skills, job_skills):
         """Calculate skill-based match score.
         
         Uses semantic matching with embeddings when available, with automatic
         fallback to string matching. Includes WebSocket keepalive.
         """
-        if not user_skills or not job_skills:
-            return 0.0, []
+        return self.calculate_skill_matches(user_skills, [job_skills])[0]
+    
+    def calculate_skill_matches(self, user_skills, job_skills_lists):
+        """Calculate (match_score, missing_skills) for many jobs at once.
         
-        user_skills_list = [s.strip() for s in str(user_skills).split(',') if s.strip()]
-        job_skills_list = [s.strip() for s in job_skills if isinstance(s, str) and s.strip()]
+        Unique job skills across all jobs are looked up in the shared skill
+        embedding store (embedding any new ones in one batched call) and
+        compared with the user's skills in a single similarity matrix. Each job
+        skill matches its most similar user skill if the similarity reaches the
+        threshold and that user skill is not already matched for the same job.
+        """
+        results = [(0.0, []) for _ in job_skills_lists]
+        if not user_skills:
+            return results
         
-        if not user_skills_list or not job_skills_list:
-            return 0.0, []
+        user_skills_list = [s.strip() for s in str(user_skills).split(',') if s.strip()]
+        jobs_skills = [
+            [s.strip() for s in (job_skills or []) if isinstance(s, str) and s.strip()]
+            for job_skills in job_skills_lists
+        ]
+        if not user_skills_list:
+            return results
         
         if USE_FAST_SKILL_MATCHING:
-            return self._calculate_skill_match_string_based(user_skills_list, job_skills_list)
+            user_ids = frozenset(i for i in canonicalize_skills(user_skills_list) if i >= 0)
+            return [
+                self._calculate_skill_match_string_based(user_skills_list, job_skills_list, user_ids)
+                for job_skills_list in jobs_skills
+            ]
         
         try:
             _ensure_websocket_alive()
             
-            user_skills_key = ",".join(sorted(user_skills_list))
-            if user_skills_key in st.session_state.user_skills_embeddings_cache:
-                user_skill_embeddings = st.session_state.user_skills_embeddings_cache[user_skills_key]
-                user_tokens = 0
-            else:
-                user_skill_embeddings, user_tokens = self.embedding_gen.get_embeddings_batch(user_skills_list, batch_size=10)
-                if user_skill_embeddings:
-                    st.session_state.user_skills_embeddings_cache[user_skills_key] = user_skill_embeddings
-            
-            _ensure_websocket_alive()
+            # Aliases share one canonical name, so "k8s" and "Kubernetes" share one vector
+            skill_index = get_skill_index()
+            canonical = {
+                skill: skill_index.canonical_name(skill)
+                for skill in dict.fromkeys(user_skills_list + [s for job_skills_list in jobs_skills for s in job_skills_list])
+            }
+            user_names = list(dict.fromkeys(canonical[skill] for skill in user_skills_list))
+            unique_names = list(dict.fromkeys(canonical[s] for job_skills_list in jobs_skills for s in job_skills_list))
             
-            job_skills_key = ",".join(sorted(job_skills_list))
-            if job_skills_key in st.session_state.skill_embeddings_cache:
-                job_skill_embeddings = st.session_state.skill_embeddings_cache[job_skills_key]
-                job_tokens = 0
-            else:
-                job_skill_embeddings, job_tokens = self.embedding_gen.get_embeddings_batch(job_skills_list, batch_size=10)
-                if job_skill_embeddings:
-                    st.session_state.skill_embeddings_cache[job_skills_key] = job_skill_embeddings
+            # User and job skills come from the shared store; anything new is embedded in one batch
+            store = get_skill_embedding_store()
+            vectors, present = store.get_vectors(user_names + unique_names, self.embedding_gen)
+            user_present = present[:len(user_names)]
+            job_present = present[len(user_names):]
+            user_matrix = vectors[:sum(user_present)]
+            job_matrix = vectors[sum(user_present):]
             
-            if user_tokens > 0 or job_tokens > 0:
-                token_tracker = get_token_tracker()
-                if token_tracker:
-                    token_tracker.add_embedding_tokens(user_tokens + job_tokens)
-            
-            if not user_skill_embeddings or not job_skill_embeddings:
-                return self._calculate_skill_match_string_based(user_skills_list, job_skills_list)
+            if not len(user_matrix):
+                raise ValueError("user skill embeddings unavailable")
             
             np = _get_numpy()
-            cosine_similarity = _get_cosine_similarity()
-            
-            user_embs = np.array(user_skill_embeddings)
-            job_embs = np.array(job_skill_embeddings)
             
-            similarity_matrix = cosine_similarity(job_embs, user_embs)
+            name_rows = {}
+            for name, found in zip(unique_names, job_present):
+                if found:
+                    name_rows[name] = len(name_rows)
+            skill_rows = {skill: name_rows[name] for skill, name in canonical.items() if name in name_rows}
             
-            similarity_threshold = 0.7
-            matched_skills = []
-            matched_indices = set()
+            # Job skill occurrences, flattened across jobs (only jobs whose skills are all embedded)
+            semantic_jobs = [
+                job_idx for job_idx, job_skills_list in enumerate(jobs_skills)
+                if job_skills_list and all(skill in skill_rows for skill in job_skills_list)
+            ]
+            occurrence_jobs = np.array(
+                [job_idx for job_idx in semantic_jobs for _ in jobs_skills[job_idx]], dtype=np.int64
+            )
+            occurrence_rows = np.array(
+                [skill_rows[skill] for job_idx in semantic_jobs for skill in jobs_skills[job_idx]], dtype=np.int64
+            )
             
-            for job_idx, job_skill in enumerate(job_skills_list):
-                best_match_idx = np.argmax(similarity_matrix[job_idx])
-                best_similarity = similarity_matrix[job_idx][best_match_idx]
+            if len(occurrence_rows):
+                similarity_matrix = job_matrix @ user_matrix.T
+                best_user = similarity_matrix.argmax(axis=1)[occurrence_rows]
+                best_similarity = similarity_matrix.max(axis=1)[occurrence_rows]
                 
-                if best_similarity >= similarity_threshold and best_match_idx not in matched_indices:
-                    matched_skills.append(job_skill)
-                    matched_indices.add(best_match_idx)
-            
-            match_score = len(matched_skills) / len(job_skills_list) if job_skills_list else 0.0
-            missing_skills = [js for js in job_skills_list if js not in matched_skills]
+                similarity_threshold = 0.7
+                passing = np.flatnonzero(best_similarity >= similarity_threshold)
+                # A user skill can only be matched once per job: keep the first job skill claiming it
+                claim_keys = occurrence_jobs[passing] * len(user_names) + best_user[passing]
+                _, first_claims = np.unique(claim_keys, return_index=True)
+                matched_occurrences = np.zeros(len(occurrence_rows), dtype=bool)
+                matched_occurrences[passing[first_claims]] = True
+                
+                offset = 0
+                for job_idx in semantic_jobs:
+                    job_skills_list = jobs_skills[job_idx]
+                    job_matched = matched_occurrences[offset:offset + len(job_skills_list)]
+                    offset += len(job_skills_list)
+                    matched_skills = {skill for skill, matched in zip(job_skills_list, job_matched) if matched}
+                    match_score = int(job_matched.sum()) / len(job_skills_list)
+                    missing_skills = [js for js in job_skills_list if js not in matched_skills]
+                    results[job_idx] = (min(match_score, 1.0), missing_skills[:5])
             
-            return min(match_score, 1.0), missing_skills[:5]
+            semantic_set = set(semantic_jobs)
+            for job_idx, job_skills_list in enumerate(jobs_skills):
+                if job_skills_list and job_idx not in semantic_set:
+                    results[job_idx] = self._calculate_skill_match_string_based(user_skills_list, job_skills_list)
+            return results
             
         except Exception as e:
-            return self._calculate_skill_match_string_based(user_skills_list, job_skills_list)
+            user_ids = frozenset(i for i in canonicalize_skills(user_skills_list) if i >= 0)
+            return [
+                self._calculate_skill_match_string_based(user_skills_list, job_skills_list, user_ids)
+                for job_skills_list in jobs_skills
+            ]
     
-    def _calculate_skill_match_string_based(self, user_skills_list, job_skills_list):
-        """Fallback string-based skill matching"""
-        user_skills_lower = [s.lower() for s in user_skills_list]
-        job_skills_lower = [s.lower() for s in job_skills_list]
-        
-        matched_skills = []
-        for job_skill in job_skills_lower:
-            for user_skill in user_skills_lower:
-                if job_skill in user_skill or user_skill in job_skill:
-                    matched_skills.append(job_skill)
-                    break
-        
-        match_score = len(matched_skills) / len(job_skills_lower) if job_skills_lower else 0.0
-        missing_skills = [job_skills_list[i] for i, js in enumerate(job_skills_lower) if js not in matched_skills]
-        
-        return min(match_score, 1.0), missing_skills[:5]
+    def _calculate_skill_match_string_based(self, user_skills_list, job_skills_list, user_ids=None):
+        """Fallback skill matching on canonical skill IDs (aliases such as "k8s"/"Kubernetes" match)"""
+        if user_ids is None:
+            user_ids = frozenset(i for i in canonicalize_skills(user_skills_list) if i >= 0)
+        return match_skills_by_id(user_ids, job_skills_list, canonicalize_skills(job_skills_list))
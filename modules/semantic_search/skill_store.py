@@ -0,0 +1,228 @@
+"""Process-wide skill embedding store: one float32 vector per normalized skill string"""
+import atexit
+import itertools
+import os
+import re
+import threading
+import streamlit as st
+from modules.utils import get_token_tracker, register_process_cache, run_in_background
+from modules.utils.config import SKILL_STORE_PATH, SKILL_STORE_MAX_SKILLS, SKILL_STORE_SAVE_EVERY
+from modules.utils.metrics import record_cache_lookup
+
+# Lazy import for numpy - only load when needed
+_np = None
+
+
+def _get_numpy():
+    """Lazy load numpy"""
+    global _np
+    if _np is None:
+        import numpy as np
+        _np = np
+    return _np
+
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_skill(skill):
+    """Normalize a skill string for lookup ("  Machine  Learning" -> "machine learning")."""
+    return _WHITESPACE.sub(' ', skill.strip().lower())
+
+
+class SkillEmbeddingStore:
+    """Skill vectors held as rows of one unit-normalized float32 matrix.
+
+    Shared by every session: a skill is embedded once per process (or once
+    per deployment when a path is configured) no matter which job or user it
+    came from. When the store reaches max_skills it starts over in a new
+    buffer (keeping the skills being looked up) rather than growing without
+    bound. Rows below the current size are never overwritten, so a saved or
+    pinned matrix reference stays valid without copying. trim_to() compacts
+    the store to its most recently used skills the same way.
+    """
+    def __init__(self, path=None, max_skills=SKILL_STORE_MAX_SKILLS, save_every=SKILL_STORE_SAVE_EVERY):
+        self.path = path
+        self.max_skills = max_skills
+        self.save_every = save_every
+        self._index = {}
+        self._matrix = None
+        self._size = 0
+        self._unsaved = 0
+        # skill -> tick of its last lookup, for trim_to()
+        self._last_used = {}
+        self._ticks = itertools.count()
+        self._lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        if path:
+            self._load()
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, skill):
+        return normalize_skill(skill) in self._index
+
+    @property
+    def nbytes(self):
+        """Bytes held by the rows in use (spare buffer capacity is not counted)."""
+        matrix = self._matrix
+        return 0 if matrix is None else self._size * matrix.shape[1] * matrix.itemsize
+
+    def _load(self):
+        np = _get_numpy()
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                skills = [str(s) for s in data['skills']]
+                matrix = np.ascontiguousarray(data['matrix'], dtype=np.float32)
+        except (OSError, KeyError, ValueError):
+            return
+        if len(skills) != len(matrix) or len(skills) > self.max_skills:
+            return
+        self._matrix = matrix
+        self._size = len(skills)
+        self._index = {skill: row for row, skill in enumerate(skills)}
+
+    def flush(self):
+        """Write the store to path if skills were added since the last save.
+
+        Only the index is copied under the store lock; the npz is written
+        outside it, so lookups from other sessions never wait on the disk.
+        """
+        if not self.path or not self._save_lock.acquire(blocking=False):
+            return False
+        try:
+            with self._lock:
+                if not self._unsaved:
+                    return False
+                matrix, size, unsaved = self._matrix, self._size, self._unsaved
+                skills = sorted(self._index, key=self._index.get)
+                self._unsaved = 0
+            np = _get_numpy()
+            tmp_path = f"{self.path}.tmp.npz"
+            try:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+                np.savez(tmp_path, matrix=matrix[:size], skills=np.array(skills))
+                os.replace(tmp_path, self.path)
+            except OSError:
+                with self._lock:
+                    self._unsaved += unsaved
+                return False
+            return True
+        finally:
+            self._save_lock.release()
+
+    def _add(self, skills, embeddings, keep=()):
+        """Append rows for new skills (caller holds the lock).
+
+        On reaching max_skills the store moves to a new buffer seeded with the
+        rows of keep, so skills being looked up are never dropped.
+        """
+        np = _get_numpy()
+        vectors = np.asarray(embeddings, dtype=np.float32)
+        vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+        if self._matrix is not None and self._matrix.shape[1] != vectors.shape[1]:
+            self._matrix, self._index, self._size = None, {}, 0
+        if self._size + len(skills) > self.max_skills:
+            carried = [skill for skill in dict.fromkeys(keep) if skill in self._index and skill not in skills]
+            if carried:
+                skills = carried + list(skills)
+                vectors = np.concatenate([self._matrix[[self._index[skill] for skill in carried]], vectors])
+            self._matrix, self._index, self._size = None, {}, 0
+            self._last_used = {skill: self._last_used[skill] for skill in skills if skill in self._last_used}
+
+        needed = self._size + len(skills)
+        if self._matrix is None or needed > len(self._matrix):
+            capacity = min(self.max_skills, max(needed, 256, 2 * (0 if self._matrix is None else len(self._matrix))))
+            grown = np.empty((max(capacity, needed), vectors.shape[1]), dtype=np.float32)
+            if self._matrix is not None:
+                grown[:self._size] = self._matrix[:self._size]
+            self._matrix = grown
+
+        self._matrix[self._size:needed] = vectors
+        for offset, skill in enumerate(skills):
+            self._index[skill] = self._size + offset
+        self._size = needed
+        self._unsaved += len(skills)
+
+    def trim_to(self, max_bytes):
+        """Keep the most recently looked-up skills that fit in max_bytes, in a new buffer.
+
+        Returns bytes freed. Matrices already handed out are unaffected.
+        """
+        np = _get_numpy()
+        with self._lock:
+            if self._matrix is None or self.nbytes <= max_bytes:
+                return 0
+            row_bytes = self._matrix.shape[1] * self._matrix.itemsize
+            kept = sorted(self._index, key=lambda skill: self._last_used.get(skill, -1), reverse=True)
+            kept = sorted(kept[:max(0, int(max_bytes // row_bytes))], key=self._index.get)
+            freed = (self._size - len(kept)) * row_bytes
+            if kept:
+                self._matrix = np.ascontiguousarray(self._matrix[[self._index[skill] for skill in kept]])
+            else:
+                self._matrix = None
+            self._index = {skill: row for row, skill in enumerate(kept)}
+            self._size = len(kept)
+            self._last_used = {skill: self._last_used[skill] for skill in kept if skill in self._last_used}
+            return freed
+
+    def get_vectors(self, skills, embedding_generator=None):
+        """Return (matrix, present) for skills.
+
+        Skills missing from the store are embedded in one batched call when an
+        embedding generator is given. present is a list of booleans aligned with
+        skills; matrix holds one unit-normalized row per present skill, in order.
+        """
+        np = _get_numpy()
+        normalized = [normalize_skill(skill) for skill in skills]
+        unique = [skill for skill in dict.fromkeys(normalized) if skill]
+
+        with self._lock:
+            # Rows of skills already stored, from a buffer that is never overwritten
+            pinned_matrix = self._matrix
+            pinned_rows = {skill: self._index[skill] for skill in unique if skill in self._index}
+        missing = [skill for skill in unique if skill not in pinned_rows]
+        record_cache_lookup('skill_embeddings', hits=len(pinned_rows), misses=len(missing))
+
+        new_rows = []
+        if missing and embedding_generator is not None:
+            embeddings, tokens_used = embedding_generator.get_embeddings_batch(missing, batch_size=50)
+            token_tracker = get_token_tracker()
+            if token_tracker and tokens_used:
+                token_tracker.add_embedding_tokens(tokens_used)
+            # A skipped batch leaves the result misaligned - only trust complete results
+            if embeddings and len(embeddings) == len(missing):
+                new_rows = [(skill, emb) for skill, emb in zip(missing, embeddings) if emb]
+
+        with self._lock:
+            # Skills dropped by another session's reset since the check above come back from the pinned rows
+            additions = [(skill, emb) for skill, emb in new_rows if skill not in self._index]
+            additions += [(skill, pinned_matrix[row]) for skill, row in pinned_rows.items() if skill not in self._index]
+            if additions:
+                self._add([skill for skill, _ in additions], [emb for _, emb in additions], keep=unique)
+            save_due = bool(self.path) and self._unsaved >= self.save_every
+            tick = next(self._ticks)
+            for skill in unique:
+                if skill in self._index:
+                    self._last_used[skill] = tick
+            rows = [self._index.get(skill, -1) for skill in normalized]
+            present = [row >= 0 for row in rows]
+            if self._matrix is None:
+                matrix = np.empty((0, 0), dtype=np.float32)
+            else:
+                matrix = self._matrix[[row for row in rows if row >= 0]]
+        if save_due:
+            run_in_background(self.flush)
+        return matrix, present
+
+
+@st.cache_resource(show_spinner=False)
+def get_skill_embedding_store():
+    """Get the process-wide skill embedding store."""
+    store = SkillEmbeddingStore(path=SKILL_STORE_PATH or None)
+    register_process_cache('skill_embeddings', lambda: store.nbytes, store.trim_to)
+    if store.path:
+        atexit.register(store.flush)
+    return store
@@ -0,0 +1,26 @@
+"""Skill vocabulary module"""
+from .canonical import (
+    SKILL_ALIASES,
+    SkillIndex,
+    get_skill_index,
+    canonicalize_skills,
+    parse_user_skill_ids,
+    job_skill_ids,
+    match_skills_by_id
+)
+from .gaps import SkillGapReport, analyze_skill_gaps
+from .extraction import SKILL_KEYWORDS, extract_skills_from_text
+
+__all__ = [
+    'SKILL_ALIASES',
+    'SkillIndex',
+    'get_skill_index',
+    'canonicalize_skills',
+    'parse_user_skill_ids',
+    'job_skill_ids',
+    'match_skills_by_id',
+    'SkillGapReport',
+    'analyze_skill_gaps',
+    'SKILL_KEYWORDS',
+    'extract_skills_from_text'
+]
@@ -0,0 +1,214 @@
+"""Canonical skill dictionary: every skill spelling resolves to one integer ID"""
+import hashlib
+import re
+import sys
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+
+# Canonical skill name -> alternative spellings seen in job attributes, LLM
+# profiles and resume text. Skills not listed here get an ID derived from
+# their spelling, so they need no registration.
+SKILL_ALIASES = {
+    'Python': ('python3', 'python 3'),
+    'JavaScript': ('js', 'ecmascript', 'java script'),
+    'TypeScript': ('ts',),
+    'Node.js': ('nodejs', 'node', 'node js'),
+    'React': ('reactjs', 'react.js', 'react js'),
+    'Vue.js': ('vue', 'vuejs'),
+    'Angular': ('angularjs', 'angular.js'),
+    'Go': ('golang',),
+    'C++': ('cpp',),
+    'C#': ('csharp', 'c sharp'),
+    'SQL': ('structured query language',),
+    'PostgreSQL': ('postgres', 'psql'),
+    'MongoDB': ('mongo',),
+    'Kubernetes': ('k8s', 'kube'),
+    'Docker': ('docker containers',),
+    'AWS': ('amazon web services',),
+    'GCP': ('google cloud', 'google cloud platform'),
+    'Azure': ('microsoft azure',),
+    'CI/CD': ('ci cd', 'cicd', 'continuous integration'),
+    'REST APIs': ('rest', 'rest api', 'restful', 'restful api', 'restful apis'),
+    'Machine Learning': ('ml',),
+    'Deep Learning': ('dl',),
+    'Artificial Intelligence': ('ai',),
+    'Natural Language Processing': ('nlp',),
+    'Scikit-learn': ('sklearn', 'scikit learn'),
+    'PyTorch': ('torch',),
+    'TensorFlow': ('tensor flow',),
+    'Apache Spark': ('spark',),
+    'Apache Kafka': ('kafka',),
+    'Excel': ('microsoft excel', 'ms excel'),
+    'Power BI': ('powerbi', 'microsoft power bi'),
+    'Data Analysis': ('data analytics',),
+    'Financial Modeling': ('financial modelling',),
+    'Project Management': ('project manager',),
+    'Agile': ('agile methodology', 'agile methodologies'),
+    'Mandarin': ('putonghua', 'mandarin chinese'),
+    'Cantonese': ('cantonese chinese',),
+}
+
+_WHITESPACE = re.compile(r'\s+')
+_SEPARATORS = re.compile(r'[\s\-_.]+')
+
+# Display names kept for skills outside the dictionary, least recently seen dropped first
+MAX_ADHOC_NAMES = 20000
+# IDs of skills outside the dictionary are 48-bit hashes offset past the dictionary
+_ADHOC_ID_BYTES = 6
+
+
+def _normalize(skill):
+    return _WHITESPACE.sub(' ', skill.strip().lower())
+
+
+def _compact(normalized):
+    """Spelling-insensitive key: "Power-BI", "power bi" and "powerbi" all become "powerbi"."""
+    return _SEPARATORS.sub('', normalized)
+
+
+class SkillIndex:
+    """Alias hash index mapping skill strings to integer IDs.
+
+    Dictionary skills get dense IDs. Any other skill gets an ID hashed from
+    its spelling-insensitive form, so the same string always has the same ID
+    (IDs stored on job records never go stale) and the index does not grow
+    with every string seen in job attributes. Only the display names of those
+    skills are kept, in a bounded LRU.
+    """
+    def __init__(self, aliases=SKILL_ALIASES, max_adhoc_names=MAX_ADHOC_NAMES):
+        self._ids = {}
+        self._names = []
+        self._adhoc_names = OrderedDict()
+        self.max_adhoc_names = max_adhoc_names
+        self._lock = threading.Lock()
+        for name, spellings in aliases.items():
+            skill_id = self._register(name)
+            for spelling in spellings:
+                self._alias(spelling, skill_id)
+
+    def __len__(self):
+        return len(self._names) + len(self._adhoc_names)
+
+    @property
+    def nbytes(self):
+        """Approximate size of the ad-hoc names, the only part that grows."""
+        with self._lock:
+            return sys.getsizeof(self._adhoc_names) + sum(sys.getsizeof(name) for name in self._adhoc_names.values())
+
+    def _register(self, name):
+        skill_id = len(self._names)
+        self._names.append(name)
+        self._alias(name, skill_id)
+        return skill_id
+
+    def _alias(self, spelling, skill_id):
+        normalized = _normalize(spelling)
+        self._ids.setdefault(normalized, skill_id)
+        self._ids.setdefault(_compact(normalized), skill_id)
+
+    def lookup(self, skill):
+        """Return the dictionary ID for skill, or None if it is not in the dictionary."""
+        if not isinstance(skill, str):
+            return None
+        normalized = _normalize(skill)
+        if not normalized:
+            return None
+        skill_id = self._ids.get(normalized)
+        if skill_id is None:
+            skill_id = self._ids.get(_compact(normalized))
+        return skill_id
+
+    def skill_id(self, skill):
+        """Return the ID for skill (None for blank input)."""
+        skill_id = self.lookup(skill)
+        if skill_id is not None or not isinstance(skill, str) or not skill.strip():
+            return skill_id
+        digest = hashlib.blake2b(_compact(_normalize(skill)).encode(), digest_size=_ADHOC_ID_BYTES).digest()
+        skill_id = len(self._names) + int.from_bytes(digest, 'big')
+        with self._lock:
+            # The first spelling seen stays the display name until it is evicted
+            self._adhoc_names.setdefault(skill_id, skill.strip())
+            self._adhoc_names.move_to_end(skill_id)
+            while len(self._adhoc_names) > self.max_adhoc_names:
+                self._adhoc_names.popitem(last=False)
+        return skill_id
+
+    def name(self, skill_id, default=None):
+        """Canonical display name for an ID (default if its ad-hoc name was evicted)."""
+        if skill_id < len(self._names):
+            return self._names[skill_id]
+        with self._lock:
+            return self._adhoc_names.get(skill_id, default)
+
+    def canonical_name(self, skill):
+        skill_id = self.lookup(skill)
+        if skill_id is not None:
+            return self._names[skill_id]
+        if not isinstance(skill, str) or not skill.strip():
+            return None
+        return self.name(self.skill_id(skill), skill.strip())
+
+    def trim_to(self, max_bytes):
+        """Drop least recently seen ad-hoc names until they fit in max_bytes; returns bytes freed."""
+        freed = 0
+        with self._lock:
+            size = sys.getsizeof(self._adhoc_names) + sum(sys.getsizeof(name) for name in self._adhoc_names.values())
+            while self._adhoc_names and size - freed > max_bytes:
+                _, name = self._adhoc_names.popitem(last=False)
+                freed += sys.getsizeof(name)
+        return freed
+
+
+_skill_index = SkillIndex()
+
+
+def get_skill_index():
+    """Get the process-wide skill index."""
+    return _skill_index
+
+
+def canonicalize_skills(skills):
+    """Map a list of skill strings to IDs, aligned with the input (-1 for blanks)."""
+    index = get_skill_index()
+    ids = []
+    for skill in skills or []:
+        skill_id = index.skill_id(skill)
+        ids.append(-1 if skill_id is None else skill_id)
+    return tuple(ids)
+
+
+@lru_cache(maxsize=256)
+def parse_user_skill_ids(user_skills):
+    """IDs for a comma-separated profile skills string."""
+    if not user_skills:
+        return frozenset()
+    return frozenset(i for i in canonicalize_skills(str(user_skills).split(',')) if i >= 0)
+
+
+def job_skill_ids(job):
+    """IDs aligned with job['skills'], computed at ingest or on first use."""
+    skills = job.get('skills', []) or []
+    skill_ids = job.get('skill_ids')
+    if skill_ids is None or len(skill_ids) != len(skills):
+        skill_ids = canonicalize_skills(skills)
+        job['skill_ids'] = skill_ids
+    return skill_ids
+
+
+def match_skills_by_id(user_ids, job_skills, skill_ids):
+    """Score job skills against the user's skill IDs by set membership.
+
+    Returns (match_score, missing_skills) with up to five missing skills in
+    their original spelling.
+    """
+    positions = [
+        (skill.strip(), skill_id)
+        for skill, skill_id in zip(job_skills, skill_ids)
+        if skill_id >= 0 and isinstance(skill, str)
+    ]
+    if not user_ids or not positions:
+        return 0.0, []
+    matched = sum(1 for _, skill_id in positions if skill_id in user_ids)
+    missing_skills = [skill for skill, skill_id in positions if skill_id not in user_ids]
+    return min(matched / len(positions), 1.0), missing_skills[:5]
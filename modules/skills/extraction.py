@@ -0,0 +1,144 @@
+"""Keyword-based skill extraction from job postings"""
+import re
+
+MAX_EXTRACTED_SKILLS = 15
+
+# Technical and professional skills looked for in postings, organized by
+# category for maintainability
+SKILL_KEYWORDS = frozenset({
+    # Programming Languages
+    'python', 'java', 'javascript', 'typescript', 'c++', 'c#', 'ruby', 'go', 'golang',
+    'rust', 'swift', 'kotlin', 'php', 'scala', 'r', 'matlab', 'perl', 'shell', 'bash',
+    'powershell', 'sql', 'nosql', 'html', 'css', 'sass', 'less',
+
+    # Frameworks & Libraries
+    'react', 'angular', 'vue', 'vue.js', 'node.js', 'nodejs', 'express', 'django',
+    'flask', 'spring', 'spring boot', '.net', 'asp.net', 'laravel', 'rails',
+    'ruby on rails', 'fastapi', 'next.js', 'nuxt', 'svelte', 'jquery', 'bootstrap',
+    'tailwind', 'tensorflow', 'pytorch', 'keras', 'scikit-learn', 'pandas', 'numpy',
+
+    # Cloud & DevOps
+    'aws', 'amazon web services', 'azure', 'gcp', 'google cloud', 'docker', 'kubernetes',
+    'k8s', 'jenkins', 'gitlab', 'github actions', 'terraform', 'ansible', 'puppet',
+    'chef', 'ci/cd', 'devops', 'cloud computing', 'microservices', 'serverless',
+
+    # Databases
+    'mysql', 'postgresql', 'postgres', 'mongodb', 'redis', 'elasticsearch', 'oracle',
+    'sql server', 'sqlite', 'dynamodb', 'cassandra', 'neo4j', 'firebase',
+
+    # Data & Analytics
+    'data analysis', 'data analytics', 'data science', 'machine learning', 'ml',
+    'deep learning', 'ai', 'artificial intelligence', 'nlp', 'natural language processing',
+    'computer vision', 'big data', 'hadoop', 'spark', 'tableau', 'power bi',
+    'looker', 'data visualization', 'etl', 'data warehouse', 'data engineering',
+    'statistics', 'predictive modeling', 'a/b testing',
+
+    # Finance & Business
+    'financial modeling', 'financial analysis', 'valuation', 'risk management',
+    'investment banking', 'corporate finance', 'accounting', 'audit', 'tax',
+    'budgeting', 'forecasting', 'financial reporting', 'gaap', 'ifrs',
+    'bloomberg', 'excel', 'vba', 'sap', 'erp', 'crm', 'salesforce',
+
+    # Project Management & Methodologies
+    'agile', 'scrum', 'kanban', 'waterfall', 'project management', 'pmp',
+    'jira', 'confluence', 'asana', 'trello', 'monday.com', 'product management',
+    'stakeholder management', 'business analysis', 'requirements gathering',
+
+    # Design & UX
+    'ui/ux', 'ux design', 'ui design', 'user experience', 'user interface',
+    'figma', 'sketch', 'adobe xd', 'photoshop', 'illustrator', 'indesign',
+    'wireframing', 'prototyping', 'design thinking', 'user research',
+
+    # Soft Skills & Business Skills
+    'leadership', 'team management', 'communication', 'presentation',
+    'problem solving', 'critical thinking', 'analytical', 'strategic planning',
+    'negotiation', 'client management', 'customer service', 'sales',
+    'marketing', 'digital marketing', 'seo', 'sem', 'content marketing',
+    'social media', 'brand management',
+
+    # Certifications & Standards
+    'cpa', 'cfa', 'frm', 'acca', 'hkicpa', 'aws certified', 'azure certified',
+    'pmp certified', 'scrum master', 'six sigma', 'itil', 'cissp', 'cism',
+
+    # Industry-Specific
+    'fintech', 'blockchain', 'cryptocurrency', 'defi', 'web3', 'smart contracts',
+    'solidity', 'esg', 'sustainability', 'compliance', 'regulatory', 'kyc', 'aml',
+    'gdpr', 'cybersecurity', 'information security', 'penetration testing',
+
+    # Languages
+    'english', 'mandarin', 'cantonese', 'chinese', 'japanese', 'korean',
+    'french', 'german', 'spanish', 'bilingual', 'multilingual'
+})
+
+# Display names for acronyms and proper names that str.title() gets wrong
+DISPLAY_NAMES = {
+    'aws': 'AWS', 'gcp': 'GCP', 'sql': 'SQL', 'nosql': 'NoSQL',
+    'html': 'HTML', 'css': 'CSS', 'api': 'API', 'rest': 'REST',
+    'ai': 'AI', 'ml': 'ML', 'nlp': 'NLP', 'ui/ux': 'UI/UX',
+    'ci/cd': 'CI/CD', 'k8s': 'Kubernetes', 'nodejs': 'Node.js',
+    'vue.js': 'Vue.js', 'next.js': 'Next.js', 'react': 'React',
+    'angular': 'Angular', 'django': 'Django', 'flask': 'Flask',
+    'python': 'Python', 'java': 'Java', 'javascript': 'JavaScript',
+    'typescript': 'TypeScript', 'golang': 'Go', 'cpa': 'CPA',
+    'cfa': 'CFA', 'pmp': 'PMP', 'esg': 'ESG', 'kyc': 'KYC',
+    'aml': 'AML', 'gdpr': 'GDPR', 'erp': 'ERP', 'crm': 'CRM',
+    'seo': 'SEO', 'sem': 'SEM', 'vba': 'VBA', 'sap': 'SAP'
+}
+
+# Characters that re.IGNORECASE matches to an ASCII letter but str.lower() keeps
+# distinct (dotless i, long s); folded before the substring pre-check
+_CASE_FOLDS = str.maketrans({'\u0131': 'i', '\u017f': 's'})
+
+_skill_patterns = None
+
+
+def _get_skill_patterns():
+    """(skill, compiled patterns) for every keyword, compiled on first use."""
+    global _skill_patterns
+    if _skill_patterns is None:
+        patterns = []
+        for skill in SKILL_KEYWORDS:
+            escaped = re.escape(skill)
+            if len(skill) <= 2:
+                # For very short skills (R, AI, ML), use stricter matching
+                sources = (
+                    rf'\b{escaped}\b',  # Exact word boundary
+                    rf'\b{escaped}[,\s\.]',  # Followed by punctuation
+                    rf'[\s\(]{escaped}[\s\)\.]'  # Surrounded by spaces/parens
+                )
+            else:
+                sources = (rf'\b{escaped}\b',)
+            patterns.append((skill, tuple(re.compile(source, re.IGNORECASE) for source in sources)))
+        _skill_patterns = patterns
+    return _skill_patterns
+
+
+def extract_skills_from_text(text, title=""):
+    """Extract skills from job description text using keyword matching.
+
+    This provides accurate skill extraction from job descriptions rather than
+    relying on the API's 'attributes' field which contains job attributes, not skills.
+    Skills that also appear in the title are listed first.
+    """
+    if not text:
+        return []
+
+    # Combine title and description for better skill detection
+    full_text = f"{title} {text}".lower()
+
+    # Every pattern contains the skill verbatim, so a substring check rules
+    # out most of the ~220 keywords before any regex runs
+    folded_text = full_text.translate(_CASE_FOLDS)
+
+    found_skills = []
+    for skill, patterns in _get_skill_patterns():
+        if skill not in folded_text:
+            continue
+        # Word boundaries avoid partial matches: 'r' matches "R programming" but not "programming"
+        if any(pattern.search(full_text) for pattern in patterns):
+            display_skill = skill.title() if skill.islower() else skill
+            found_skills.append(DISPLAY_NAMES.get(skill, display_skill))
+
+    title_lower = title.lower()
+    found_skills.sort(key=lambda s: (s.lower() not in title_lower, s))
+    return found_skills[:MAX_EXTRACTED_SKILLS]
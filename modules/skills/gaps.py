@@ -0,0 +1,100 @@
+"""Skill gap aggregation over a result set using a shared skill-ID vocabulary"""
+from dataclasses import dataclass
+from functools import lru_cache
+from .canonical import get_skill_index, canonicalize_skills, parse_user_skill_ids, job_skill_ids
+
+# Lazy import for numpy - only load when needed
+_np = None
+
+
+def _get_numpy():
+    """Lazy load numpy"""
+    global _np
+    if _np is None:
+        import numpy as np
+        _np = np
+    return _np
+
+
+@dataclass(frozen=True)
+class SkillGapReport:
+    """Skill overlap between the user and every job in a result set.
+
+    Per-job tuples are aligned with the order of the jobs that were analyzed.
+    Skill strings keep the job's original spelling; top_missing uses canonical
+    names with the number of jobs asking for each skill.
+    """
+    gap_count: int
+    top_missing: tuple
+    job_matching_skills: tuple
+    job_missing_skills: tuple
+    job_matched_counts: tuple
+    job_skill_counts: tuple
+
+
+def _job_skill_entries(job):
+    """(skill ids, skill strings) for a job, deduplicated by ID."""
+    skills = job.get('skills', []) or []
+    seen = {}
+    for skill, skill_id in zip(skills, job_skill_ids(job)):
+        if skill_id >= 0 and skill_id not in seen:
+            seen[skill_id] = skill.strip()
+    return tuple(seen), tuple(seen.values())
+
+
+@lru_cache(maxsize=32)
+def _analyze(user_ids, jobs_key):
+    np = _get_numpy()
+
+    # Sparse job x skill incidence: one (job, skill id) pair per distinct skill
+    lengths = np.array([len(ids) for ids, _ in jobs_key], dtype=np.int64)
+    flat_ids = np.fromiter((i for ids, _ in jobs_key for i in ids), dtype=np.int64, count=int(lengths.sum()))
+    flat_jobs = np.repeat(np.arange(len(jobs_key), dtype=np.int64), lengths)
+    # Skill IDs are sparse (ad-hoc skills are hashed), so count over the IDs present
+    vocab, flat_positions = np.unique(flat_ids, return_inverse=True)
+
+    matched = np.isin(vocab, np.fromiter(user_ids, dtype=np.int64, count=len(user_ids)))[flat_positions]
+    matched_counts = np.bincount(flat_jobs[matched], minlength=len(jobs_key))
+    gap_job_counts = np.bincount(flat_positions[~matched], minlength=len(vocab))
+
+    gap_positions = np.flatnonzero(gap_job_counts)
+    # Most requested first; ties keep ID order
+    order = gap_positions[np.argsort(-gap_job_counts[gap_positions], kind='stable')]
+    skill_index = get_skill_index()
+    spellings = {}
+    for ids, names in jobs_key:
+        for skill_id, name in zip(ids, names):
+            spellings.setdefault(skill_id, name)
+    top_missing = tuple(
+        (skill_index.name(int(vocab[i]), spellings[int(vocab[i])]), int(gap_job_counts[i])) for i in order
+    )
+
+    matching, missing = [], []
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    for job_idx, (_, names) in enumerate(jobs_key):
+        job_matched = matched[offsets[job_idx]:offsets[job_idx + 1]]
+        matching.append(tuple(name for name, hit in zip(names, job_matched) if hit))
+        missing.append(tuple(name for name, hit in zip(names, job_matched) if not hit))
+
+    return SkillGapReport(
+        gap_count=int(len(gap_positions)),
+        top_missing=top_missing,
+        job_matching_skills=tuple(matching),
+        job_missing_skills=tuple(missing),
+        job_matched_counts=tuple(int(c) for c in matched_counts),
+        job_skill_counts=tuple(int(n) for n in lengths),
+    )
+
+
+def analyze_skill_gaps(matched_jobs, user_skills):
+    """Build (or reuse) the SkillGapReport for matched_jobs and a profile skills string.
+
+    Reports are memoized per result set, so every dashboard section can call
+    this on each rerun without repeating the work.
+    """
+    if isinstance(user_skills, (list, tuple)):
+        user_ids = frozenset(i for i in canonicalize_skills(user_skills) if i >= 0)
+    else:
+        user_ids = parse_user_skill_ids(user_skills or '')
+    jobs_key = tuple(_job_skill_entries(result['job']) for result in matched_jobs)
+    return _analyze(user_ids, jobs_key)
@@ -12,6 +12,7 @@ from .dashboard import (
 )
 from .resume_editor import display_resume_generator, render_structured_resume_editor
 from .match_feedback import display_match_score_feedback
+from .diagnostics import display_diagnostics_page
 
 __all__ = [
     'render_sidebar',
@@ -25,5 +26,6 @@ __all__ = [
     'display_resume_generator',
     'display_skill_matching_matrix',
     'display_match_score_feedback',
-    'render_structured_resume_editor'
+    'render_structured_resume_editor',
+    'display_diagnostics_page'
 ]
@@ -0,0 +1,123 @@
+"""Static UI assets: CSS/JS minified once per process and served from static/ by content hash
+
+Sources live in static/ next to app_new.py. The first request for an asset
+minifies it and writes static/<name>.<hash>.min.<ext>, which Streamlit serves
+at app/static/... (server.enableStaticServing). The content hash in the file
+name lets browsers cache it indefinitely, and tells render_styles() whether a
+session already has the current version. When static serving is off, the
+directory is read-only, or the Streamlit version would serve the type as
+text/plain, callers fall back to inlining the minified text.
+"""
+import hashlib
+import os
+import re
+import threading
+from dataclasses import dataclass
+
+import streamlit as st
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'static')
+STATIC_URL = 'app/static'
+
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+_CSS_WHITESPACE = re.compile(r'\s+')
+# Whitespace around these is never significant; ':' is left alone since "a :hover" differs from "a:hover"
+_CSS_PUNCTUATION = re.compile(r'\s*([{};,>])\s*')
+_JS_LINE_COMMENT = re.compile(r'^\s*//.*$', re.M)
+
+
+@dataclass(frozen=True)
+class Asset:
+    """A minified asset: its text for inlining and, when it is being served, its URL."""
+    name: str
+    text: str
+    digest: str
+    url: str = None
+
+
+_assets = {}
+_assets_lock = threading.Lock()
+
+
+def minify_css(css):
+    """Strip comments and insignificant whitespace."""
+    css = _CSS_COMMENT.sub('', css)
+    css = _CSS_WHITESPACE.sub(' ', css)
+    css = _CSS_PUNCTUATION.sub(r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+def minify_js(js):
+    """Drop indentation, blank lines and whole-line comments.
+
+    Line breaks are kept so automatic semicolon insertion behaves exactly as
+    in the source; this is deliberately not a full JS minifier.
+    """
+    js = _JS_LINE_COMMENT.sub('', js)
+    return '\n'.join(line.strip() for line in js.splitlines() if line.strip())
+
+
+_MINIFIERS = {'.css': minify_css, '.js': minify_js}
+
+
+def _static_serving_enabled():
+    try:
+        return bool(st.get_option('server.enableStaticServing'))
+    except Exception:
+        return False
+
+
+def _served_with_content_type(extension):
+    """Older Streamlit servers send files outside an allow-list as text/plain with nosniff."""
+    try:
+        from streamlit.web.server.app_static_file_handler import SAFE_APP_STATIC_FILE_EXTENSIONS
+    except ImportError:
+        return True
+    return extension in SAFE_APP_STATIC_FILE_EXTENSIONS
+
+
+def _write_build(path, text):
+    if os.path.exists(path):
+        return
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+def _build(name):
+    stem, extension = os.path.splitext(name)
+    with open(os.path.join(STATIC_DIR, name), encoding='utf-8') as f:
+        text = _MINIFIERS[extension](f.read())
+    digest = hashlib.sha256(text.encode('utf-8')).hexdigest()[:12]
+    url = None
+    if _static_serving_enabled() and _served_with_content_type(extension):
+        built_name = f"{stem}.{digest}.min{extension}"
+        try:
+            _write_build(os.path.join(STATIC_DIR, built_name), text)
+            url = f"{STATIC_URL}/{built_name}"
+        except OSError:
+            # Read-only deployment: inline instead
+            pass
+    return Asset(name, text, digest, url)
+
+
+def get_asset(name):
+    """The minified asset for static/<name> (.css or .js), built once per process."""
+    with _assets_lock:
+        asset = _assets.get(name)
+        if asset is None:
+            asset = _assets[name] = _build(name)
+    return asset
+
+
+def static_file_url(name):
+    """app/static URL for an unprocessed file in static/ (images), or None when it cannot be served."""
+    if _static_serving_enabled() and os.path.exists(os.path.join(STATIC_DIR, name)):
+        return f"{STATIC_URL}/{name}"
+    return None
+
+
+def clear_assets():
+    with _assets_lock:
+        _assets.clear()
@@ -1,11 +1,10 @@
 """Dashboard display components"""
 import streamlit as st
-import pandas as pd
-import gc
-from modules.analysis import calculate_salary_band, filter_jobs_by_domains, filter_jobs_by_salary
-from modules.semantic_search import SemanticJobSearch, fetch_jobs_with_cache, generate_and_store_resume_embedding
-from modules.utils import get_embedding_generator, get_job_scraper, get_text_generator
-from modules.utils.config import _determine_index_limit
+from modules.analysis import calculate_salary_band, prefetch_recruiter_notes, get_recruiter_note
+from modules.jobs import job_hash
+from modules.pipeline import MatchingPipeline, MatchingRequest, build_search_query
+from modules.skills import parse_user_skill_ids, job_skill_ids, match_skills_by_id, analyze_skill_gaps
+from modules.utils import get_embedding_generator, get_job_scraper
 
 
 def display_skill_matching_matrix(user_profile):
@@ -87,9 +86,9 @@ def display_skill_matching_matrix(user_profile):
         st.markdown("""
         **String Matching** (Fallback)
         - Used when semantic matching unavailable
-        - Direct text comparison
+        - Canonical skill comparison
         - Case-insensitive matching
-        - Handles partial matches
+        - Handles common aliases (e.g., "k8s" = "Kubernetes")
         """)
     
     if 'matched_jobs' in st.session_state and st.session_state.matched_jobs:
@@ -107,21 +106,9 @@ def display_skill_matching_matrix(user_profile):
                 st.markdown(f"**{job.get('title', 'Job')} at {job.get('company', 'Company')}**")
                 st.markdown(f"**Match Score: {int(skill_score * 100)}%** ({matched_count}/{len(job_skills)} skills matched)")
                 
-                job_skills_lower = [s.lower().strip() for s in job_skills if isinstance(s, str)]
-                user_skills_lower = [s.lower().strip() for s in user_skills_list]
-                
-                matched_skills_list = []
-                missing_skills_list = []
-                
-                for js in job_skills_lower:
-                    matched = False
-                    for us in user_skills_lower:
-                        if js in us or us in js:
-                            matched_skills_list.append(js)
-                            matched = True
-                            break
-                    if not matched:
-                        missing_skills_list.append(js)
+                gap_report = analyze_skill_gaps([top_match], user_skills_list)
+                matched_skills_list = gap_report.job_matching_skills[0]
+                missing_skills_list = gap_report.job_missing_skills[0]
                 
                 if matched_skills_list:
                     st.success(f"✅ **Matched Skills:** {', '.join(matched_skills_list[:5])}")
@@ -162,20 +149,7 @@ def display_market_positioning_profile(matched_jobs, user_profile):
     else:
         salary_delta = "Market rate"
     
-    user_skills = user_profile.get('skills', '')
-    all_job_skills = []
-    for result in matched_jobs:
-        all_job_skills.extend(result['job'].get('skills', []))
-    
-    user_skills_list = [s.lower().strip() for s in str(user_skills).split(',') if s.strip()]
-    skill_gaps = set()
-    for job_skill in all_job_skills:
-        if isinstance(job_skill, str):
-            job_skill_lower = job_skill.lower().strip()
-            if job_skill_lower and not any(us in job_skill_lower or job_skill_lower in us for us in user_skills_list):
-                skill_gaps.add(job_skill_lower)
-    
-    num_skill_gaps = len(skill_gaps)
+    num_skill_gaps = analyze_skill_gaps(matched_jobs, user_profile.get('skills', '')).gap_count
     
     if num_skill_gaps <= 3:
         gap_delta = "Well positioned"
@@ -313,14 +287,6 @@ def display_refine_results_section(matched_jobs, user_profile):
             st.session_state.target_domains = target_domains
             st.session_state.salary_expectation = salary_expectation
             
-            # Build search query
-            if job_keywords.strip():
-                search_query = job_keywords.strip()
-            elif target_domains:
-                search_query = " ".join(target_domains)
-            else:
-                search_query = "jobs"
-            
             scraper = get_job_scraper()
             
             if scraper is None:
@@ -328,17 +294,25 @@ def display_refine_results_section(matched_jobs, user_profile):
                 return
             
             with st.spinner(f"🔄 Refreshing results from Indeed ({city_region})..."):
-                jobs = fetch_jobs_with_cache(
-                    scraper,
-                    search_query,
-                    location=city_region,
-                    max_rows=25,
-                    job_type="fulltime",
-                    country=COUNTRY_OPTIONS[selected_country],
-                    force_refresh=force_refresh
+                pipeline = MatchingPipeline(scraper, get_embedding_generator(), overlap=True)
+                result = pipeline.run(
+                    MatchingRequest(
+                        search_query=build_search_query(job_keywords, target_domains),
+                        location=city_region,
+                        country=COUNTRY_OPTIONS[selected_country],
+                        target_domains=target_domains,
+                        salary_expectation=salary_expectation,
+                        force_refresh=force_refresh
+                    ),
+                    resume_text=st.session_state.resume_text,
+                    user_profile=st.session_state.user_profile,
+                    resume_embedding=st.session_state.get('resume_embedding')
                 )
                 
-                if not jobs:
+                if result.resume_embedding is not None:
+                    st.session_state.resume_embedding = result.resume_embedding
+                
+                if result.status == 'no_jobs':
                     # Note: Detailed error messages are shown by IndeedScraperAPI
                     # This is a fallback message if no specific error was shown
                     st.error(
@@ -350,62 +324,13 @@ def display_refine_results_section(matched_jobs, user_profile):
                     )
                     return
                 
-                total_fetched = len(jobs)
-                
-                if target_domains:
-                    jobs = filter_jobs_by_domains(jobs, target_domains)
-                
-                if salary_expectation > 0:
-                    jobs = filter_jobs_by_salary(jobs, salary_expectation)
-                
-                if not jobs:
-                    st.warning(f"⚠️ No jobs match your filters. Found {total_fetched} jobs but none passed your criteria.")
+                if result.status == 'no_filtered_jobs':
+                    st.warning(f"⚠️ No jobs match your filters. Found {result.total_fetched} jobs but none passed your criteria.")
                     return
                 
-                embedding_gen = get_embedding_generator()
-                desired_matches = min(15, len(jobs))
-                jobs_to_index_limit = _determine_index_limit(len(jobs), desired_matches)
-                top_match_count = min(desired_matches, jobs_to_index_limit)
-                search_engine = SemanticJobSearch(embedding_gen)
-                search_engine.index_jobs(jobs, max_jobs_to_index=jobs_to_index_limit)
-                
-                resume_embedding = st.session_state.get('resume_embedding')
-                if not resume_embedding and st.session_state.resume_text:
-                    resume_embedding = generate_and_store_resume_embedding(
-                        st.session_state.resume_text,
-                        st.session_state.user_profile if st.session_state.user_profile else None
-                    )
-                
-                resume_query = None
-                if not resume_embedding:
-                    if st.session_state.resume_text:
-                        resume_query = st.session_state.resume_text
-                        if st.session_state.user_profile.get('summary'):
-                            profile_data = f"{st.session_state.user_profile.get('summary', '')} {st.session_state.user_profile.get('experience', '')} {st.session_state.user_profile.get('skills', '')}"
-                            resume_query = f"{resume_query} {profile_data}"
-                    else:
-                        resume_query = f"{st.session_state.user_profile.get('summary', '')} {st.session_state.user_profile.get('experience', '')} {st.session_state.user_profile.get('skills', '')} {st.session_state.user_profile.get('education', '')}"
-                
-                results = search_engine.search(query=resume_query, top_k=top_match_count, resume_embedding=resume_embedding)
-                
-                user_skills = st.session_state.user_profile.get('skills', '')
-                for result in results:
-                    job_skills = result['job'].get('skills', [])
-                    skill_score, missing_skills = search_engine.calculate_skill_match(user_skills, job_skills)
-                    result['skill_match_score'] = skill_score
-                    result['missing_skills'] = missing_skills
-                    
-                    semantic_score = result.get('similarity_score', 0.0)
-                    combined_score = (semantic_score * 0.6) + (skill_score * 0.4)
-                    result['combined_match_score'] = combined_score
-                
-                results.sort(key=lambda x: x.get('combined_match_score', 0.0), reverse=True)
-                
-                st.session_state.matched_jobs = results
+                st.session_state.matched_jobs = result.matches
                 st.session_state.dashboard_ready = True
                 
-                gc.collect()
-                
                 st.rerun()
 
 
@@ -418,29 +343,17 @@ def display_ranked_matches_table(matched_jobs, user_profile):
     st.markdown("### Top AI-Ranked Opportunities")
     st.caption("💡 **Tip:** Click any row to expand and see full job description, match analysis, and application copilot")
     
+    # Notes for the top rows are generated in one background call while the user reads the table
+    prefetch_recruiter_notes(matched_jobs, user_profile)
+    
     user_skills = user_profile.get('skills', '')
     
-    def calc_skill_match(user_skills_str, job_skills_list):
-        if not user_skills_str or not job_skills_list:
-            return 0.0, []
-        user_skills_lower = [s.lower().strip() for s in str(user_skills_str).split(',') if s.strip()]
-        job_skills_lower = [s.lower().strip() for s in job_skills_list if isinstance(s, str) and s.strip()]
-        if not user_skills_lower or not job_skills_lower:
-            return 0.0, []
-        matched_skills = []
-        for job_skill in job_skills_lower:
-            for user_skill in user_skills_lower:
-                if job_skill in user_skill or user_skill in job_skill:
-                    matched_skills.append(job_skill)
-                    break
-        match_score = len(matched_skills) / len(job_skills_lower) if job_skills_lower else 0.0
-        missing_skills = [s for s in job_skills_lower if s not in matched_skills]
-        return min(match_score, 1.0), missing_skills[:5]
+    user_skill_ids = parse_user_skill_ids(user_skills)
     
     for result in matched_jobs:
         if 'skill_match_score' not in result:
-            job_skills = result['job'].get('skills', [])
-            skill_score, missing_skills = calc_skill_match(user_skills, job_skills)
+            job = result['job']
+            skill_score, missing_skills = match_skills_by_id(user_skill_ids, job.get('skills', []), job_skill_ids(job))
             result['skill_match_score'] = skill_score
             result['missing_skills'] = missing_skills
         
@@ -452,6 +365,8 @@ def display_ranked_matches_table(matched_jobs, user_profile):
     
     matched_jobs.sort(key=lambda x: x.get('combined_match_score', 0.0), reverse=True)
     
+    gap_report = analyze_skill_gaps(matched_jobs, user_skills)
+    
     table_data = []
     for i, result in enumerate(matched_jobs):
         job = result['job']
@@ -459,16 +374,7 @@ def display_ranked_matches_table(matched_jobs, user_profile):
         skill_score = result.get('skill_match_score', 0.0)
         match_score = result.get('combined_match_score', (semantic_score * 0.6) + (skill_score * 0.4))
         
-        job_skills = job.get('skills', [])
-        matching_skills = []
-        user_skills_list = [s.lower().strip() for s in str(user_skills).split(',') if s.strip()]
-        for js in job_skills[:6]:
-            if isinstance(js, str):
-                js_lower = js.lower().strip()
-                if any(us in js_lower or js_lower in us for us in user_skills_list):
-                    matching_skills.append(js)
-                    if len(matching_skills) >= 4:
-                        break
+        matching_skills = list(gap_report.job_matching_skills[i][:4])
         
         missing_critical = result.get('missing_skills', [])
         missing_critical_skill = missing_critical[0] if missing_critical else "None"
@@ -483,6 +389,8 @@ def display_ranked_matches_table(matched_jobs, user_profile):
             '_index': i
         })
     
+    # pandas costs ~0.3s to import; only pay for it once the table is shown
+    import pandas as pd
     df = pd.DataFrame(table_data)
     
     column_config = {
@@ -555,24 +463,15 @@ def display_match_breakdown(matched_jobs, user_profile):
     skill_score = selected_result.get('skill_match_score', 0.0)
     missing_skills = selected_result.get('missing_skills', [])
     
-    user_skills = user_profile.get('skills', '')
-    job_skills = job.get('skills', [])
-    user_skills_list = [s.lower().strip() for s in str(user_skills).split(',') if s.strip()]
-    job_skills_list = [s.lower().strip() for s in job_skills if isinstance(s, str) and s.strip()]
-    
-    matched_skills_count = 0
-    for js in job_skills_list:
-        if any(us in js or js in us for us in user_skills_list):
-            matched_skills_count += 1
+    gap_report = analyze_skill_gaps(matched_jobs, user_profile.get('skills', ''))
+    selected_index = st.session_state.selected_job_index
+    matched_skills_display = gap_report.job_matching_skills[selected_index]
+    matched_skills_count = gap_report.job_matched_counts[selected_index]
     
-    total_required = len(job_skills_list) if job_skills_list else 1
+    total_required = gap_report.job_skill_counts[selected_index] or 1
     skill_overlap_pct = (matched_skills_count / total_required * 100) if total_required > 0 else 0
     
-    text_gen = get_text_generator()
-    if text_gen is None:
-        recruiter_note = "AI analysis unavailable. Please configure Azure OpenAI credentials."
-    else:
-        recruiter_note = text_gen.generate_recruiter_note(job, user_profile, semantic_score, skill_score)
+    recruiter_note = get_recruiter_note(job, user_profile, semantic_score, skill_score)
     
     rank_position = st.session_state.selected_job_index + 1 if st.session_state.selected_job_index is not None else 0
     
@@ -610,15 +509,8 @@ def display_match_breakdown(matched_jobs, user_profile):
               - Weighted combination: 60% semantic + 40% skill overlap
             """)
             
-            if matched_skills_count > 0:
-                matched_skills_display = []
-                for js in job_skills_list:
-                    if any(us in js or js in us for us in user_skills_list):
-                        matched_skills_display.append(js)
-                        if len(matched_skills_display) >= 10:
-                            break
-                if matched_skills_display:
-                    st.success(f"✅ **Matched Skills:** {', '.join(matched_skills_display[:10])}")
+            if matched_skills_display:
+                st.success(f"✅ **Matched Skills:** {', '.join(matched_skills_display[:10])}")
             
             if missing_skills:
                 st.warning(f"⚠️ **Missing Skills:** {', '.join(missing_skills[:5])}")
@@ -640,7 +532,7 @@ def display_match_breakdown(matched_jobs, user_profile):
                     st.warning(f"⚠️ **Skill Gap:** Consider developing expertise in {top_missing}.")
             
             if st.button("✨ Tailor Resume for this Job", use_container_width=True, type="primary", key="tailor_resume_button"):
-                st.session_state.selected_job = job
+                st.session_state.selected_job_id = job_hash(job)
                 st.session_state.show_resume_generator = True
                 st.rerun()
             
@@ -0,0 +1,105 @@
+"""Admin diagnostics page: recent profiles, traces and cache statistics"""
+import time
+import streamlit as st
+from modules.utils import get_memory_usage, get_recent_spans, format_trace, metrics_summary, get_profiles, clear_profiles
+
+RECENT_TRACES = 10
+
+
+def _format_mb(num_bytes):
+    return f"{num_bytes / (1024 * 1024):.1f} MB"
+
+
+def _display_profiles():
+    st.markdown("### 🔬 Profiles")
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        if st.session_state.get('profiling_enabled'):
+            st.caption("Profiling is on for this session. Add `&profile=0` to the URL to stop.")
+        else:
+            st.caption("Profiling is off for this session. Add `&profile=1` to the URL (or set PROFILING_ENABLED) to record script runs.")
+    with col2:
+        if st.button("Clear profiles", key="diagnostics_clear_profiles"):
+            clear_profiles()
+            st.rerun()
+
+    profiles = get_profiles()
+    if not profiles:
+        st.info("No profiles recorded yet.")
+        return
+    labels = [
+        f"{time.strftime('%H:%M:%S', time.localtime(profile['started_at']))} · {profile['name']} · "
+        f"{profile['duration_s']:.2f}s · session {str(profile['session'])[:8]}"
+        for profile in profiles
+    ]
+    index = st.selectbox("Profile", range(len(profiles)), format_func=lambda i: labels[i],
+                         key="diagnostics_profile_index")
+    profile = profiles[index]
+    if profile['peak_traced_kb'] is not None:
+        st.caption(f"Peak traced memory: {profile['peak_traced_kb']:,.0f} KB")
+
+    st.markdown("**Top functions** (by cumulative time)")
+    if profile['top_functions']:
+        st.dataframe(profile['top_functions'], use_container_width=True, hide_index=True)
+    else:
+        st.caption("CPU profiler was busy with another run; only allocations were captured.")
+    st.markdown("**Top allocations** (growth during the run)")
+    if profile['top_allocations']:
+        st.dataframe(profile['top_allocations'], use_container_width=True, hide_index=True)
+    else:
+        st.caption("No allocation data (tracemalloc was started outside the profiler).")
+
+
+def _display_traces():
+    st.markdown("### 🧭 Recent Traces")
+    spans = get_recent_spans()
+    traces = {}
+    for span in spans:
+        traces.setdefault(span['trace_id'], []).append(span)
+    roots = [span for span in spans if span['parent_id'] is None][-RECENT_TRACES:]
+    if not roots:
+        st.info("No traces recorded yet.")
+        return
+    for root in reversed(roots):
+        started = time.strftime('%H:%M:%S', time.localtime(root['start_time']))
+        status = "❌" if root['status'] == 'error' else "✅"
+        with st.expander(f"{status} {started} · {root['name']} · {root['duration_ms']:,.0f} ms"):
+            st.code(format_trace(traces[root['trace_id']]), language=None)
+
+
+def _display_cache_stats():
+    st.markdown("### 🗄️ Caches")
+    usage = get_memory_usage()
+    summary = metrics_summary()
+    col1, col2, col3 = st.columns(3)
+    col1.metric("This session", _format_mb(usage['session_total']), help=f"Budget {_format_mb(usage['session_budget'])}")
+    col2.metric("Process", _format_mb(usage['process_total']), help=f"Budget {_format_mb(usage['process_budget'])}")
+    col3.metric("Live sessions", usage['session_count'])
+
+    ratios = summary['cache_hit_ratio']
+    rows = [
+        {'cache': name, 'size': _format_mb(size), 'hit_ratio': ratios.get(name)}
+        for name, size in sorted(usage['process'].items(), key=lambda item: item[1], reverse=True)
+    ]
+    rows += [{'cache': name, 'size': None, 'hit_ratio': ratio} for name, ratio in ratios.items() if name not in usage['process']]
+    if rows:
+        st.dataframe(rows, use_container_width=True, hide_index=True)
+
+    if summary['stages']:
+        st.markdown("**Pipeline stages**")
+        st.dataframe([{'stage': stage, **stats} for stage, stats in summary['stages'].items()],
+                     use_container_width=True, hide_index=True)
+
+
+def display_diagnostics_page():
+    """Admin-only page reached through ?admin=<ADMIN_TOKEN>&diagnostics=1 or the sidebar button."""
+    st.markdown('<h1 class="main-header">🩺 Diagnostics</h1>', unsafe_allow_html=True)
+    if st.button("← Back to Jobs"):
+        st.session_state.show_diagnostics = False
+        st.rerun()
+    st.markdown("---")
+    _display_profiles()
+    st.markdown("---")
+    _display_traces()
+    st.markdown("---")
+    _display_cache_stats()
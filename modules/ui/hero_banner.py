@@ -4,7 +4,7 @@ from .styles import get_logo_html
 
 
 def render_hero_banner(user_profile, matched_jobs=None):
-    """Render the Modern Hero banner with personalized welcome message and Base64 logo watermark"""
+    """Render the Modern Hero banner with personalized welcome message and logo watermark"""
     user_name = user_profile.get('name', '') if user_profile else ''
     if not user_name or user_name == 'N/A':
         user_name = 'Professional'
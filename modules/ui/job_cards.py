@@ -1,5 +1,6 @@
 """Job card display components"""
 import streamlit as st
+from modules.jobs import job_hash
 
 
 def display_job_card(result, index):
@@ -72,6 +73,6 @@ def display_job_card(result, index):
                 st.link_button("Apply →", job['url'], use_container_width=True)
         with col2b:
             if st.button("📄 Resume", key=f"resume_{index}", use_container_width=True, type="primary"):
-                st.session_state.selected_job = job
+                st.session_state.selected_job_id = job_hash(job)
                 st.session_state.show_resume_generator = True
                 st.rerun()
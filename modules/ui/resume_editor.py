@@ -4,6 +4,8 @@ import streamlit as st
 import time
 import requests
 from modules.utils import get_text_generator, get_embedding_generator, api_call_with_retry
+from modules.semantic_search import get_job_embedding, get_job_hash
+from modules.jobs import get_job_store
 from .match_feedback import display_match_score_feedback
 
 # Lazy imports for heavy resume generation modules (docx, reportlab)
@@ -98,7 +100,7 @@ Return ONLY the improved summary text, no additional explanation."""
                             def make_request():
                                 return requests.post(text_gen.url, headers=text_gen.headers, json=payload, timeout=30)
                             
-                            response = api_call_with_retry(make_request, max_retries=2)
+                            response = api_call_with_retry(make_request, max_retries=2, provider='azure_openai', endpoint='chat')
                             if response and response.status_code == 200:
                                 result = response.json()
                                 refined_text = result['choices'][0]['message']['content'].strip()
@@ -190,7 +192,7 @@ Return ONLY the improved bullet point, no additional text."""
                                         def make_request():
                                             return requests.post(text_gen.url, headers=text_gen.headers, json=payload, timeout=30)
                                         
-                                        response = api_call_with_retry(make_request, max_retries=2)
+                                        response = api_call_with_retry(make_request, max_retries=2, provider='azure_openai', endpoint='chat')
                                         if response and response.status_code == 200:
                                             result = response.json()
                                             refined_text = result['choices'][0]['message']['content'].strip()
@@ -237,17 +239,30 @@ Return ONLY the improved bullet point, no additional text."""
     return edited_data
 
 
+def _get_selected_job():
+    """Resolve the selected job ID through the shared job store."""
+    job_id = st.session_state.get('selected_job_id')
+    if not job_id:
+        return None
+    job = get_job_store().get(job_id)
+    if job is None:
+        # Evicted from the store - the current results still reference it
+        for result in st.session_state.get('matched_jobs') or []:
+            if get_job_hash(result['job']) == job_id:
+                return result['job']
+    return job
+
+
 def display_resume_generator():
     """Display the resume generator interface with structured resume editing"""
-    if st.session_state.selected_job is None:
+    job = _get_selected_job()
+    if job is None:
         st.warning("No job selected. Please select a job first.")
         if st.button("← Back to Jobs"):
             st.session_state.show_resume_generator = False
             st.rerun()
         return
     
-    job = st.session_state.selected_job
-    
     st.markdown('<h1 class="main-header">📄 Resume Generator</h1>', unsafe_allow_html=True)
     
     st.markdown(f"""
@@ -301,7 +316,9 @@ def display_resume_generator():
                     match_score, missing_keywords = text_gen.calculate_match_score(
                         resume_text,
                         job.get('description', ''),
-                        embedding_gen
+                        embedding_gen,
+                        job_embedding=get_job_embedding(job),
+                        job_key=get_job_hash(job)
                     )
                     st.session_state.match_score = match_score
                     st.session_state.missing_keywords = missing_keywords
@@ -403,7 +420,9 @@ def display_resume_generator():
                 match_score, missing_keywords = text_gen.calculate_match_score(
                     resume_text,
                     job.get('description', ''),
-                    embedding_gen
+                    embedding_gen,
+                    job_embedding=get_job_embedding(job),
+                    job_key=get_job_hash(job)
                 )
                 st.session_state.match_score = match_score
                 st.session_state.missing_keywords = missing_keywords
@@ -1,16 +1,9 @@
 """Sidebar UI component"""
 import streamlit as st
 import time
-import gc
-from modules.resume_upload import extract_text_from_resume, extract_profile_from_resume
-from modules.semantic_search import (
-    SemanticJobSearch,
-    fetch_jobs_with_cache,
-    generate_and_store_resume_embedding
-)
-from modules.analysis import filter_jobs_by_domains, filter_jobs_by_salary
-from modules.utils import get_embedding_generator, get_job_scraper, _websocket_keepalive, _ensure_websocket_alive
-from modules.utils.config import _determine_index_limit
+from modules.resume_upload import extract_text_from_resume, extract_profile_with_embedding
+from modules.pipeline import MatchingPipeline, MatchingRequest, build_search_query
+from modules.utils import get_embedding_generator, get_job_scraper, _websocket_keepalive
 from .dashboard import display_skill_matching_matrix
 
 
@@ -49,8 +42,8 @@ def render_sidebar():
                     st.session_state.resume_text = resume_text
                     st.session_state._last_uploaded_file_key = file_key
                     
-                    progress_bar.progress(40, text="🤖 Extracting profile with AI...")
-                    profile_data = extract_profile_from_resume(resume_text)
+                    progress_bar.progress(40, text="🤖 Extracting profile and search embedding with AI...")
+                    profile_data, _ = extract_profile_with_embedding(resume_text)
                     
                     if profile_data:
                         progress_bar.progress(80, text="📊 Finalizing profile...")
@@ -68,9 +61,6 @@ def render_sidebar():
                             'certifications': profile_data.get('certifications', '')
                         }
                         
-                        progress_bar.progress(90, text="🔗 Creating search embedding...")
-                        generate_and_store_resume_embedding(resume_text, st.session_state.user_profile)
-                        
                         progress_bar.progress(100, text="✅ Profile ready!")
                         time.sleep(0.3)
                         progress_bar.empty()
@@ -184,38 +174,41 @@ def render_sidebar():
                 target_domains = st.session_state.get('target_domains', [])
                 salary_expectation = st.session_state.get('salary_expectation', 0)
                 
-                # Build search query: use job keywords if provided, otherwise use domains
-                if job_keywords:
-                    search_query = job_keywords
-                elif target_domains:
-                    search_query = " ".join(target_domains)
-                else:
-                    search_query = "jobs"
-                
                 scraper = get_job_scraper()
                 
                 if scraper is None:
                     st.error("⚠️ Job scraper not configured. Please check your RAPIDAPI_KEY in Streamlit secrets.")
                     return
                 
-                progress_bar = st.progress(0, text="🔍 Starting job search...")
+                embedding_gen = get_embedding_generator()
+                if embedding_gen is None:
+                    st.error("⚠️ Azure OpenAI is not configured.")
+                    return
                 
-                progress_bar.progress(10, text=f"📡 Fetching jobs from Indeed ({city_region}, {country_code.upper()})...")
-                _websocket_keepalive("Connecting to job API...")
+                progress_bar = st.progress(0, text="🔍 Starting job search...")
                 
-                jobs = fetch_jobs_with_cache(
-                    scraper,
-                    search_query,
-                    location=city_region,
-                    max_rows=25,
-                    job_type="fulltime",
-                    country=country_code,
-                    force_refresh=False
+                def on_progress(stage, percent, message):
+                    progress_bar.progress(percent, text=message)
+                    _websocket_keepalive(message)
+                
+                pipeline = MatchingPipeline(scraper, embedding_gen, progress_callback=on_progress, overlap=True)
+                result = pipeline.run(
+                    MatchingRequest(
+                        search_query=build_search_query(job_keywords, target_domains),
+                        location=city_region,
+                        country=country_code,
+                        target_domains=target_domains,
+                        salary_expectation=salary_expectation
+                    ),
+                    resume_text=st.session_state.resume_text,
+                    user_profile=st.session_state.user_profile,
+                    resume_embedding=st.session_state.get('resume_embedding')
                 )
                 
-                _websocket_keepalive("Processing job results...")
+                if result.resume_embedding is not None:
+                    st.session_state.resume_embedding = result.resume_embedding
                 
-                if not jobs:
+                if result.status == 'no_jobs':
                     progress_bar.empty()
                     # Note: Detailed error messages are shown by IndeedScraperAPI
                     # This is a fallback message if no specific error was shown
@@ -230,101 +223,29 @@ def render_sidebar():
                         )
                     return
                 
-                total_fetched = len(jobs)
-                progress_bar.progress(30, text=f"✅ Found {total_fetched} jobs, applying filters...")
-                _websocket_keepalive()
-                
-                if target_domains:
-                    jobs = filter_jobs_by_domains(jobs, target_domains)
-                
-                if salary_expectation > 0:
-                    jobs = filter_jobs_by_salary(jobs, salary_expectation)
-                
-                if not jobs:
+                if result.status == 'no_filtered_jobs':
                     progress_bar.empty()
-                    st.warning(f"⚠️ No jobs match your filters. Found {total_fetched} jobs but none passed your criteria. Try reducing salary or selecting different domains.")
+                    st.warning(f"⚠️ No jobs match your filters. Found {result.total_fetched} jobs but none passed your criteria. Try reducing salary or selecting different domains.")
                     return
                 
-                progress_bar.progress(40, text=f"📊 Analyzing {len(jobs)} matching jobs...")
-                _websocket_keepalive("Initializing analysis engine...")
-                
-                embedding_gen = get_embedding_generator()
-                if embedding_gen is None:
-                    progress_bar.empty()
-                    st.error("⚠️ Azure OpenAI is not configured.")
-                    return
-                
-                desired_matches = min(15, len(jobs))
-                jobs_to_index_limit = _determine_index_limit(len(jobs), desired_matches)
-                top_match_count = min(desired_matches, jobs_to_index_limit)
-                search_engine = SemanticJobSearch(embedding_gen)
-                
-                progress_bar.progress(50, text=f"🔗 Creating job embeddings ({jobs_to_index_limit} jobs)...")
-                _websocket_keepalive("Creating job embeddings...")
-                search_engine.index_jobs(jobs, max_jobs_to_index=jobs_to_index_limit)
-                
-                _ensure_websocket_alive()
-                
-                resume_embedding = st.session_state.get('resume_embedding')
-                if not resume_embedding and st.session_state.resume_text:
-                    progress_bar.progress(70, text="🔗 Creating resume embedding...")
-                    _websocket_keepalive("Creating resume embedding...")
-                    resume_embedding = generate_and_store_resume_embedding(
-                        st.session_state.resume_text,
-                        st.session_state.user_profile if st.session_state.user_profile else None
-                    )
-                
-                resume_query = None
-                if not resume_embedding:
-                    if st.session_state.resume_text:
-                        resume_query = st.session_state.resume_text
-                        if st.session_state.user_profile.get('summary'):
-                            profile_data = f"{st.session_state.user_profile.get('summary', '')} {st.session_state.user_profile.get('experience', '')} {st.session_state.user_profile.get('skills', '')}"
-                            resume_query = f"{resume_query} {profile_data}"
-                    else:
-                        resume_query = f"{st.session_state.user_profile.get('summary', '')} {st.session_state.user_profile.get('experience', '')} {st.session_state.user_profile.get('skills', '')} {st.session_state.user_profile.get('education', '')}"
-                
-                progress_bar.progress(80, text="🎯 Finding best matches...")
-                results = search_engine.search(query=resume_query, top_k=top_match_count, resume_embedding=resume_embedding)
-                
-                if results:
-                    progress_bar.progress(90, text="📈 Calculating skill matches...")
-                    _websocket_keepalive("Calculating skill matches...")
-                    user_skills = st.session_state.user_profile.get('skills', '')
-                    total_results = len(results)
-                    for i, result in enumerate(results):
-                        # Send keepalive every few jobs to prevent timeout
-                        if i % 3 == 0:
-                            _ensure_websocket_alive()
-                        
-                        job_skills = result['job'].get('skills', [])
-                        skill_score, missing_skills = search_engine.calculate_skill_match(user_skills, job_skills)
-                        result['skill_match_score'] = skill_score
-                        result['missing_skills'] = missing_skills
-                        
-                        semantic_score = result.get('similarity_score', 0.0)
-                        combined_score = (semantic_score * 0.6) + (skill_score * 0.4)
-                        result['combined_match_score'] = combined_score
-                        
-                        # Update progress during skill matching
-                        match_progress = 90 + int((i + 1) / total_results * 9)
-                        progress_bar.progress(match_progress, text=f"📈 Analyzing job {i + 1}/{total_results}...")
-                    
-                    results.sort(key=lambda x: x.get('combined_match_score', 0.0), reverse=True)
-                    
+                if result.status == 'ok':
                     progress_bar.progress(100, text="✅ Analysis complete!")
                     _websocket_keepalive("Analysis complete!")
                     time.sleep(0.3)
                     progress_bar.empty()
                     
-                    st.session_state.matched_jobs = results
+                    st.session_state.matched_jobs = result.matches
                     st.session_state.dashboard_ready = True
                     
-                    gc.collect()
-                    
                     st.rerun()
                 else:
                     progress_bar.empty()
                     st.error("❌ No matching jobs found. Please try different filters.")
         
         display_skill_matching_matrix(st.session_state.user_profile)
+
+        if st.session_state.get('is_admin'):
+            st.markdown("---")
+            if st.button("🩺 Diagnostics", use_container_width=True, key="open_diagnostics"):
+                st.session_state.show_diagnostics = True
+                st.rerun()
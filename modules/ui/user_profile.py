@@ -1,8 +1,7 @@
 """User profile display and editing"""
 import streamlit as st
 import time
-from modules.resume_upload import extract_text_from_resume, extract_profile_from_resume
-from modules.semantic_search import generate_and_store_resume_embedding
+from modules.resume_upload import extract_text_from_resume, extract_profile_with_embedding
 
 
 def display_user_profile():
@@ -33,8 +32,8 @@ def display_user_profile():
                 with st.expander("📝 Preview Extracted Text"):
                     st.text(resume_text[:1000] + "..." if len(resume_text) > 1000 else resume_text)
                 
-                progress_bar.progress(35, text="🤖 Extracting profile with AI...")
-                profile_data = extract_profile_from_resume(resume_text)
+                progress_bar.progress(35, text="🤖 Extracting profile and search embedding with AI...")
+                profile_data, _ = extract_profile_with_embedding(resume_text)
                 
                 if profile_data:
                     progress_bar.progress(75, text="📊 Finalizing profile...")
@@ -52,9 +51,6 @@ def display_user_profile():
                         'certifications': profile_data.get('certifications', '')
                     }
                     
-                    progress_bar.progress(90, text="🔗 Creating search embedding...")
-                    generate_and_store_resume_embedding(resume_text, st.session_state.user_profile)
-                    
                     progress_bar.progress(100, text="✅ Complete!")
                     time.sleep(0.3)
                     progress_bar.empty()
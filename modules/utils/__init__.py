@@ -16,7 +16,9 @@ from .helpers import (
     _chunked_sleep,
     _is_streamlit_cloud,
     _ensure_websocket_alive,
-    ProgressTracker
+    ProgressTracker,
+    background_executor,
+    run_in_background
 )
 from .api_clients import (
     APIMEmbeddingGenerator,
@@ -29,4 +31,37 @@ from .api_clients import (
     get_text_generator,
     get_job_scraper
 )
+from .memory import (
+    estimate_bytes,
+    register_process_cache,
+    get_memory_usage,
+    enforce_memory_budgets
+)
+from .tracing import (
+    trace_span,
+    traced,
+    current_span,
+    get_recent_spans,
+    clear_spans,
+    set_trace_file,
+    load_spans,
+    format_trace
+)
+from .metrics import (
+    inc_counter,
+    set_gauge,
+    observe,
+    record_cache_lookup,
+    metrics_summary,
+    render_prometheus,
+    dump_metrics,
+    start_metrics_server
+)
+from .profiling import (
+    apply_admin_query_params,
+    profile_block,
+    profile_if_enabled,
+    get_profiles,
+    clear_profiles
+)
 from .validation import validate_secrets
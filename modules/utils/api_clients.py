@@ -14,8 +14,11 @@ import time
 import json
 import re
 import hashlib
+import threading
+from collections import OrderedDict
 import streamlit as st
 import requests
+from urllib.parse import urlparse
 
 # Lazy imports for heavy modules - only load when needed
 _tiktoken = None
@@ -24,13 +27,22 @@ _np = None
 _cosine_similarity = None
 
 
+class _ApproxEncoding:
+    """Stand-in when the cl100k_base file cannot be fetched (offline runs): ~4 characters per token."""
+    def encode(self, text):
+        return range((len(text or '') + 3) // 4)
+
+
 def _get_tiktoken_encoding():
     """Lazy load tiktoken encoding"""
     global _tiktoken, _tiktoken_encoding
     if _tiktoken_encoding is None:
         import tiktoken
         _tiktoken = tiktoken
-        _tiktoken_encoding = tiktoken.get_encoding("cl100k_base")
+        try:
+            _tiktoken_encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception:
+            _tiktoken_encoding = _ApproxEncoding()
     return _tiktoken_encoding
 
 
@@ -56,7 +68,9 @@ from .config import (
     DEFAULT_EMBEDDING_BATCH_SIZE,
     EMBEDDING_BATCH_DELAY,
     RAPIDAPI_MAX_REQUESTS_PER_MINUTE,
-    USE_FAST_SKILL_MATCHING
+    INDEED_API_BASE_URL,
+    USE_FAST_SKILL_MATCHING,
+    JOB_KEYWORDS_CACHE_SIZE
 )
 from .helpers import (
     api_call_with_retry,
@@ -65,6 +79,11 @@ from .helpers import (
     _is_streamlit_cloud,
     _ensure_websocket_alive
 )
+from .tracing import trace_span, traced, current_span
+from .metrics import inc_counter, record_cache_lookup
+from .memory import estimate_bytes, register_process_cache
+from modules.skills import canonicalize_skills
+from modules.jobs import get_job_store, job_snippet
 
 
 class APIMEmbeddingGenerator:
@@ -88,6 +107,7 @@ class APIMEmbeddingGenerator:
             self._encoding = _get_tiktoken_encoding()
         return self._encoding
     
+    @traced('api.embeddings', texts=1)
     def get_embedding(self, text):
         """Generate embedding for a single text."""
         try:
@@ -97,12 +117,13 @@ class APIMEmbeddingGenerator:
             def make_request():
                 return requests.post(self.url, headers=self.headers, json=payload, timeout=30)
             
-            response = api_call_with_retry(make_request, max_retries=3)
+            response = api_call_with_retry(make_request, max_retries=3, provider='azure_openai', endpoint='embeddings')
             
             if response and response.status_code == 200:
                 result = response.json()
                 embedding = result['data'][0]['embedding']
                 tokens_used = result['usage'].get('total_tokens', 0) if 'usage' in result else estimated_tokens
+                current_span().set(tokens=tokens_used)
                 return embedding, tokens_used
             else:
                 return None, 0
@@ -110,6 +131,7 @@ class APIMEmbeddingGenerator:
             st.error(f"Error generating embedding: {e}")
             return None, 0
     
+    @traced('embeddings.batches')
     def get_embeddings_batch(self, texts, batch_size=None):
         """Generate embeddings for a batch of texts.
         
@@ -128,6 +150,7 @@ class APIMEmbeddingGenerator:
         progress_bar = st.progress(0)
         status_text = st.empty()
         total_batches = (len(texts) + effective_batch_size - 1) // effective_batch_size
+        current_span().set(texts=len(texts), batch_size=effective_batch_size, batches=total_batches)
         
         # Initial keepalive before starting batch processing
         _websocket_keepalive("Starting embedding generation...", force=True)
@@ -145,31 +168,46 @@ class APIMEmbeddingGenerator:
             if i > 0 and EMBEDDING_BATCH_DELAY > 0:
                 _chunked_sleep(EMBEDDING_BATCH_DELAY, f"Batch {batch_num}/{total_batches}")
             
-            try:
-                payload = {"input": batch, "model": self.deployment}
-                estimated_batch_tokens = sum(len(self.encoding.encode(text)) for text in batch)
-                _websocket_keepalive(f"Processing batch {batch_num}/{total_batches}...")
+            with trace_span('api.embeddings', batch=batch_num, batch_size=len(batch)) as batch_span:
+                try:
+                    payload = {"input": batch, "model": self.deployment}
+                    estimated_batch_tokens = sum(len(self.encoding.encode(text)) for text in batch)
+                    _websocket_keepalive(f"Processing batch {batch_num}/{total_batches}...")
                 
-                def make_request():
-                    return requests.post(self.url, headers=self.headers, json=payload, timeout=30)
+                    def make_request():
+                        return requests.post(self.url, headers=self.headers, json=payload, timeout=30)
                 
-                response = api_call_with_retry(make_request, max_retries=3)
+                    response = api_call_with_retry(make_request, max_retries=3, provider='azure_openai', endpoint='embeddings')
                 
-                # Keepalive after API call completes
-                _ensure_websocket_alive()
+                    # Keepalive after API call completes
+                    _ensure_websocket_alive()
                 
-                if response and response.status_code == 200:
-                    data = response.json()
-                    sorted_data = sorted(data['data'], key=lambda x: x['index'])
-                    embeddings.extend([item['embedding'] for item in sorted_data])
-                    tokens_used = data['usage'].get('total_tokens', 0) if 'usage' in data else estimated_batch_tokens
-                    total_tokens_used += tokens_used
-                elif response and response.status_code == 429:
-                    st.warning(f"⚠️ Rate limit reached after retries. Skipping batch {batch_num}/{total_batches}.")
-                    _websocket_keepalive()
-                else:
-                    st.warning(f"⚠️ Batch embedding failed, trying individual calls for batch {batch_num}...")
-                    _websocket_keepalive("Retrying with individual calls...")
+                    if response and response.status_code == 200:
+                        data = response.json()
+                        sorted_data = sorted(data['data'], key=lambda x: x['index'])
+                        embeddings.extend([item['embedding'] for item in sorted_data])
+                        tokens_used = data['usage'].get('total_tokens', 0) if 'usage' in data else estimated_batch_tokens
+                        total_tokens_used += tokens_used
+                        batch_span.set(tokens=tokens_used)
+                    elif response and response.status_code == 429:
+                        batch_span.set(skipped=True)
+                        st.warning(f"⚠️ Rate limit reached after retries. Skipping batch {batch_num}/{total_batches}.")
+                        _websocket_keepalive()
+                    else:
+                        batch_span.set(fallback='individual')
+                        st.warning(f"⚠️ Batch embedding failed, trying individual calls for batch {batch_num}...")
+                        _websocket_keepalive("Retrying with individual calls...")
+                        for idx, text in enumerate(batch):
+                            if idx % 2 == 0:
+                                _ensure_websocket_alive()
+                            emb, tokens = self.get_embedding(text)
+                            if emb:
+                                embeddings.append(emb)
+                                total_tokens_used += tokens
+                except Exception as e:
+                    batch_span.set(fallback='individual', error=type(e).__name__)
+                    st.warning(f"⚠️ Error processing batch {batch_num}, trying individual calls: {e}")
+                    _websocket_keepalive("Recovering from error...")
                     for idx, text in enumerate(batch):
                         if idx % 2 == 0:
                             _ensure_websocket_alive()
@@ -177,16 +215,6 @@ class APIMEmbeddingGenerator:
                         if emb:
                             embeddings.append(emb)
                             total_tokens_used += tokens
-            except Exception as e:
-                st.warning(f"⚠️ Error processing batch {batch_num}, trying individual calls: {e}")
-                _websocket_keepalive("Recovering from error...")
-                for idx, text in enumerate(batch):
-                    if idx % 2 == 0:
-                        _ensure_websocket_alive()
-                    emb, tokens = self.get_embedding(text)
-                    if emb:
-                        embeddings.append(emb)
-                        total_tokens_used += tokens
         
         progress_bar.empty()
         status_text.empty()
@@ -208,6 +236,10 @@ class AzureOpenAITextGenerator:
         self.headers = {"api-key": self.api_key, "Content-Type": "application/json"}
         self.token_tracker = token_tracker
         self._encoding = None  # Lazy load
+        # Job keywords keyed by job hash, least recently used first; the generator is a
+        # cached resource so "Recalculate Match Score" never re-runs keyword extraction for a job
+        self._job_keywords_cache = OrderedDict()
+        self._job_keywords_lock = threading.Lock()
     
     @property
     def encoding(self):
@@ -216,6 +248,37 @@ class AzureOpenAITextGenerator:
             self._encoding = _get_tiktoken_encoding()
         return self._encoding
     
+    def _get_job_keywords(self, key):
+        with self._job_keywords_lock:
+            keywords = self._job_keywords_cache.get(key)
+            if keywords is not None:
+                self._job_keywords_cache.move_to_end(key)
+            return keywords
+    
+    def _store_job_keywords(self, key, keywords):
+        if JOB_KEYWORDS_CACHE_SIZE <= 0:
+            return
+        with self._job_keywords_lock:
+            self._job_keywords_cache[key] = keywords
+            self._job_keywords_cache.move_to_end(key)
+            while len(self._job_keywords_cache) > JOB_KEYWORDS_CACHE_SIZE:
+                self._job_keywords_cache.popitem(last=False)
+    
+    def job_keywords_nbytes(self):
+        with self._job_keywords_lock:
+            return estimate_bytes(dict(self._job_keywords_cache))
+    
+    def trim_job_keywords(self, max_bytes):
+        """Drop least recently used job keywords until the cache fits in max_bytes."""
+        freed = 0
+        with self._job_keywords_lock:
+            size = estimate_bytes(dict(self._job_keywords_cache))
+            while self._job_keywords_cache and size - freed > max_bytes:
+                key, keywords = self._job_keywords_cache.popitem(last=False)
+                freed += estimate_bytes(key) + estimate_bytes(keywords)
+        return freed
+    
+    @traced('api.chat', operation='generate_resume')
     def generate_resume(self, user_profile, job_posting, raw_resume_text=None):
         """Generate a tailored resume based on user profile and job posting using Context Sandwich approach.
         Returns structured JSON data instead of formatted text."""
@@ -310,7 +373,7 @@ IMPORTANT: Return ONLY the JSON object, no markdown code blocks, no additional t
             def make_request():
                 return requests.post(self.url, headers=self.headers, json=payload, timeout=45)
             
-            response = api_call_with_retry(make_request, max_retries=3)
+            response = api_call_with_retry(make_request, max_retries=3, provider='azure_openai', endpoint='chat')
             
             if response and response.status_code == 200:
                 result = response.json()
@@ -347,20 +410,24 @@ IMPORTANT: Return ONLY the JSON object, no markdown code blocks, no additional t
             st.error(f"Error generating resume: {e}")
             return None
     
-    def calculate_match_score(self, resume_content, job_description, embedding_generator):
+    def calculate_match_score(self, resume_content, job_description, embedding_generator,
+                              job_embedding=None, job_key=None):
         """Calculate match score between resume and job description, and identify missing keywords.
-        Returns (None, None) if embeddings cannot be generated."""
-        from .helpers import api_call_with_retry
         
+        Pass the job's indexed vector as job_embedding and its job hash as job_key
+        so only the resume is embedded and job keywords are extracted once per job.
+        Returns (None, None) if embeddings cannot be generated."""
         try:
             resume_embedding, resume_tokens = embedding_generator.get_embedding(resume_content)
-            job_embedding, job_tokens = embedding_generator.get_embedding(job_description)
+            job_tokens = 0
+            if job_embedding is None:
+                job_embedding, job_tokens = embedding_generator.get_embedding(job_description)
             
             # Token tracker is accessed via session state to avoid circular import
             if 'token_tracker' in st.session_state:
                 st.session_state.token_tracker.add_embedding_tokens(resume_tokens + job_tokens)
             
-            if not resume_embedding or not job_embedding:
+            if not resume_embedding or job_embedding is None or len(job_embedding) == 0:
                 return None, None
             
             np = _get_numpy()
@@ -371,54 +438,13 @@ IMPORTANT: Return ONLY the JSON object, no markdown code blocks, no additional t
             similarity = cosine_sim(resume_emb, job_emb)[0][0]
             match_score = float(similarity)
             
-            job_desc_for_keywords = job_description[:8000] if len(job_description) > 8000 else job_description
-            if len(job_description) > 8000:
-                job_desc_for_keywords += "\n\n[Description truncated for keyword extraction - full description available for matching]"
-            
-            keyword_prompt = f"""Extract the most important technical skills, tools, technologies, and qualifications mentioned in this job description. 
-Return ONLY a JSON object with a "keywords" array, no additional text.
-
-Job Description:
-{job_desc_for_keywords}
-
-Return format: {{"keywords": ["keyword1", "keyword2", "keyword3", ...]}}"""
-            
-            payload = {
-                "messages": [
-                    {"role": "system", "content": "You are a keyword extraction expert. Extract only the most important technical and professional keywords. Return JSON with a 'keywords' array."},
-                    {"role": "user", "content": keyword_prompt}
-                ],
-                "max_tokens": 500,
-                "temperature": 0.3,
-                "response_format": {"type": "json_object"}
-            }
-            
-            def make_request():
-                return requests.post(self.url, headers=self.headers, json=payload, timeout=30)
-            
-            response = api_call_with_retry(make_request, max_retries=2)
+            job_keywords = self.extract_job_keywords(job_description, job_key=job_key)
             
             missing_keywords = []
-            if response and response.status_code == 200:
-                try:
-                    result = response.json()
-                    content = result['choices'][0]['message']['content']
-                    
-                    if self.token_tracker and 'usage' in result:
-                        usage = result['usage']
-                        prompt_tokens = usage.get('prompt_tokens', 0)
-                        completion_tokens = usage.get('completion_tokens', 0)
-                        self.token_tracker.add_completion_tokens(prompt_tokens, completion_tokens)
-                    
-                    keyword_data = json.loads(content)
-                    job_keywords = keyword_data.get('keywords', [])
-                    
-                    resume_lower = resume_content.lower()
-                    for keyword in job_keywords:
-                        if isinstance(keyword, str) and keyword.lower() not in resume_lower:
-                            missing_keywords.append(keyword)
-                except Exception as e:
-                    pass
+            resume_lower = resume_content.lower()
+            for keyword in job_keywords or []:
+                if isinstance(keyword, str) and keyword.lower() not in resume_lower:
+                    missing_keywords.append(keyword)
             
             return match_score, missing_keywords[:10]
             
@@ -426,6 +452,70 @@ Return format: {{"keywords": ["keyword1", "keyword2", "keyword3", ...]}}"""
             st.warning(f"Could not calculate match score: {e}")
             return None, None
     
+    @traced('api.chat', operation='extract_job_keywords')
+    def extract_job_keywords(self, job_description, job_key=None):
+        """Extract the key skills and qualifications from a job description.
+        
+        Results are memoized per job_key (falling back to a hash of the
+        description). Returns None if the extraction call failed.
+        """
+        from .helpers import api_call_with_retry
+        
+        cache_key = job_key or hashlib.md5(job_description.encode()).hexdigest()
+        cached = self._get_job_keywords(cache_key)
+        if cached is not None:
+            current_span().set(cache_hit=True)
+            record_cache_lookup('job_keywords', hits=1)
+            return cached
+        record_cache_lookup('job_keywords', misses=1)
+        
+        job_desc_for_keywords = job_description[:8000] if len(job_description) > 8000 else job_description
+        if len(job_description) > 8000:
+            job_desc_for_keywords += "\n\n[Description truncated for keyword extraction - full description available for matching]"
+        
+        keyword_prompt = f"""Extract the most important technical skills, tools, technologies, and qualifications mentioned in this job description. 
+Return ONLY a JSON object with a "keywords" array, no additional text.
+
+Job Description:
+{job_desc_for_keywords}
+
+Return format: {{"keywords": ["keyword1", "keyword2", "keyword3", ...]}}"""
+        
+        payload = {
+            "messages": [
+                {"role": "system", "content": "You are a keyword extraction expert. Extract only the most important technical and professional keywords. Return JSON with a 'keywords' array."},
+                {"role": "user", "content": keyword_prompt}
+            ],
+            "max_tokens": 500,
+            "temperature": 0.3,
+            "response_format": {"type": "json_object"}
+        }
+        
+        def make_request():
+            return requests.post(self.url, headers=self.headers, json=payload, timeout=30)
+        
+        response = api_call_with_retry(make_request, max_retries=2, provider='azure_openai', endpoint='chat')
+        
+        if response and response.status_code == 200:
+            try:
+                result = response.json()
+                content = result['choices'][0]['message']['content']
+                
+                if self.token_tracker and 'usage' in result:
+                    usage = result['usage']
+                    prompt_tokens = usage.get('prompt_tokens', 0)
+                    completion_tokens = usage.get('completion_tokens', 0)
+                    self.token_tracker.add_completion_tokens(prompt_tokens, completion_tokens)
+                
+                keyword_data = json.loads(content)
+                job_keywords = [k for k in keyword_data.get('keywords', []) if isinstance(k, str)]
+                self._store_job_keywords(cache_key, job_keywords)
+                return job_keywords
+            except Exception:
+                pass
+        return None
+    
+    @traced('api.chat', operation='analyze_seniority_level')
     def analyze_seniority_level(self, job_titles):
         """Analyze job titles to determine seniority level"""
         from .helpers import api_call_with_retry
@@ -461,7 +551,7 @@ Choose the most appropriate seniority level based on the job titles."""
             def make_request():
                 return requests.post(self.url, headers=self.headers, json=payload, timeout=30)
             
-            response = api_call_with_retry(make_request, max_retries=2)
+            response = api_call_with_retry(make_request, max_retries=2, provider='azure_openai', endpoint='chat')
             if response and response.status_code == 200:
                 result = response.json()
                 content = result['choices'][0]['message']['content']
@@ -487,6 +577,7 @@ Choose the most appropriate seniority level based on the job titles."""
         else:
             return "Mid-Senior Level"
     
+    @traced('api.chat', operation='recommend_accreditations')
     def recommend_accreditations(self, job_descriptions, user_skills):
         """Recommend accreditations based on job requirements"""
         from .helpers import api_call_with_retry
@@ -529,7 +620,7 @@ Focus on certifications that are:
             def make_request():
                 return requests.post(self.url, headers=self.headers, json=payload, timeout=30)
             
-            response = api_call_with_retry(make_request, max_retries=2)
+            response = api_call_with_retry(make_request, max_retries=2, provider='azure_openai', endpoint='chat')
             if response and response.status_code == 200:
                 result = response.json()
                 content = result['choices'][0]['message']['content']
@@ -547,12 +638,13 @@ Focus on certifications that are:
         
         return "PMP or Scrum Master"
     
+    @traced('api.chat', operation='generate_recruiter_note')
     def generate_recruiter_note(self, job, user_profile, semantic_score, skill_score):
         """Generate a personalized recruiter note"""
         from .helpers import api_call_with_retry
         
         job_title = job.get('title', '')
-        job_desc = job.get('description', '')[:2000]
+        job_desc = job_snippet(job)[:2000]
         user_summary = user_profile.get('summary', '')[:500]
         user_experience = user_profile.get('experience', '')[:500]
         
@@ -588,7 +680,7 @@ Return ONLY the recruiter note text, no labels or formatting."""
             def make_request():
                 return requests.post(self.url, headers=self.headers, json=payload, timeout=30)
             
-            response = api_call_with_retry(make_request, max_retries=2)
+            response = api_call_with_retry(make_request, max_retries=2, provider='azure_openai', endpoint='chat')
             if response and response.status_code == 200:
                 result = response.json()
                 
@@ -602,10 +694,96 @@ Return ONLY the recruiter note text, no labels or formatting."""
         except:
             pass
         
+        return self.fallback_recruiter_note(job, semantic_score)
+    
+    @staticmethod
+    def fallback_recruiter_note(job, semantic_score):
+        """Template note used when the AI note cannot be generated"""
         if semantic_score >= 0.7:
             return f"This role heavily emphasizes recent experience in {job.get('skills', ['relevant skills'])[0] if job.get('skills') else 'relevant skills'}, which is a strong point in your profile."
         else:
             return "Consider highlighting more relevant experience from your background to strengthen your application."
+    
+    @traced('api.chat', operation='generate_recruiter_notes_batch')
+    def generate_recruiter_notes_batch(self, matches, user_profile):
+        """Generate recruiter notes for several jobs in one structured-JSON completion.
+        
+        matches is a list of (job, semantic_score, skill_score) tuples. Returns a
+        dict mapping the position in matches to its note; jobs the model skipped
+        are left out so callers can fall back to generate_recruiter_note.
+        """
+        from .helpers import api_call_with_retry
+        
+        if not matches:
+            return {}
+        
+        user_summary = user_profile.get('summary', '')[:500]
+        user_experience = user_profile.get('experience', '')[:500]
+        
+        job_blocks = []
+        for idx, (job, semantic_score, skill_score) in enumerate(matches):
+            job_blocks.append(
+                f"""[{idx}] Job Title: {job.get('title', '')}
+Job Description (excerpt): {job_snippet(job)[:600]}
+Match Scores: Semantic {semantic_score:.0%}, Skill {skill_score:.0%}"""
+            )
+        jobs_text = "\n\n".join(job_blocks)
+        
+        prompt = f"""You are a professional recruiter in Hong Kong. For each job below, write a brief, actionable note about why this candidate is a good fit for the role.
+
+Candidate Summary: {user_summary}
+Candidate Experience (excerpt): {user_experience}
+
+JOBS:
+{jobs_text}
+
+Each note is 2-3 sentences that:
+1. Highlight the strongest match points
+2. Mention any specific experience or skills that align well
+3. Provide actionable feedback
+
+Return ONLY valid JSON with this structure:
+{{"notes": [{{"id": 0, "note": "recruiter note text"}}, ...]}}"""
+        
+        try:
+            payload = {
+                "messages": [
+                    {"role": "system", "content": "You are a professional recruiter. Write concise, actionable notes. Return only valid JSON."},
+                    {"role": "user", "content": prompt}
+                ],
+                "max_tokens": 120 * len(matches) + 100,
+                "temperature": 0.7,
+                "response_format": {"type": "json_object"}
+            }
+            
+            def make_request():
+                return requests.post(self.url, headers=self.headers, json=payload, timeout=60)
+            
+            response = api_call_with_retry(make_request, max_retries=2, provider='azure_openai', endpoint='chat')
+            if response and response.status_code == 200:
+                result = response.json()
+                
+                if self.token_tracker and 'usage' in result:
+                    usage = result['usage']
+                    prompt_tokens = usage.get('prompt_tokens', 0)
+                    completion_tokens = usage.get('completion_tokens', 0)
+                    self.token_tracker.add_completion_tokens(prompt_tokens, completion_tokens)
+                
+                notes = json.loads(result['choices'][0]['message']['content']).get('notes', [])
+                batch_notes = {}
+                for entry in notes:
+                    try:
+                        idx = int(entry.get('id'))
+                    except (TypeError, ValueError, AttributeError):
+                        continue
+                    note = entry.get('note')
+                    if 0 <= idx < len(matches) and isinstance(note, str) and note.strip():
+                        batch_notes[idx] = note.strip()
+                return batch_notes
+        except Exception:
+            pass
+        
+        return {}
 
 
 class RateLimiter:
@@ -613,8 +791,9 @@ class RateLimiter:
     
     Uses chunked sleep to prevent WebSocket timeouts during rate limiting waits.
     """
-    def __init__(self, max_requests_per_minute):
+    def __init__(self, max_requests_per_minute, name='default'):
         self.max_requests_per_minute = max_requests_per_minute
+        self.name = name
         self.request_times = []
         self.lock = False
     
@@ -634,6 +813,9 @@ class RateLimiter:
             oldest_request = min(self.request_times)
             wait_time = 60 - (now - oldest_request) + 1
             if wait_time > 0:
+                current_span().add('rate_limit_wait_s', round(wait_time, 3))
+                inc_counter('careerlens_rate_limiter_waits_total', limiter=self.name)
+                inc_counter('careerlens_rate_limiter_wait_seconds_total', wait_time, limiter=self.name)
                 # Use chunked sleep to maintain WebSocket connection
                 _chunked_sleep(
                     wait_time, 
@@ -649,17 +831,19 @@ class RateLimiter:
 class IndeedScraperAPI:
     """Job scraper using Indeed Scraper API via RapidAPI.
     
-    Subscribe at RapidAPI and search for "Indeed Scraper API".
+    Subscribe at RapidAPI and search for "Indeed Scraper API". base_url
+    defaults to INDEED_API_BASE_URL, so a local mock can stand in for RapidAPI.
     """
-    def __init__(self, api_key):
+    def __init__(self, api_key, base_url=None):
         self.api_key = api_key
-        self.url = "https://indeed-scraper-api.p.rapidapi.com/api/job"
+        self.base_url = (base_url or INDEED_API_BASE_URL).rstrip('/')
+        self.url = f"{self.base_url}/api/job"
         self.headers = {
             'Content-Type': 'application/json',
-            'x-rapidapi-host': 'indeed-scraper-api.p.rapidapi.com',
+            'x-rapidapi-host': urlparse(self.base_url).netloc or 'indeed-scraper-api.p.rapidapi.com',
             'x-rapidapi-key': api_key
         }
-        self.rate_limiter = RateLimiter(RAPIDAPI_MAX_REQUESTS_PER_MINUTE)
+        self.rate_limiter = RateLimiter(RAPIDAPI_MAX_REQUESTS_PER_MINUTE, name='rapidapi')
     
     def _validate_api_key(self):
         """Check if API key appears valid (basic format check)."""
@@ -671,6 +855,7 @@ class IndeedScraperAPI:
             return False, "RapidAPI key is still set to placeholder value"
         return True, None
     
+    @traced('api.indeed.search')
     def search_jobs(self, query, location="Hong Kong", max_rows=15, job_type="fulltime", country="hk"):
         """Search for jobs using Indeed Scraper API.
         
@@ -685,6 +870,7 @@ class IndeedScraperAPI:
             st.error(f"⚠️ **API Key Issue**: {key_error}\n\nPlease check your `RAPIDAPI_KEY` in Streamlit Cloud secrets.")
             return []
         
+        current_span().set(query=query, location=location, max_rows=max_rows)
         # Show search parameters for debugging
         st.caption(f"🔍 Searching: `{query}` in `{location}` ({country.upper()})")
         
@@ -709,7 +895,7 @@ class IndeedScraperAPI:
             def make_request():
                 return requests.post(self.url, headers=self.headers, json=payload, timeout=60)
             
-            response = api_call_with_retry(make_request, max_retries=3, initial_delay=3)
+            response = api_call_with_retry(make_request, max_retries=3, initial_delay=3, provider='rapidapi', endpoint='indeed_search')
             
             # Keepalive after API response
             _ensure_websocket_alive()
@@ -753,6 +939,7 @@ class IndeedScraperAPI:
                     st.warning(f"⚠️ Unexpected API response format. Keys received: {list(data.keys())}")
                     self._show_no_jobs_help(query, location, country)
                 
+                current_span().set(jobs=len(jobs))
                 _websocket_keepalive("Job search complete", force=True)
                 return jobs
             else:
@@ -881,7 +1068,7 @@ class IndeedScraperAPI:
             rating_data = job_data.get('rating', {})
             company_rating = rating_data.get('rating', 0) if rating_data else 0
             
-            return {
+            return get_job_store().add({
                 'title': job_data.get('title', 'N/A'),
                 'company': job_data.get('companyName', 'N/A'),
                 'location': location,
@@ -893,16 +1080,21 @@ class IndeedScraperAPI:
                 'posted_date': job_data.get('age', 'Recently'),
                 'benefits': benefits[:5] if benefits else [],
                 'skills': attributes[:10] if attributes else [],
+                'skill_ids': canonicalize_skills(attributes[:10]) if attributes else (),
                 'company_rating': company_rating,
                 'is_remote': job_data.get('isRemote', False),
                 'company_logo': job_data.get('companyLogoUrl', ''),
-            }
+            })
         except Exception as e:
             return None
 
 
 class TokenUsageTracker:
-    """Tracks token usage and costs for API calls."""
+    """Tracks token usage and costs for API calls.
+
+    Totals are per session; every addition also goes to the process-wide
+    metrics registry so usage and cost can be aggregated across sessions.
+    """
     def __init__(self):
         self.total_tokens = 0
         self.total_prompt_tokens = 0
@@ -917,15 +1109,24 @@ class TokenUsageTracker:
         """Track embedding token usage."""
         self.total_embedding_tokens += tokens
         self.total_tokens += tokens
-        self.cost_usd += (tokens / 1000) * self.embedding_cost_per_1k
+        current_span().add('embedding_tokens', tokens)
+        cost = (tokens / 1000) * self.embedding_cost_per_1k
+        self.cost_usd += cost
+        inc_counter('careerlens_tokens_total', tokens, kind='embedding')
+        inc_counter('careerlens_cost_usd_total', cost)
     
     def add_completion_tokens(self, prompt_tokens, completion_tokens):
         """Track completion token usage."""
         self.total_prompt_tokens += prompt_tokens
         self.total_completion_tokens += completion_tokens
         self.total_tokens += prompt_tokens + completion_tokens
-        self.cost_usd += (prompt_tokens / 1000) * self.gpt4_mini_prompt_cost_per_1k
-        self.cost_usd += (completion_tokens / 1000) * self.gpt4_mini_completion_cost_per_1k
+        current_span().add('prompt_tokens', prompt_tokens).add('completion_tokens', completion_tokens)
+        cost = ((prompt_tokens / 1000) * self.gpt4_mini_prompt_cost_per_1k
+                + (completion_tokens / 1000) * self.gpt4_mini_completion_cost_per_1k)
+        self.cost_usd += cost
+        inc_counter('careerlens_tokens_total', prompt_tokens, kind='prompt')
+        inc_counter('careerlens_tokens_total', completion_tokens, kind='completion')
+        inc_counter('careerlens_cost_usd_total', cost)
     
     def get_summary(self):
         """Get usage summary."""
@@ -961,7 +1162,9 @@ def _create_embedding_generator_resource(api_key, endpoint):
 
 @st.cache_resource(show_spinner=False)
 def _create_text_generator_resource(api_key, endpoint):
-    return AzureOpenAITextGenerator(api_key, endpoint)
+    generator = AzureOpenAITextGenerator(api_key, endpoint)
+    register_process_cache('job_keywords', generator.job_keywords_nbytes, generator.trim_job_keywords)
+    return generator
 
 
 def get_embedding_generator():
@@ -24,12 +24,28 @@ def _coerce_positive_float(value, default, minimum=0.0):
         return default
 
 
+_secrets_snapshot = None
+
+
+def _get_secrets():
+    """Streamlit secrets as a plain dict, parsed once.
+
+    Every constant below is resolved at import, and without a secrets.toml
+    st.secrets searches the filesystem again on each lookup, so one snapshot
+    keeps config out of the cold-start path.
+    """
+    global _secrets_snapshot
+    if _secrets_snapshot is None:
+        try:
+            _secrets_snapshot = st.secrets.to_dict()
+        except (AttributeError, RuntimeError, KeyError, Exception):
+            _secrets_snapshot = {}
+    return _secrets_snapshot
+
+
 def _get_config_int(key, default, minimum=1):
     """Look up configuration values from Streamlit secrets or environment."""
-    try:
-        secrets_value = st.secrets.get(key)
-    except (AttributeError, RuntimeError, KeyError, Exception):
-        secrets_value = None
+    secrets_value = _get_secrets().get(key)
     env_value = os.getenv(key)
     candidate = secrets_value if secrets_value not in (None, "") else env_value
     return _coerce_positive_int(candidate, default, minimum)
@@ -37,22 +53,57 @@ def _get_config_int(key, default, minimum=1):
 
 def _get_config_float(key, default, minimum=0.0):
     """Look up float configuration values from Streamlit secrets or environment."""
-    try:
-        secrets_value = st.secrets.get(key)
-    except (AttributeError, RuntimeError, KeyError, Exception):
-        secrets_value = None
+    secrets_value = _get_secrets().get(key)
     env_value = os.getenv(key)
     candidate = secrets_value if secrets_value not in (None, "") else env_value
     return _coerce_positive_float(candidate, default, minimum)
 
 
+def _get_config_str(key, default):
+    """Look up string configuration values from Streamlit secrets or environment."""
+    secrets_value = _get_secrets().get(key)
+    env_value = os.getenv(key)
+    candidate = secrets_value if secrets_value not in (None, "") else env_value
+    return str(candidate) if candidate not in (None, "") else default
+
+
 # Configuration constants
 DEFAULT_EMBEDDING_BATCH_SIZE = _get_config_int("EMBEDDING_BATCH_SIZE", 15, minimum=5)
 DEFAULT_MAX_JOBS_TO_INDEX = _get_config_int("MAX_JOBS_TO_INDEX", 25, minimum=10)
 EMBEDDING_BATCH_DELAY = _get_config_float("EMBEDDING_BATCH_DELAY", 0.5, minimum=0.0)
 RAPIDAPI_MAX_REQUESTS_PER_MINUTE = _get_config_int("RAPIDAPI_MAX_REQUESTS_PER_MINUTE", 3, minimum=1)
+# Point at a local mock (python -m mock_apis) for offline load tests
+INDEED_API_BASE_URL = _get_config_str("INDEED_API_BASE_URL", "https://indeed-scraper-api.p.rapidapi.com").rstrip('/')
 ENABLE_PROFILE_PASS2 = os.getenv("ENABLE_PROFILE_PASS2", "false").lower() in ("true", "1", "yes")
 USE_FAST_SKILL_MATCHING = os.getenv("USE_FAST_SKILL_MATCHING", "true").lower() in ("true", "1", "yes")
+PDF_EXTRACTION_WORKERS = _get_config_int("PDF_EXTRACTION_WORKERS", min(2, os.cpu_count() or 1), minimum=1)
+PDF_PARALLEL_MIN_PAGES = _get_config_int("PDF_PARALLEL_MIN_PAGES", 4, minimum=2)
+PDF_PAGE_CACHE_SIZE = _get_config_int("PDF_PAGE_CACHE_SIZE", 256, minimum=0)
+RECRUITER_NOTES_PREFETCH_COUNT = _get_config_int("RECRUITER_NOTES_PREFETCH_COUNT", 10, minimum=0)
+RECRUITER_NOTES_CACHE_SIZE = _get_config_int("RECRUITER_NOTES_CACHE_SIZE", 500, minimum=0)
+SKILL_STORE_PATH = os.getenv("SKILL_STORE_PATH", "")
+SKILL_STORE_MAX_SKILLS = _get_config_int("SKILL_STORE_MAX_SKILLS", 20000, minimum=100)
+# SKILL_STORE_PATH is rewritten once this many skills were added since the last save (and at exit)
+SKILL_STORE_SAVE_EVERY = _get_config_int("SKILL_STORE_SAVE_EVERY", 500, minimum=1)
+JOB_STORE_MAX_JOBS = _get_config_int("JOB_STORE_MAX_JOBS", 5000, minimum=100)
+JOB_CORPUS_MAX_JOBS = _get_config_int("JOB_CORPUS_MAX_JOBS", 10000, minimum=100)
+SESSION_MEMORY_BUDGET_MB = _get_config_int("SESSION_MEMORY_BUDGET_MB", 64, minimum=4)
+PROCESS_MEMORY_BUDGET_MB = _get_config_int("PROCESS_MEMORY_BUDGET_MB", 512, minimum=32)
+TRACING_ENABLED = os.getenv("TRACING_ENABLED", "true").lower() in ("true", "1", "yes")
+TRACE_BUFFER_SIZE = _get_config_int("TRACE_BUFFER_SIZE", 5000, minimum=0)
+# Finished spans are also appended here as JSON lines when set
+TRACE_FILE = _get_config_str("TRACE_FILE", "")
+# Prometheus text export: rewritten after each analysis / served on /metrics when set
+METRICS_FILE = _get_config_str("METRICS_FILE", "")
+METRICS_PORT = _get_config_int("METRICS_PORT", 0, minimum=0)
+SALARY_CACHE_SIZE = _get_config_int("SALARY_CACHE_SIZE", 2000, minimum=0)
+JOB_KEYWORDS_CACHE_SIZE = _get_config_int("JOB_KEYWORDS_CACHE_SIZE", 2000, minimum=0)
+# cProfile/tracemalloc for every session; admins can also opt in per session via ?admin=<ADMIN_TOKEN>&profile=1
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "false").lower() in ("true", "1", "yes")
+PROFILE_TARGETS = _get_config_str("PROFILE_TARGETS", "run")
+PROFILE_HISTORY = _get_config_int("PROFILE_HISTORY", 20, minimum=1)
+# Unlocks profiling and the diagnostics page; admin features are off while empty
+ADMIN_TOKEN = _get_config_str("ADMIN_TOKEN", "")
 
 
 def _determine_index_limit(total_jobs, desired_top_matches):
@@ -1,16 +1,19 @@
 """Helper functions for API retries, memory management, and utilities"""
 import os
-import gc
 import time
 import math
 import json
 import re
 import base64
+import contextvars
 import threading
 import streamlit as st
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
 import requests
+from .memory import enforce_memory_budgets
+from .tracing import trace_span
+from .metrics import inc_counter, observe
 
 # WebSocket keepalive configuration
 WEBSOCKET_KEEPALIVE_INTERVAL = 5  # seconds between keepalive pings
@@ -19,9 +22,12 @@ _last_keepalive_time = time.time()
 
 
 def _cleanup_session_state():
-    """Clean up old/stale data from session state to prevent memory bloat."""
+    """Clean up old/stale data from session state to prevent memory bloat.
+    
+    Entry-count caps are applied first; byte budgets (and any garbage
+    collection) are handled by enforce_memory_budgets. Returns current usage.
+    """
     MAX_CACHE_ENTRIES = 10
-    MAX_SKILL_CACHE_SIZE = 500
     
     if 'jobs_cache' in st.session_state and isinstance(st.session_state.jobs_cache, dict):
         cache = st.session_state.jobs_cache
@@ -35,21 +41,10 @@ def _cleanup_session_state():
             for key in keys_to_remove:
                 del cache[key]
     
-    if 'skill_embeddings_cache' in st.session_state:
-        cache = st.session_state.skill_embeddings_cache
-        if len(cache) > MAX_SKILL_CACHE_SIZE:
-            keys_to_remove = list(cache.keys())[:-MAX_SKILL_CACHE_SIZE//2]
-            for key in keys_to_remove:
-                del cache[key]
+    # Job vectors live in the shared job corpus; drop copies from older sessions
+    st.session_state.pop('job_embeddings_cache', None)
     
-    if 'user_skills_embeddings_cache' in st.session_state:
-        cache = st.session_state.user_skills_embeddings_cache
-        if len(cache) > MAX_SKILL_CACHE_SIZE:
-            keys_to_remove = list(cache.keys())[:-MAX_SKILL_CACHE_SIZE//2]
-            for key in keys_to_remove:
-                del cache[key]
-    
-    gc.collect()
+    return enforce_memory_budgets()
 
 
 def get_img_as_base64(file):
@@ -309,16 +304,45 @@ class ProgressTracker:
         _websocket_keepalive()
 
 
-def api_call_with_retry(func, max_retries=3, initial_delay=1, max_delay=60):
-    """Execute an API call with exponential backoff retry logic for rate limit errors (429)."""
+def api_call_with_retry(func, max_retries=3, initial_delay=1, max_delay=60, provider='unknown', endpoint='unknown'):
+    """Execute an API call with exponential backoff retry logic for rate limit errors (429).
+
+    The call is traced as an http.request span carrying the attempt count,
+    429s, backoff time and final status code; every attempt is also counted
+    in the metrics registry under provider/endpoint.
+    """
+    labels = {'provider': provider, 'endpoint': endpoint}
+    with trace_span('http.request', max_retries=max_retries, **labels) as span:
+        response = _call_with_retry(func, max_retries, initial_delay, max_delay, span, labels)
+        span.set(status_code=response.status_code if response is not None else None)
+        return response
+
+
+def _record_attempt(labels, status, start):
+    inc_counter('careerlens_api_requests_total', status=status, **labels)
+    observe('careerlens_api_request_seconds', time.perf_counter() - start, **labels)
+
+
+def _record_backoff(span, labels, delay):
+    span.add('backoff_s', delay)
+    inc_counter('careerlens_api_retries_total', **labels)
+    inc_counter('careerlens_api_backoff_seconds_total', delay, **labels)
+
+
+def _call_with_retry(func, max_retries, initial_delay, max_delay, span, labels):
     for attempt in range(max_retries):
+        span.set(attempts=attempt + 1)
+        start = time.perf_counter()
         try:
             response = func()
+            _record_attempt(labels, response.status_code, start)
             
             if response.status_code in [200, 201]:
                 return response
             
             elif response.status_code == 429:
+                span.add('rate_limited')
+                inc_counter('careerlens_api_rate_limited_total', **labels)
                 if attempt < max_retries - 1:
                     fallback_delay = _calculate_exponential_delay(initial_delay, attempt, max_delay)
                     delay, delay_source = _determine_retry_delay(response, fallback_delay, max_delay)
@@ -332,6 +356,7 @@ def api_call_with_retry(func, max_retries=3, initial_delay=1, max_delay=60):
                         )
                     else:
                         st.caption(f"⏳ Retrying... ({attempt + 1}/{max_retries})")
+                    _record_backoff(span, labels, delay)
                     _chunked_sleep(delay, f"⏳ Retry {attempt + 1}/{max_retries}")
                     continue
                 else:
@@ -350,8 +375,11 @@ def api_call_with_retry(func, max_retries=3, initial_delay=1, max_delay=60):
                 return response
                 
         except requests.exceptions.Timeout:
+            _record_attempt(labels, 'timeout', start)
+            span.add('timeouts')
             if attempt < max_retries - 1:
                 delay = _calculate_exponential_delay(initial_delay, attempt, max_delay)
+                _record_backoff(span, labels, delay)
                 st.warning(f"⏳ Request timed out. Retrying in {delay} seconds... (Attempt {attempt + 1}/{max_retries})")
                 _chunked_sleep(delay)
                 continue
@@ -360,8 +388,11 @@ def api_call_with_retry(func, max_retries=3, initial_delay=1, max_delay=60):
                 return None
         
         except requests.exceptions.RequestException as e:
+            _record_attempt(labels, 'network_error', start)
+            span.set(network_error=type(e).__name__)
             if attempt < max_retries - 1:
                 delay = _calculate_exponential_delay(initial_delay, attempt, max_delay)
+                _record_backoff(span, labels, delay)
                 st.warning(f"⏳ Network error. Retrying in {delay} seconds... (Attempt {attempt + 1}/{max_retries})")
                 _chunked_sleep(delay)
                 continue
@@ -376,6 +407,55 @@ def api_call_with_retry(func, max_retries=3, initial_delay=1, max_delay=60):
     return None
 
 
+def _get_script_context():
+    """Return the current Streamlit ScriptRunContext, or None outside a script run."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        return get_script_run_ctx()
+    except Exception:
+        return None
+
+
+def _attach_script_context(ctx):
+    """Thread initializer: attach the parent's script context to this worker thread."""
+    if ctx is None:
+        return
+    try:
+        from streamlit.runtime.scriptrunner import add_script_run_ctx
+        add_script_run_ctx(threading.current_thread(), ctx)
+    except Exception:
+        pass
+
+
+def background_executor(max_workers):
+    """Create a thread pool whose workers inherit the caller's Streamlit script context.
+
+    Workers can call st.*, read st.session_state and send keepalives exactly
+    like the main script thread. Use as a context manager, or call
+    shutdown(wait=False) to let queued work finish in the background.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+    return ThreadPoolExecutor(
+        max_workers=max(1, max_workers),
+        thread_name_prefix="careerlens-bg",
+        initializer=_attach_script_context,
+        initargs=(_get_script_context(),)
+    )
+
+
+def run_in_background(func, *args, **kwargs):
+    """Start func on its own worker thread and return a Future for its result.
+
+    Used to overlap independent network waits (e.g. an embedding call while a
+    completion is in flight) instead of running them back to back.
+    """
+    executor = background_executor(1)
+    # Run in a copy of the caller's context so spans opened there nest under the caller's span
+    future = executor.submit(contextvars.copy_context().run, func, *args, **kwargs)
+    executor.shutdown(wait=False)
+    return future
+
+
 def _is_streamlit_cloud():
     """Detect if running on Streamlit Cloud (ephemeral filesystem)."""
     return (
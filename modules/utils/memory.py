@@ -0,0 +1,271 @@
+"""Memory accounting and budget enforcement for session and process caches"""
+import gc
+import sys
+import time
+import threading
+import streamlit as st
+from modules.jobs import Job, get_job_store
+from modules.skills import get_skill_index
+from .config import SESSION_MEMORY_BUDGET_MB, PROCESS_MEMORY_BUDGET_MB
+from .metrics import register_metrics_collector
+
+SESSION_MEMORY_BUDGET = SESSION_MEMORY_BUDGET_MB * 1024 * 1024
+PROCESS_MEMORY_BUDGET = PROCESS_MEMORY_BUDGET_MB * 1024 * 1024
+
+# Session keys whose entries can be dropped and rebuilt, least recently used
+# first, in the order they are given up when a session is over budget
+EVICTABLE_SESSION_CACHES = ('jobs_cache', 'search_history')
+
+# Session values that are rebuilt on demand, given up whole (least recently
+# updated first) once the caches above are empty. Each maps to the keys reset
+# with it and the session flag that keeps it while it is on screen.
+REBUILDABLE_SESSION_VALUES = {
+    # Re-embedded from resume_text by the next search
+    'resume_embedding': ({'resume_embedding': None}, None),
+    # Regenerated from the resume generator page
+    'generated_resume': ({'generated_resume': None, 'match_score': None, 'missing_keywords': None},
+                         'show_resume_generator'),
+}
+
+# Session keys that are accounted for but never evicted
+TRACKED_SESSION_KEYS = (
+    'matched_jobs',
+    'resume_text',
+    'user_profile',
+)
+
+# Session key holding {key: (id of value, time it was first seen)} for REBUILDABLE_SESSION_VALUES
+_UPDATED_AT_KEY = '_memory_updated_at'
+
+# Sessions that have not reported usage for this long no longer count
+SESSION_USAGE_TTL = 3600
+
+# Trimmable process caches together keep at least this share of the process
+# budget, even when caches that cannot be trimmed use up the rest
+MIN_TRIMMABLE_SHARE = 0.25
+
+_FLOAT_SIZE = sys.getsizeof(0.0)
+
+_process_caches = {}
+_session_usage = {}
+_usage_lock = threading.Lock()
+
+
+def estimate_bytes(obj, _seen=None):
+    """Approximate deep size of obj in bytes.
+
+    Job records are owned by the process-wide job store and count as zero
+    here; numpy arrays report their buffer size and float lists (embeddings)
+    are sized without walking every element.
+    """
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen or isinstance(obj, Job):
+        return 0
+    _seen.add(id(obj))
+
+    if isinstance(obj, (str, bytes, bytearray, int, float, bool)) or obj is None:
+        return sys.getsizeof(obj)
+    nbytes = getattr(obj, 'nbytes', None)
+    if isinstance(nbytes, int) and hasattr(obj, 'dtype'):
+        return sys.getsizeof(obj) + (0 if getattr(obj, 'base', None) is not None else nbytes)
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            estimate_bytes(key, _seen) + estimate_bytes(value, _seen) for key, value in obj.items()
+        )
+    if isinstance(obj, (list, tuple)):
+        if obj and isinstance(obj[0], float):
+            return sys.getsizeof(obj) + len(obj) * _FLOAT_SIZE
+        return sys.getsizeof(obj) + sum(estimate_bytes(item, _seen) for item in obj)
+    if isinstance(obj, (set, frozenset)):
+        return sys.getsizeof(obj) + sum(estimate_bytes(item, _seen) for item in obj)
+    return sys.getsizeof(obj)
+
+
+def register_process_cache(name, size_fn, trim_fn=None):
+    """Account a process-wide cache under name.
+
+    size_fn() returns its current size in bytes. trim_fn(max_bytes), if
+    given, evicts least recently used entries down to max_bytes and returns
+    the number of bytes freed.
+    """
+    _process_caches[name] = (size_fn, trim_fn)
+
+
+register_process_cache('job_store', lambda: get_job_store().nbytes, lambda max_bytes: get_job_store().trim_to(max_bytes))
+register_process_cache('skill_index', lambda: get_skill_index().nbytes, lambda max_bytes: get_skill_index().trim_to(max_bytes))
+
+
+def _session_id():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+    except Exception:
+        ctx = None
+    return ctx.session_id if ctx is not None else 'local'
+
+
+def _last_used(entry):
+    if not isinstance(entry, dict):
+        return ''
+    return entry.get('last_used') or entry.get('timestamp', '')
+
+
+def _entry_order(cache_name, cache):
+    """Cache keys from least to most recently used."""
+    if cache_name == 'jobs_cache':
+        # Search entries carry timestamps; other caches are kept in recency order
+        return sorted(cache, key=lambda key: _last_used(cache[key]))
+    return list(cache)
+
+
+def _rebuildable_order(now):
+    """REBUILDABLE_SESSION_VALUES keys that hold a value, least recently updated first."""
+    previous = st.session_state.get(_UPDATED_AT_KEY) or {}
+    updated_at = {}
+    for key in REBUILDABLE_SESSION_VALUES:
+        value = st.session_state.get(key)
+        if value is None:
+            continue
+        seen = previous.get(key)
+        updated_at[key] = seen if seen and seen[0] == id(value) else (id(value), now)
+    st.session_state[_UPDATED_AT_KEY] = updated_at
+    return sorted(updated_at, key=lambda key: updated_at[key][1])
+
+
+def _session_breakdown():
+    breakdown = {}
+    for key in EVICTABLE_SESSION_CACHES + tuple(REBUILDABLE_SESSION_VALUES) + TRACKED_SESSION_KEYS:
+        if key in st.session_state:
+            breakdown[key] = estimate_bytes(st.session_state[key])
+    return breakdown
+
+
+def _process_breakdown():
+    breakdown = {}
+    for name, (size_fn, _) in list(_process_caches.items()):
+        try:
+            breakdown[name] = int(size_fn())
+        except Exception:
+            breakdown[name] = 0
+    return breakdown
+
+
+def _collect_cache_sizes(registry):
+    for name, nbytes in _process_breakdown().items():
+        registry.set('careerlens_process_cache_bytes', nbytes, cache=name)
+
+
+register_metrics_collector(_collect_cache_sizes)
+
+
+def _live_sessions_total(now):
+    with _usage_lock:
+        for session_id, (_, seen_at) in list(_session_usage.items()):
+            if now - seen_at > SESSION_USAGE_TTL:
+                del _session_usage[session_id]
+        return sum(size for size, _ in _session_usage.values()), len(_session_usage)
+
+
+def get_memory_usage():
+    """Current estimated usage for this session and for the whole process.
+
+    Returns a dict with per-key session bytes, per-cache process bytes, the
+    totals and both budgets. caches_total (the shared caches) is what the
+    process budget is enforced against; process_total adds every live
+    session, which each session's own budget already bounds.
+    """
+    now = time.time()
+    session = _session_breakdown()
+    session_total = sum(session.values())
+    with _usage_lock:
+        _session_usage[_session_id()] = (session_total, now)
+    sessions_total, session_count = _live_sessions_total(now)
+    process = _process_breakdown()
+    return {
+        'session': session,
+        'session_total': session_total,
+        'session_budget': SESSION_MEMORY_BUDGET,
+        'process': process,
+        'sessions_total': sessions_total,
+        'session_count': session_count,
+        'caches_total': sum(process.values()),
+        'process_total': sum(process.values()) + sessions_total,
+        'process_budget': PROCESS_MEMORY_BUDGET,
+    }
+
+
+def _evict_session_caches(bytes_to_free):
+    """Drop least recently used session cache entries, then rebuildable values, until bytes_to_free is reached."""
+    freed = 0
+    for cache_name in EVICTABLE_SESSION_CACHES:
+        cache = st.session_state.get(cache_name)
+        if isinstance(cache, list):
+            # Oldest entries first
+            while cache and freed < bytes_to_free:
+                freed += estimate_bytes(cache.pop(0))
+            continue
+        if not isinstance(cache, dict):
+            continue
+        for key in _entry_order(cache_name, cache):
+            if freed >= bytes_to_free:
+                return freed
+            freed += estimate_bytes(key) + estimate_bytes(cache.pop(key))
+    for key in _rebuildable_order(time.time()):
+        if freed >= bytes_to_free:
+            break
+        defaults, in_use_flag = REBUILDABLE_SESSION_VALUES[key]
+        if in_use_flag and st.session_state.get(in_use_flag):
+            continue
+        freed += sum(estimate_bytes(st.session_state.get(name)) for name in defaults)
+        for name, default in defaults.items():
+            st.session_state[name] = default
+    return freed
+
+
+def _trim_process_caches(bytes_to_free, process):
+    """Trim the process caches that have a trim_fn, each in proportion to its size.
+
+    Caches without one (e.g. skill embeddings) cannot give memory back, so
+    the trimmable caches never shrink below MIN_TRIMMABLE_SHARE of the
+    budget to make up for them.
+    """
+    trim_fns = {name: _process_caches.get(name, (None, None))[1] for name in process}
+    trimmable = {name: size for name, size in process.items() if size > 0 and trim_fns[name] is not None}
+    trimmable_total = sum(trimmable.values())
+    keep = max(trimmable_total - bytes_to_free, min(trimmable_total, MIN_TRIMMABLE_SHARE * PROCESS_MEMORY_BUDGET))
+    if keep >= trimmable_total:
+        # Already down to their minimum share: nothing to give back
+        return 0
+    freed = 0
+    for name, size in trimmable.items():
+        try:
+            freed += trim_fns[name](int(size * keep / trimmable_total)) or 0
+        except Exception:
+            pass
+    return freed
+
+
+def enforce_memory_budgets():
+    """Evict cache entries over the session or process budget.
+
+    A full garbage collection runs only when eviction actually freed
+    something, not on every script run, and not on every run of a session
+    that stays over budget with nothing left to give up. Returns the usage
+    after enforcement; budget_crossed is True when entries were evicted.
+    """
+    usage = get_memory_usage()
+    freed = 0
+
+    if usage['session_total'] > SESSION_MEMORY_BUDGET:
+        freed += _evict_session_caches(usage['session_total'] - SESSION_MEMORY_BUDGET)
+
+    if usage['caches_total'] > PROCESS_MEMORY_BUDGET:
+        freed += _trim_process_caches(usage['caches_total'] - PROCESS_MEMORY_BUDGET, usage['process'])
+
+    crossed = freed > 0
+    if crossed:
+        gc.collect()
+        usage = get_memory_usage()
+    usage['budget_crossed'] = crossed
+    return usage
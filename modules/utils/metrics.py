@@ -0,0 +1,329 @@
+"""Process-wide metrics: counters, gauges and histograms with Prometheus text export
+
+Every session in the process records into one registry, so figures are
+aggregates across users: p95 per pipeline stage, tokens per successful
+analysis, cache hit ratios. Export with render_prometheus(), a file
+(METRICS_FILE, rewritten after each analysis) or an HTTP endpoint
+(METRICS_PORT serves /metrics).
+"""
+import bisect
+import functools
+import os
+import threading
+import time
+from .config import METRICS_FILE, METRICS_PORT
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+TOKEN_BUCKETS = (100, 500, 1000, 2500, 5000, 10000, 25000, 50000, 100000, 250000)
+
+# name -> (type, help, histogram buckets)
+METRICS = {
+    'careerlens_api_requests_total': ('counter', "API request attempts by provider, endpoint and status", None),
+    'careerlens_api_request_seconds': ('histogram', "API request attempt latency", LATENCY_BUCKETS),
+    'careerlens_api_retries_total': ('counter', "API attempts retried after a 429, timeout or network error", None),
+    'careerlens_api_rate_limited_total': ('counter', "API responses with status 429", None),
+    'careerlens_api_backoff_seconds_total': ('counter', "Time spent backing off between API retries", None),
+    'careerlens_rate_limiter_wait_seconds_total': ('counter', "Time client-side rate limiters held requests back", None),
+    'careerlens_rate_limiter_waits_total': ('counter', "Requests a client-side rate limiter held back", None),
+    'careerlens_cache_lookups_total': ('counter', "Cache lookups by cache and result (hit/miss)", None),
+    'careerlens_cache_hit_ratio': ('gauge', "Hits / lookups per cache since start", None),
+    'careerlens_tokens_total': ('counter', "Tokens used by kind (embedding, prompt, completion)", None),
+    'careerlens_cost_usd_total': ('counter', "Estimated API cost in USD", None),
+    'careerlens_stage_seconds': ('histogram', "Matching pipeline stage duration", LATENCY_BUCKETS),
+    'careerlens_analyses_total': ('counter', "Matching pipeline runs by outcome status", None),
+    'careerlens_analysis_seconds': ('histogram', "Matching pipeline run duration", LATENCY_BUCKETS),
+    'careerlens_analysis_tokens': ('histogram', "Tokens used per successful analysis", TOKEN_BUCKETS),
+    'careerlens_documents_rendered_total': ('counter', "Resume documents rendered by format", None),
+    'careerlens_render_seconds': ('histogram', "Resume document render duration", LATENCY_BUCKETS),
+    'careerlens_process_cache_bytes': ('gauge', "Estimated size of process-wide caches", None),
+    'careerlens_process_peak_rss_bytes': ('gauge', "Process resident set size high-water mark", None),
+}
+
+
+class Histogram:
+    """Cumulative-bucket histogram (Prometheus semantics) with sum and count."""
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q):
+        """Estimate the q-quantile by linear interpolation within its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                if index == len(self.buckets):
+                    return float(self.buckets[-1])
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return float(self.buckets[-1])
+
+
+class MetricsRegistry:
+    """Thread-safe series store keyed by metric name and label set."""
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._series = {}
+        self._collectors = []
+
+    def _key(self, labels):
+        return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    def inc(self, name, amount=1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def set(self, name, value, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._series.setdefault(name, {})[key] = value
+
+    def observe(self, name, value, **labels):
+        key = self._key(labels)
+        buckets = METRICS.get(name, ('histogram', '', LATENCY_BUCKETS))[2] or LATENCY_BUCKETS
+        with self._lock:
+            series = self._series.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def register_collector(self, collect):
+        """collect(registry) runs before every export to refresh gauges."""
+        self._collectors.append(collect)
+
+    def collect(self):
+        for collect in list(self._collectors):
+            try:
+                collect(self)
+            except Exception:
+                pass
+
+    def series(self, name):
+        """{labels dict as tuple: value or Histogram} for name (a copy)."""
+        with self._lock:
+            return dict(self._series.get(name, {}))
+
+    def names(self):
+        with self._lock:
+            return list(self._series)
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry():
+    return _registry
+
+
+def inc_counter(name, amount=1, **labels):
+    _registry.inc(name, amount, **labels)
+
+
+def set_gauge(name, value, **labels):
+    _registry.set(name, value, **labels)
+
+
+def observe(name, value, **labels):
+    _registry.observe(name, value, **labels)
+
+
+def timed(name, **labels):
+    """Decorator observing the call's duration in histogram name."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                _registry.observe(name, time.perf_counter() - start, **labels)
+        return wrapper
+    return decorator
+
+
+def record_cache_lookup(cache, hits=0, misses=0):
+    """Count cache hits/misses (several at once for batch lookups)."""
+    if hits:
+        _registry.inc('careerlens_cache_lookups_total', hits, cache=cache, result='hit')
+    if misses:
+        _registry.inc('careerlens_cache_lookups_total', misses, cache=cache, result='miss')
+
+
+def cache_hit_ratios():
+    """{cache: hits / lookups} for every cache with at least one lookup."""
+    totals = {}
+    for labels, count in _registry.series('careerlens_cache_lookups_total').items():
+        labels = dict(labels)
+        hits, lookups = totals.get(labels['cache'], (0, 0))
+        totals[labels['cache']] = (hits + (count if labels['result'] == 'hit' else 0), lookups + count)
+    return {cache: round(hits / lookups, 4) for cache, (hits, lookups) in totals.items() if lookups}
+
+
+def histogram_quantiles(name, quantiles=(0.5, 0.95), by=None):
+    """{label value of by (or 'all'): {'count', 'mean', 'p50', 'p95', ...}} for histogram name."""
+    merged = {}
+    for labels, histogram in _registry.series(name).items():
+        group = dict(labels).get(by, '') if by else 'all'
+        target = merged.get(group)
+        if target is None:
+            target = merged[group] = Histogram(histogram.buckets)
+        target.counts = [a + b for a, b in zip(target.counts, histogram.counts)]
+        target.sum += histogram.sum
+        target.count += histogram.count
+    summary = {}
+    for group, histogram in merged.items():
+        stats = {'count': histogram.count, 'mean': round(histogram.sum / histogram.count, 4) if histogram.count else 0.0}
+        for q in quantiles:
+            stats[f"p{int(q * 100)}"] = round(histogram.quantile(q), 4)
+        summary[group] = stats
+    return summary
+
+
+def metrics_summary():
+    """Headline aggregates: per-stage latency, tokens per successful analysis, cache hit ratios."""
+    analyses = {dict(labels).get('status'): count
+                for labels, count in _registry.series('careerlens_analyses_total').items()}
+    return {
+        'stages': histogram_quantiles('careerlens_stage_seconds', by='stage'),
+        'analyses': analyses,
+        'tokens_per_analysis': histogram_quantiles('careerlens_analysis_tokens').get('all', {}),
+        'cache_hit_ratio': cache_hit_ratios(),
+        'api_latency': histogram_quantiles('careerlens_api_request_seconds', by='endpoint'),
+    }
+
+
+def _collect_builtin(registry):
+    for cache, ratio in cache_hit_ratios().items():
+        registry.set('careerlens_cache_hit_ratio', ratio, cache=cache)
+    try:
+        import resource
+        import sys
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        registry.set('careerlens_process_peak_rss_bytes', peak if sys.platform == 'darwin' else peak * 1024)
+    except (ImportError, OSError):
+        pass
+
+
+_registry.register_collector(_collect_builtin)
+
+
+def register_metrics_collector(collect):
+    _registry.register_collector(collect)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels, extra=()):
+    pairs = list(labels) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in pairs) + '}'
+
+
+def _format_value(value):
+    if isinstance(value, float):
+        value = round(value, 9)
+        return str(int(value)) if value.is_integer() else repr(value)
+    return str(value)
+
+
+def render_prometheus():
+    """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+    _registry.collect()
+    lines = []
+    for name in sorted(_registry.names()):
+        metric_type, help_text, _ = METRICS.get(name, ('untyped', '', None))
+        if help_text:
+            lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {metric_type}")
+        for labels, value in sorted(_registry.series(name).items()):
+            if isinstance(value, Histogram):
+                cumulative = 0
+                for bucket, count in zip(value.buckets, value.counts):
+                    cumulative += count
+                    lines.append(f"{name}_bucket{_format_labels(labels, [('le', _format_value(float(bucket)))])} {cumulative}")
+                lines.append(f"{name}_bucket{_format_labels(labels, [('le', '+Inf')])} {value.count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(value.sum)}")
+                lines.append(f"{name}_count{_format_labels(labels)} {value.count}")
+            else:
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+    return "\n".join(lines) + "\n"
+
+
+def dump_metrics(path=None):
+    """Write the Prometheus text to path (default METRICS_FILE) atomically; returns the path or None."""
+    path = path or METRICS_FILE
+    if not path:
+        return None
+    try:
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(render_prometheus())
+        os.replace(temp_path, path)
+        return path
+    except OSError:
+        return None
+
+
+_server = {'instance': None}
+_server_lock = threading.Lock()
+
+
+def start_metrics_server(port=None):
+    """Serve GET /metrics on port (default METRICS_PORT) from a daemon thread, once per process."""
+    port = port or METRICS_PORT
+    if not port:
+        return None
+    with _server_lock:
+        if _server['instance'] is not None:
+            return _server['instance']
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = render_prometheus().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        try:
+            server = ThreadingHTTPServer(('0.0.0.0', port), MetricsHandler)
+        except OSError:
+            # Another process (or an earlier import) already serves this port
+            return None
+        server.daemon_threads = True
+        threading.Thread(target=server.serve_forever, name='careerlens-metrics', daemon=True).start()
+        _server['instance'] = server
+        return server
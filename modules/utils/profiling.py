@@ -0,0 +1,194 @@
+"""Opt-in profiling of script runs and pipeline stages with cProfile and tracemalloc
+
+Profiling is off unless PROFILING_ENABLED is set (every session) or an admin
+turns it on for their own session with ?admin=<ADMIN_TOKEN>&profile=1.
+PROFILE_TARGETS picks what is wrapped: 'run' (a whole script run, the
+default) and/or pipeline stage names such as 'index,search'. Finished
+profiles are kept in a small process-wide history for the diagnostics page.
+"""
+import cProfile
+import hmac
+import io
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import deque
+from contextlib import contextmanager, nullcontext
+import streamlit as st
+from .config import PROFILING_ENABLED, PROFILE_TARGETS, PROFILE_HISTORY, ADMIN_TOKEN
+from .tracing import current_span
+
+TOP_FUNCTIONS = 25
+TOP_ALLOCATIONS = 25
+TRACEMALLOC_FRAMES = 1
+
+_profiles = deque(maxlen=PROFILE_HISTORY)
+_profiles_lock = threading.Lock()
+# cProfile allows one active profiler at a time; tracemalloc is process-wide
+_cpu_profiler_lock = threading.Lock()
+_tracemalloc_users = [0]
+_tracemalloc_lock = threading.Lock()
+
+
+def _targets():
+    return {target.strip() for target in PROFILE_TARGETS.split(',') if target.strip()}
+
+
+def is_admin_token(value):
+    """Constant-time check of value against ADMIN_TOKEN (never matches when no token is configured)."""
+    return bool(ADMIN_TOKEN) and isinstance(value, str) and hmac.compare_digest(value, ADMIN_TOKEN)
+
+
+def apply_admin_query_params():
+    """Read ?admin=<token>, ?profile=1|0 and ?diagnostics=1 into this session's state.
+
+    The token is removed from the URL once checked, so it does not linger in
+    the address bar, browser history or shared links; is_admin stays in
+    session state.
+    """
+    try:
+        params = st.query_params
+        admin = params.get('admin')
+        profile = params.get('profile')
+        diagnostics = params.get('diagnostics')
+    except Exception:
+        return
+    if admin is not None:
+        st.session_state.is_admin = is_admin_token(admin)
+        try:
+            del st.query_params['admin']
+        except Exception:
+            pass
+    if not st.session_state.get('is_admin'):
+        return
+    if profile is not None:
+        st.session_state.profiling_enabled = profile.lower() in ('1', 'true', 'yes', 'on')
+    if diagnostics is not None:
+        st.session_state.show_diagnostics = diagnostics.lower() in ('1', 'true', 'yes', 'on')
+
+
+def is_profiling_enabled():
+    if PROFILING_ENABLED:
+        return True
+    try:
+        return bool(st.session_state.get('profiling_enabled'))
+    except Exception:
+        return False
+
+
+def _start_tracemalloc():
+    with _tracemalloc_lock:
+        if _tracemalloc_users[0] == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+            _tracemalloc_users[0] = 1
+        elif _tracemalloc_users[0] > 0:
+            _tracemalloc_users[0] += 1
+        else:
+            # Someone else started tracemalloc; leave it running
+            return False
+    return True
+
+
+def _stop_tracemalloc():
+    with _tracemalloc_lock:
+        _tracemalloc_users[0] -= 1
+        if _tracemalloc_users[0] == 0:
+            tracemalloc.stop()
+
+
+def _top_functions(profiler, limit=TOP_FUNCTIONS):
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    rows = []
+    for (filename, line, function), (primitive_calls, calls, own_time, cumulative, _) in stats.stats.items():
+        rows.append({
+            'function': function,
+            'location': f"{filename}:{line}",
+            'calls': calls,
+            'own_s': round(own_time, 6),
+            'cumulative_s': round(cumulative, 6),
+        })
+    rows.sort(key=lambda row: row['cumulative_s'], reverse=True)
+    return rows[:limit]
+
+
+def _top_allocations(before, after, limit=TOP_ALLOCATIONS):
+    rows = []
+    for stat in after.compare_to(before, 'lineno')[:limit]:
+        frame = stat.traceback[0]
+        rows.append({
+            'location': f"{frame.filename}:{frame.lineno}",
+            'size_kb': round(stat.size_diff / 1024, 2),
+            'count': stat.count_diff,
+        })
+    return rows
+
+
+def _session_id():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx(suppress_warning=True)
+    except Exception:
+        ctx = None
+    return ctx.session_id if ctx is not None else 'local'
+
+
+@contextmanager
+def profile_block(name):
+    """cProfile + tracemalloc around the block; the result goes to the profile history.
+
+    If another block already holds the CPU profiler (a concurrent session, or
+    a stage inside a profiled run) only allocations are captured.
+    """
+    profiler = cProfile.Profile() if _cpu_profiler_lock.acquire(blocking=False) else None
+    traced_memory = _start_tracemalloc()
+    before = tracemalloc.take_snapshot() if traced_memory else None
+    if traced_memory:
+        tracemalloc.reset_peak()
+    span = current_span()
+    start = time.perf_counter()
+    try:
+        if profiler is not None:
+            profiler.enable()
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            _cpu_profiler_lock.release()
+        duration = time.perf_counter() - start
+        record = {
+            'name': name,
+            'session': _session_id(),
+            'started_at': time.time() - duration,
+            'duration_s': round(duration, 4),
+            'trace_id': getattr(span, 'trace_id', None),
+            'top_functions': _top_functions(profiler) if profiler is not None else [],
+            'top_allocations': [],
+            'peak_traced_kb': None,
+        }
+        if traced_memory:
+            after = tracemalloc.take_snapshot()
+            record['peak_traced_kb'] = round(tracemalloc.get_traced_memory()[1] / 1024, 1)
+            record['top_allocations'] = _top_allocations(before, after)
+            _stop_tracemalloc()
+        with _profiles_lock:
+            _profiles.append(record)
+
+
+def profile_if_enabled(target):
+    """profile_block(target) when profiling is on for this session and target is selected, else a no-op."""
+    if target in _targets() and is_profiling_enabled():
+        return profile_block(target)
+    return nullcontext()
+
+
+def get_profiles(limit=None):
+    """Recorded profiles, newest first."""
+    with _profiles_lock:
+        profiles = list(reversed(_profiles))
+    return profiles[:limit] if limit else profiles
+
+
+def clear_profiles():
+    with _profiles_lock:
+        _profiles.clear()
@@ -0,0 +1,212 @@
+"""Lightweight tracing: nested, timed spans kept in a ring buffer and optionally appended to a JSONL file"""
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from .config import TRACING_ENABLED, TRACE_BUFFER_SIZE, TRACE_FILE
+
+_current_span = ContextVar('careerlens_current_span', default=None)
+_finished_spans = deque(maxlen=TRACE_BUFFER_SIZE)
+_spans_lock = threading.Lock()
+_trace_file = {'path': TRACE_FILE, 'handle': None}
+
+
+def _new_id():
+    return os.urandom(8).hex()
+
+
+def _session_id():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx(suppress_warning=True)
+    except Exception:
+        ctx = None
+    return ctx.session_id if ctx is not None else None
+
+
+class Span:
+    """One timed operation. Attributes can be set while the span is open."""
+    __slots__ = ('name', 'trace_id', 'span_id', 'parent_id', 'start_time', 'duration_ms',
+                 'attributes', 'status', 'error', 'thread')
+
+    def __init__(self, name, parent=None, attributes=None):
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else _new_id()
+        self.span_id = _new_id()
+        self.parent_id = parent.span_id if parent is not None else None
+        self.start_time = time.time()
+        self.duration_ms = None
+        self.attributes = dict(attributes or {})
+        self.status = 'ok'
+        self.error = None
+        self.thread = threading.current_thread().name
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+        return self
+
+    def add(self, key, amount=1):
+        """Increment a numeric attribute (retries, tokens, wait seconds)."""
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+        return self
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'start_time': self.start_time,
+            'duration_ms': self.duration_ms,
+            'status': self.status,
+            'error': self.error,
+            'thread': self.thread,
+            'attributes': self.attributes,
+        }
+
+
+class _NoSpan:
+    """Returned by current_span() outside any span so callers never need to check."""
+    __slots__ = ()
+
+    def set(self, **attributes):
+        return self
+
+    def add(self, key, amount=1):
+        return self
+
+
+_NO_SPAN = _NoSpan()
+
+
+def current_span():
+    """The innermost open span on this thread/context, or a no-op stand-in."""
+    return _current_span.get() or _NO_SPAN
+
+
+def _write_span(record):
+    path = _trace_file['path']
+    if not path:
+        return
+    try:
+        if _trace_file['handle'] is None:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            _trace_file['handle'] = open(path, 'a', encoding='utf-8')
+        _trace_file['handle'].write(json.dumps(record, default=str) + "\n")
+        _trace_file['handle'].flush()
+    except OSError:
+        # Tracing must never break the request it is tracing
+        _trace_file['path'] = ''
+
+
+def _finish(span):
+    with _spans_lock:
+        _finished_spans.append(span)
+        if _trace_file['path']:
+            _write_span(span.to_dict())
+
+
+@contextmanager
+def trace_span(name, **attributes):
+    """Time the enclosed block as a span nested under the current one.
+
+    Exceptions mark the span as errored and propagate unchanged. Root spans
+    are tagged with the Streamlit session so one user's requests can be
+    picked out of a shared trace file.
+    """
+    if not TRACING_ENABLED:
+        yield _NO_SPAN
+        return
+    parent = _current_span.get()
+    span = Span(name, parent, attributes)
+    if parent is None:
+        session = _session_id()
+        if session:
+            span.attributes.setdefault('session', session)
+    token = _current_span.set(span)
+    start = time.perf_counter()
+    try:
+        yield span
+    except Exception as e:
+        span.status = 'error'
+        span.error = f"{type(e).__name__}: {e}"[:300]
+        raise
+    finally:
+        span.duration_ms = round((time.perf_counter() - start) * 1000, 3)
+        _current_span.reset(token)
+        _finish(span)
+
+
+def traced(name, **attributes):
+    """Decorator form of trace_span."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with trace_span(name, **attributes):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def get_recent_spans(limit=None, trace_id=None):
+    """Finished spans from the ring buffer as dicts, oldest first."""
+    with _spans_lock:
+        spans = list(_finished_spans)
+    if trace_id is not None:
+        spans = [span for span in spans if span.trace_id == trace_id]
+    if limit is not None:
+        spans = spans[-limit:]
+    return [span.to_dict() for span in spans]
+
+
+def clear_spans():
+    with _spans_lock:
+        _finished_spans.clear()
+
+
+def set_trace_file(path):
+    """Append finished spans to path as JSON lines from now on (None or '' stops)."""
+    with _spans_lock:
+        if _trace_file['handle'] is not None:
+            _trace_file['handle'].close()
+        _trace_file['path'] = path or ''
+        _trace_file['handle'] = None
+
+
+def load_spans(path):
+    """Read spans back from a JSONL trace file, skipping lines cut off mid-write."""
+    spans = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                spans.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return spans
+
+
+def format_trace(spans):
+    """Indented tree of span dicts (one trace), children in start order, for finding where time went."""
+    children = {}
+    span_ids = {span['span_id'] for span in spans}
+    for span in sorted(spans, key=lambda s: s['start_time']):
+        parent = span['parent_id'] if span['parent_id'] in span_ids else None
+        children.setdefault(parent, []).append(span)
+
+    lines = []
+
+    def walk(parent_id, depth):
+        for span in children.get(parent_id, []):
+            attributes = " ".join(f"{key}={value}" for key, value in span['attributes'].items() if key != 'session')
+            flag = f" [{span['error']}]" if span['status'] == 'error' else ""
+            lines.append(f"{'  ' * depth}{span['name']:<{max(1, 40 - 2 * depth)}} {span['duration_ms']:>10.1f} ms"
+                         f"  {attributes}{flag}".rstrip())
+            walk(span['span_id'], depth + 1)
+
+    walk(None, 0)
+    return "\n".join(lines)
@@ -0,0 +1,116 @@
+(function() {
+    if (window.__careerlensThemeInit__) {
+        return;
+    }
+    window.__careerlensThemeInit__ = true;
+
+    function updateTheme() {
+        const prefersDark = window.matchMedia('(prefers-color-scheme: dark)').matches;
+        const stApp = document.querySelector('.stApp') || document.querySelector('[data-testid="stApp"]');
+
+        if (prefersDark) {
+            document.documentElement.setAttribute('data-theme', 'dark');
+            document.body.setAttribute('data-theme', 'dark');
+            if (stApp) {
+                stApp.setAttribute('data-theme', 'dark');
+            }
+        } else {
+            document.documentElement.removeAttribute('data-theme');
+            document.body.removeAttribute('data-theme');
+            if (stApp) {
+                stApp.removeAttribute('data-theme');
+            }
+        }
+    }
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', updateTheme);
+    } else {
+        updateTheme();
+    }
+
+    const mediaQuery = window.matchMedia('(prefers-color-scheme: dark)');
+    if (mediaQuery.addEventListener) {
+        mediaQuery.addEventListener('change', updateTheme);
+    } else if (mediaQuery.addListener) {
+        mediaQuery.addListener(updateTheme);
+    }
+})();
+
+(function() {
+    if (window.__careerlensReconnectInit__) {
+        return;
+    }
+    window.__careerlensReconnectInit__ = true;
+
+    let isReconnecting = false;
+
+    function getOverlay() {
+        let overlay = document.getElementById('ws-reconnecting-overlay');
+        if (!overlay && document.body) {
+            overlay = document.createElement('div');
+            overlay.id = 'ws-reconnecting-overlay';
+            overlay.className = 'ws-reconnecting-overlay';
+            overlay.innerHTML = '<div class="ws-reconnecting-content">' +
+                '<div class="ws-reconnecting-spinner"></div>' +
+                '<div class="ws-reconnecting-text">Reconnecting...</div>' +
+                '<div class="ws-reconnecting-subtext">Please wait while we restore your connection</div>' +
+                '</div>';
+            document.body.appendChild(overlay);
+        }
+        return overlay;
+    }
+
+    function showReconnectingOverlay() {
+        const overlay = getOverlay();
+        if (overlay && !isReconnecting) {
+            isReconnecting = true;
+            overlay.classList.add('active');
+        }
+    }
+
+    function hideReconnectingOverlay() {
+        const overlay = getOverlay();
+        if (overlay) {
+            isReconnecting = false;
+            overlay.classList.remove('active');
+        }
+    }
+
+    function initReconnectionHandlers() {
+        window.addEventListener('offline', function() {
+            showReconnectingOverlay();
+        });
+
+        window.addEventListener('online', function() {
+            setTimeout(function() {
+                hideReconnectingOverlay();
+            }, 1000);
+        });
+
+        const observer = new MutationObserver(function(mutations) {
+            mutations.forEach(function(mutation) {
+                if (mutation.addedNodes.length) {
+                    mutation.addedNodes.forEach(function(node) {
+                        if (node.nodeType === 1 && node.textContent && node.textContent.includes('Connecting')) {
+                            showReconnectingOverlay();
+                        }
+                    });
+                }
+            });
+        });
+
+        if (document.body) {
+            observer.observe(document.body, {
+                childList: true,
+                subtree: true
+            });
+        }
+    }
+
+    if (document.readyState === 'loading') {
+        document.addEventListener('DOMContentLoaded', initReconnectionHandlers);
+    } else {
+        initReconnectionHandlers();
+    }
+})();
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for the benchmark measurement helpers and result comparison
+"""
+
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.e2e import compare_results, _empty_stage, _job_count
+from benchmarks import micro, load
+
+
+def _results(commit, fetch_s, index_calls, peak_rss_mb=100.0):
+    fetch = dict(_empty_stage(), wall_s=fetch_s)
+    index = _empty_stage()
+    index['api_calls']['embeddings'] = index_calls
+    return {
+        'commit': commit,
+        'runs': [{
+            'jobs': 1000, 'run': 0, 'cache': 'cold', 'wall_s': fetch_s + 1.0,
+            'peak_rss_mb': peak_rss_mb, 'stages': {'fetch': fetch, 'index': index},
+        }],
+    }
+
+
+def test_compare_flags_slower_stages_and_extra_calls():
+    base = _results('aaa', fetch_s=1.0, index_calls=2)
+
+    _, regressions = compare_results(base, _results('bbb', fetch_s=1.05, index_calls=2))
+    assert regressions == []
+
+    lines, regressions = compare_results(base, _results('ccc', fetch_s=1.5, index_calls=3, peak_rss_mb=150.0))
+    assert regressions == [
+        "1000 jobs (cold) peak RSS",
+        "1000 jobs (cold) fetch wall time",
+        "1000 jobs (cold) index API calls",
+    ]
+    assert lines[0] == "aaa → ccc"
+
+
+def test_corpus_size_bounds():
+    assert _job_count("25") == 25 and _job_count("50000") == 50000
+    for value in ("24", "50001"):
+        try:
+            _job_count(value)
+            raise AssertionError(f"{value} should be rejected")
+        except argparse.ArgumentTypeError:
+            pass
+
+
+def test_micro_measures_speed_and_allocations():
+    timing = micro.measure(lambda: sum(range(100)), min_time=0.01, repeats=3)
+    assert timing['ops_per_sec'] > 0 and timing['calls'] >= 3
+
+    allocations = micro.measure_allocations(lambda: [0] * 100000, samples=2)
+    assert allocations['alloc_peak_kb'] >= 700
+    assert allocations['alloc_retained_kb'] < 100
+
+    base = {'commit': 'aaa', 'results': [{'name': 'op', 'ops_per_sec': 1000.0, 'alloc_peak_kb': 10.0}]}
+    new = {'commit': 'bbb', 'results': [{'name': 'op', 'ops_per_sec': 800.0, 'alloc_peak_kb': 20.0}]}
+    _, regressions = micro.compare_results(base, new)
+    assert regressions == ["op ops/sec", "op allocations"]
+
+
+def test_load_percentiles_and_compare():
+    latencies = [float(i) for i in range(1, 101)]
+    summary = load.latency_summary(latencies)
+    assert summary['p50'] == 50.0 and summary['p99'] == 99.0 and summary['max'] == 100.0
+    assert load.percentile([3.0], 95) == 3.0 and load.percentile([], 50) == 0.0
+
+    def level(sessions_per_min, p95, peak_rss_mb):
+        return {'users': 4, 'throughput': {'sessions_per_min': sessions_per_min}, 'latency': {'p95': p95},
+                'memory': {'peak_rss_mb': peak_rss_mb}}
+
+    base = {'commit': 'aaa', 'levels': [level(20.0, 2.0, 300.0)]}
+    _, regressions = load.compare_results(base, {'commit': 'bbb', 'levels': [level(19.5, 2.1, 310.0)]})
+    assert regressions == []
+    _, regressions = load.compare_results(base, {'commit': 'ccc', 'levels': [level(15.0, 3.0, 400.0)]})
+    assert regressions == ["4 users throughput", "4 users p95 latency", "4 users peak RSS"]
+
+
+def test_compare_subcommand_exits_nonzero_on_regressions():
+    import json
+    import tempfile
+    def level(p95):
+        return {'users': 4, 'throughput': {'sessions_per_min': 20.0}, 'latency': {'p95': p95},
+                'memory': {'peak_rss_mb': 300.0}}
+    with tempfile.TemporaryDirectory() as directory:
+        paths = {}
+        for commit, p95 in (('aaa', 2.0), ('bbb', 2.05), ('ccc', 3.0)):
+            paths[commit] = os.path.join(directory, f"{commit}.json")
+            with open(paths[commit], 'w') as f:
+                json.dump({'commit': commit, 'levels': [level(p95)]}, f)
+        assert load.main(['compare', paths['aaa'], paths['bbb']]) == 0
+        assert load.main(['compare', paths['aaa'], paths['ccc'], '--threshold', '0.5']) == 0
+        assert load.main(['compare', paths['aaa'], paths['ccc']]) == 1
+
+
+if __name__ == "__main__":
+    test_compare_flags_slower_stages_and_extra_calls()
+    test_corpus_size_bounds()
+    test_micro_measures_speed_and_allocations()
+    test_load_percentiles_and_compare()
+    test_compare_subcommand_exits_nonzero_on_regressions()
+    print("✅ All tests passed!")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for parallel PDF page extraction and the page-level text cache
+"""
+
+import io
+import os
+import sys
+
+import PyPDF2
+from reportlab.lib.pagesizes import A4
+from reportlab.pdfgen import canvas
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.resume_upload import file_extraction
+from modules.utils.tracing import trace_span, get_recent_spans
+
+
+class _Upload(io.BytesIO):
+    """Minimal stand-in for Streamlit's UploadedFile"""
+    def __init__(self, data, name):
+        super().__init__(data)
+        self.name = name
+
+
+def _build_pdf(page_count):
+    buffer = io.BytesIO()
+    pdf = canvas.Canvas(buffer, pagesize=A4)
+    for page in range(page_count):
+        pdf.drawString(72, 750, f"Page {page + 1} - Senior Engineer at Company {page}")
+        pdf.drawString(72, 730, f"Python, SQL and Kubernetes experience line {page}")
+        pdf.showPage()
+    pdf.save()
+    return buffer.getvalue()
+
+
+def _sequential_text(pdf_bytes):
+    reader = PyPDF2.PdfReader(io.BytesIO(pdf_bytes))
+    return "".join(page.extract_text() + "\n" for page in reader.pages)
+
+
+def test_parallel_extraction_matches_sequential():
+    pdf_bytes = _build_pdf(6)
+    original = (file_extraction.PDF_EXTRACTION_WORKERS, file_extraction.PDF_PARALLEL_MIN_PAGES)
+    file_extraction.PDF_EXTRACTION_WORKERS = 2
+    file_extraction.PDF_PARALLEL_MIN_PAGES = 2
+    file_extraction._page_text_cache.clear()
+    try:
+        with trace_span('test.extract') as root:
+            text = file_extraction.extract_text_from_resume(_Upload(pdf_bytes, "cv.pdf"))
+    finally:
+        file_extraction._reset_pdf_pool()
+        file_extraction.PDF_EXTRACTION_WORKERS, file_extraction.PDF_PARALLEL_MIN_PAGES = original
+    assert text == _sequential_text(pdf_bytes)
+    # Every page came back from a worker process, not the in-process fallback
+    span = next(span for span in get_recent_spans(trace_id=root.trace_id) if span['name'] == 'resume.extract_text')
+    assert span['attributes']['parallel'] is True
+    assert span['attributes']['worker_pages'] == 6
+
+
+def test_pages_stream_in_order_and_hit_cache():
+    pdf_bytes = _build_pdf(3)
+    file_extraction._page_text_cache.clear()
+    pages = list(file_extraction.iter_pdf_page_texts(pdf_bytes))
+    assert [p.split(" - ")[0] for p in pages] == ["Page 1", "Page 2", "Page 3"]
+    assert len(file_extraction._page_text_cache) == 3
+
+    # Second pass must be served entirely from the digest cache
+    original = PyPDF2.PageObject.extract_text
+    PyPDF2.PageObject.extract_text = lambda *args, **kwargs: "SHOULD NOT BE CALLED"
+    try:
+        cached_pages = list(file_extraction.iter_pdf_page_texts(pdf_bytes))
+    finally:
+        PyPDF2.PageObject.extract_text = original
+    assert cached_pages == pages
+
+
+if __name__ == "__main__":
+    test_parallel_extraction_matches_sequential()
+    test_pages_stream_in_order_and_hit_cache()
+    print("✅ All tests passed!")
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Startup budget: app_new.py must not import heavy libraries or spend long in its own imports
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from benchmarks.coldstart import parse_importtime, summarize_imports, import_profile
+
+# Measured ~125 ms here after deferring pandas/numpy/PyPDF2/docx (was ~640 ms); generous for slow CI
+APP_IMPORT_BUDGET_MS = 400
+
+
+def test_parse_importtime():
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       120 |        120 |     numpy.core",
+        "import time:      2000 |       2120 |   numpy",
+        "import time:       300 |       2420 | modules.analysis",
+        "import time:      5000 |       5000 | streamlit",
+        "some unrelated warning",
+    ])
+    entries = parse_importtime(stderr)
+    assert entries[0] == ('numpy.core', 2, 120, 120)
+    assert entries[2] == ('modules.analysis', 0, 300, 2420)
+    summary = summarize_imports(entries)
+    assert summary['import_ms'] == 7.4 and summary['app_import_ms'] == 2.4
+    assert summary['deferred_loaded'] == ['numpy']
+    assert summary['slowest'][0] == {'module': 'streamlit', 'ms': 5.0}
+
+
+def test_app_cold_start_stays_within_budget():
+    wall_ms, entries = import_profile()
+    summary = summarize_imports(entries)
+    assert summary['deferred_loaded'] == [], f"imported at startup: {summary['deferred_loaded']}"
+    assert summary['app_import_ms'] < APP_IMPORT_BUDGET_MS, (
+        f"app imports took {summary['app_import_ms']} ms (budget {APP_IMPORT_BUDGET_MS} ms): {summary['slowest']}"
+    )
+
+
+if __name__ == "__main__":
+    test_parse_importtime()
+    test_app_cold_start_stays_within_budget()
+    print("✅ All tests passed!")
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared job vector corpus and its snapshot views
+"""
+
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+from modules.semantic_search import JobCorpus
+from modules.semantic_search import job_search
+from modules.semantic_search.job_search import SemanticJobSearch
+
+
+def _vec(*values):
+    return list(values)
+
+
+def test_views_are_stable_snapshots():
+    corpus = JobCorpus(max_jobs=300)
+    corpus.add(["a", "b"], [_vec(1.0, 0.0), _vec(0.0, 2.0)])
+    view = corpus.view(["b", "missing", "a"])
+
+    assert view.present == [True, False, True]
+    assert np.allclose(view.similarities([0.0, 1.0]), [1.0, 0.0])
+
+    # Later writers (growth, then a reset at max_jobs) never change an existing view
+    corpus.add([f"job{i}" for i in range(290)], [_vec(1.0, float(i)) for i in range(290)])
+    corpus.add([f"new{i}" for i in range(20)], [_vec(0.0, 1.0)] * 20)
+    assert "a" not in corpus and len(corpus) == 20
+    assert np.allclose(view.vectors(), [[0.0, 1.0], [1.0, 0.0]])
+
+    vector = corpus.vector("new0")
+    assert not vector.flags.writeable
+
+
+def test_concurrent_writers_keep_every_vector():
+    corpus = JobCorpus()
+
+    def add_batch(batch):
+        ids = [f"{batch}-{i}" for i in range(50)]
+        corpus.add(ids, [_vec(float(batch), float(i)) for i in range(50)])
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(add_batch, range(16)))
+
+    assert len(corpus) == 800
+    snapshot = corpus.snapshot
+    row = snapshot.row("7-3")
+    expected = np.array([7.0, 3.0]) / np.linalg.norm([7.0, 3.0])
+    assert np.allclose(snapshot.matrix[row], expected)
+
+
+def test_filling_the_corpus_keeps_the_rows_a_caller_views():
+    corpus = JobCorpus(max_jobs=4)
+    corpus.add(["a", "b", "c"], [_vec(1.0, 0.0), _vec(0.0, 1.0), _vec(1.0, 1.0)])
+    ids = ["a", "b", "c", "d", "e"]
+    snapshot = corpus.add(["d", "e"], [_vec(2.0, 0.0), _vec(0.0, 2.0)], keep=ids)
+    view = corpus.view(ids)
+    assert view.present == [True] * 5
+    assert np.allclose(view.vectors()[0], [1.0, 0.0])
+    assert snapshot is corpus.snapshot
+
+    # A trim by another session between looking and adding: rows come back from the pinned snapshot
+    pinned = corpus.snapshot
+    corpus.trim_to(0)
+    assert len(corpus) == 0
+    snapshot = corpus.add([], [], keep=ids, pinned=pinned)
+    assert corpus.view(ids).present == [True] * 5
+    assert np.allclose(snapshot.matrix[snapshot.row("e")], [0.0, 1.0])
+
+
+def test_trim_keeps_the_most_recently_used_rows():
+    corpus = JobCorpus()
+    ids = [f"job{i}" for i in range(10)]
+    corpus.add(ids, [_vec(1.0, float(i)) for i in range(10)])
+    # Capacity is preallocated; only the rows in use count
+    assert corpus.nbytes == 10 * 2 * 4 < corpus.snapshot.matrix.nbytes
+
+    old_view = corpus.view(ids)
+    corpus.view(["job2", "job7", "job5"])
+    assert corpus.trim_to(3 * 8) == 7 * 8
+    assert len(corpus) == 3 and corpus.nbytes == 3 * 8
+    assert corpus.view(ids).present == [i in (2, 5, 7) for i in range(10)]
+    expected = np.array([1.0, 7.0]) / np.linalg.norm([1.0, 7.0])
+    assert np.allclose(corpus.vector("job7"), expected)
+    # Sessions holding the earlier snapshot are unaffected
+    assert old_view.present == [True] * 10 and len(old_view.vectors()) == 10
+
+    assert corpus.trim_to(3 * 8) == 0
+    corpus.add(["new"], [_vec(0.0, 1.0)])
+    assert len(corpus) == 4 and corpus.view(["job2", "new"]).present == [True, True]
+
+
+class _Embedder:
+    def get_embeddings_batch(self, texts):
+        return [[1.0, float(len(text) % 7)] for text in texts], len(texts)
+
+
+def test_index_jobs_keeps_every_job_when_the_corpus_fills():
+    corpus = JobCorpus(max_jobs=4)
+    original = job_search.get_job_corpus
+    job_search.get_job_corpus = lambda: corpus
+    try:
+        search = SemanticJobSearch(_Embedder(), use_persistent_store=False)
+        jobs = [{'title': f"Job {i}", 'company': "Acme", 'description': f"Role {i}", 'skills': []} for i in range(5)]
+        search.index_jobs(jobs[:3], max_jobs_to_index=3)
+        search.index_jobs(jobs, max_jobs_to_index=5)
+    finally:
+        job_search.get_job_corpus = original
+    assert search.view.present == [True] * 5
+    assert len(search.jobs) == 5
+
+
+if __name__ == "__main__":
+    test_views_are_stable_snapshots()
+    test_concurrent_writers_keep_every_vector()
+    test_filling_the_corpus_keeps_the_rows_a_caller_views()
+    test_trim_keeps_the_most_recently_used_rows()
+    test_index_jobs_keeps_every_job_when_the_corpus_fills()
+    print("✅ All tests passed!")
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Tests for the slotted Job record and the process-wide job store
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.jobs import Job, JobStore, job_hash, job_snippet, SNIPPET_CHARS
+from modules.skills import job_skill_ids
+
+
+def _job_dict(title="Data Engineer", company="Acme", url="https://example.com/1"):
+    return {
+        'title': title,
+        'company': company,
+        'location': "Hong Kong",
+        'description': "Build pipelines",
+        'url': url,
+        'skills': ["Python", "SQL"],
+    }
+
+
+def test_job_reads_like_a_dict():
+    data = _job_dict()
+    job = Job.from_mapping(data)
+
+    assert job['title'] == "Data Engineer"
+    assert job.get('salary', 'Not specified') == 'Not specified'
+    assert 'salary' not in job and 'skills' in job
+    assert job == data
+    assert job.job_id == job_hash(data)
+
+    # Skill IDs are cached on the record like they were on dicts
+    ids = job_skill_ids(job)
+    assert job['skill_ids'] == ids
+    job['match_note'] = "extra"
+    assert job.get('match_note') == "extra"
+
+
+def test_company_and_location_strings_are_interned():
+    first = Job.from_mapping(_job_dict(company="".join(["Ac", "me"]), url="a"))
+    second = Job.from_mapping(_job_dict(company="".join(["Acm", "e"]), url="b"))
+    assert first['company'] is second['company']
+    assert first['location'] is second['location']
+
+
+def test_store_keeps_one_instance_per_posting():
+    store = JobStore(max_jobs=2)
+    first = store.add(_job_dict())
+    again = store.add({**_job_dict(), 'posted_date': "Today"})
+    assert again is first
+    assert first['posted_date'] == "Today"
+
+    other = store.add(_job_dict(url="https://example.com/2"))
+    assert store.get_many([first.job_id, other.job_id]) == [first, other]
+
+    # Least recently used posting is evicted; ID lookups for it miss
+    store.add(_job_dict(url="https://example.com/3"))
+    assert len(store) == 2
+    assert store.get(first.job_id) is None
+    assert store.get_many([first.job_id, other.job_id]) is None
+
+
+def test_descriptions_are_compressed_with_a_snippet():
+    description = "Design data pipelines in Python and SQL.\n\n" * 500
+    job = Job.from_mapping({**_job_dict(), 'description': description})
+
+    assert job.description_nbytes < len(description) // 10
+    assert job['description'] == description
+    assert len(job.snippet) <= SNIPPET_CHARS + 1
+    assert job.snippet.startswith("Design data pipelines in Python and SQL. Design")
+    assert job_snippet(job) is job.snippet
+
+    # Plain dicts get the same snippet on the fly
+    assert job_snippet({'description': description}) == job.snippet
+
+    # Refreshing a stored posting copies the compressed blob as-is
+    store = JobStore()
+    stored = store.add(job)
+    store.add(Job.from_mapping({**_job_dict(), 'description': "Updated"}))
+    assert stored['description'] == "Updated" and stored.snippet == "Updated"
+
+
+if __name__ == "__main__":
+    test_job_reads_like_a_dict()
+    test_company_and_location_strings_are_interned()
+    test_store_keeps_one_instance_per_posting()
+    test_descriptions_are_compressed_with_a_snippet()
+    print("✅ All tests passed!")
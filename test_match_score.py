@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for match score recalculation reusing job vectors and keywords
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.utils import api_clients
+from modules.utils.api_clients import AzureOpenAITextGenerator
+
+
+class _EmbeddingGen:
+    def __init__(self):
+        self.calls = []
+
+    def get_embedding(self, text):
+        self.calls.append(text)
+        return [1.0, 0.5, 0.0], 10
+
+
+class _Response:
+    status_code = 200
+
+    def json(self):
+        content = json.dumps({"keywords": ["Python", "Kubernetes", "SQL"]})
+        return {"choices": [{"message": {"content": content}}]}
+
+
+def test_recalculation_reuses_job_vector_and_keywords():
+    text_gen = AzureOpenAITextGenerator("key", "https://example.openai.azure.com")
+    embedding_gen = _EmbeddingGen()
+    completions = []
+
+    def fake_post(*args, **kwargs):
+        completions.append(kwargs.get("json"))
+        return _Response()
+
+    original_post = api_clients.requests.post
+    api_clients.requests.post = fake_post
+    try:
+        for resume in ("Python and SQL developer", "Python, SQL and Kubernetes developer"):
+            score, missing = text_gen.calculate_match_score(
+                resume,
+                "We need Python, Kubernetes and SQL",
+                embedding_gen,
+                job_embedding=[1.0, 0.5, 0.0],
+                job_key="job-1"
+            )
+    finally:
+        api_clients.requests.post = original_post
+
+    # Only the edited resume is embedded; keywords are extracted once per job
+    assert embedding_gen.calls == ["Python and SQL developer", "Python, SQL and Kubernetes developer"]
+    assert len(completions) == 1
+    assert round(score, 6) == 1.0
+    assert missing == []
+
+
+def test_job_keywords_cache_is_bounded_and_trimmable():
+    text_gen = AzureOpenAITextGenerator("key", "https://example.openai.azure.com")
+    original = api_clients.JOB_KEYWORDS_CACHE_SIZE
+    api_clients.JOB_KEYWORDS_CACHE_SIZE = 3
+    try:
+        for i in range(5):
+            text_gen._store_job_keywords(f"job-{i}", [f"Skill {i}"] * 20)
+        assert text_gen._get_job_keywords("job-2") is not None
+    finally:
+        api_clients.JOB_KEYWORDS_CACHE_SIZE = original
+    assert list(text_gen._job_keywords_cache) == ["job-3", "job-4", "job-2"]
+
+    before = text_gen.job_keywords_nbytes()
+    assert text_gen.trim_job_keywords(before // 2) > 0
+    assert text_gen.job_keywords_nbytes() <= before // 2
+    # The most recently used entry goes last
+    assert text_gen._get_job_keywords("job-2") is not None and text_gen._get_job_keywords("job-3") is None
+
+
+if __name__ == "__main__":
+    test_recalculation_reuses_job_vector_and_keywords()
+    test_job_keywords_cache_is_bounded_and_trimmable()
+    print("✅ All tests passed!")
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Tests for the headless matching pipeline
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.pipeline import MatchingPipeline, MatchingRequest, STAGES
+from modules.pipeline import matching
+
+
+class _Scraper:
+    def __init__(self, jobs, events=None, delay=0.0):
+        self.jobs = jobs
+        self.events = events if events is not None else []
+        self.delay = delay
+
+    def search_jobs(self, query, location, max_rows, job_type, country):
+        time.sleep(self.delay)
+        self.events.append('fetch_done')
+        return list(self.jobs)
+
+
+class _EmbeddingGen:
+    def __init__(self, events=None):
+        self.events = events if events is not None else []
+
+    def _vector(self, text):
+        text = text.lower()
+        return [float(text.count(word)) + 0.01 for word in ("python", "sql", "finance", "marketing")]
+
+    def get_embedding(self, text):
+        self.events.append('embed')
+        return self._vector(text), 1
+
+    def get_embeddings_batch(self, texts, batch_size=None):
+        return [self._vector(text) for text in texts], len(texts)
+
+
+def _job(i, title, skills):
+    return {
+        'title': title,
+        'company': f"Company {i}",
+        'location': "Hong Kong",
+        'description': f"{title} role using {', '.join(skills)}",
+        'skills': skills,
+        'url': f"https://jobs.example/{i}",
+        'salary': "",
+    }
+
+
+JOBS = [
+    _job(0, "Marketing Manager", ["marketing", "branding"]),
+    _job(1, "Python Developer", ["python", "sql"]),
+    _job(2, "Finance Analyst", ["finance", "excel"]),
+]
+
+
+def _run(overlap):
+    progress = []
+    events = []
+    pipeline = MatchingPipeline(
+        _Scraper(JOBS, events, delay=0.2),
+        _EmbeddingGen(events),
+        progress_callback=lambda stage, percent, message: progress.append((stage, percent)),
+        overlap=overlap,
+        use_persistent_store=False
+    )
+    result = pipeline.run(
+        MatchingRequest(search_query="pipeline test", force_refresh=True),
+        resume_text="Python and SQL developer",
+        user_profile={'skills': "Python, SQL"}
+    )
+    return result, progress, events
+
+
+def test_pipeline_ranks_matches_and_times_stages():
+    for overlap in (False, True):
+        result, progress, _ = _run(overlap)
+        assert result.status == 'ok'
+        assert result.matches[0]['job']['title'] == "Python Developer"
+        assert result.matches[0]['skill_match_score'] == 1.0
+        assert result.resume_embedding is not None
+        assert set(STAGES) <= set(result.timings)
+        percents = [percent for _, percent in progress]
+        assert percents == sorted(percents)
+
+
+def test_overlap_embeds_resume_during_job_fetch():
+    _, _, events = _run(overlap=False)
+    assert events == ['fetch_done', 'embed']
+    _, _, events = _run(overlap=True)
+    assert events == ['embed', 'fetch_done']
+
+
+def test_pipeline_reports_empty_fetch():
+    pipeline = MatchingPipeline(_Scraper([]), _EmbeddingGen(), use_persistent_store=False)
+    result = pipeline.run(MatchingRequest(search_query="pipeline empty"))
+    assert result.status == 'no_jobs'
+    assert result.matches == []
+
+
+def test_overlapped_embedding_is_returned_when_no_jobs_remain():
+    original_filter = matching.filter_jobs_by_domains
+    matching.filter_jobs_by_domains = lambda jobs, domains: []
+    try:
+        for jobs, status in (([], 'no_jobs'), (JOBS, 'no_filtered_jobs')):
+            events = []
+            pipeline = MatchingPipeline(_Scraper(jobs, events), _EmbeddingGen(events), overlap=True,
+                                        use_persistent_store=False)
+            result = pipeline.run(
+                MatchingRequest(search_query=f"pipeline {status}", target_domains=["Healthcare"],
+                                force_refresh=True),
+                resume_text="Python and SQL developer"
+            )
+            assert result.status == status
+            assert result.resume_embedding is not None and events.count('embed') == 1
+    finally:
+        matching.filter_jobs_by_domains = original_filter
+
+if __name__ == "__main__":
+    test_pipeline_ranks_matches_and_times_stages()
+    test_overlap_embeds_resume_during_job_fetch()
+    test_pipeline_reports_empty_fetch()
+    test_overlapped_embedding_is_returned_when_no_jobs_remain()
+    print("✅ All tests passed!")
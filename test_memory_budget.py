@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Tests for session/process memory accounting and budget enforcement
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import streamlit as st
+from modules.jobs import Job, JobStore, job_hash
+from modules.utils import memory
+from modules.utils.memory import estimate_bytes, enforce_memory_budgets, get_memory_usage
+
+
+def _reset_session():
+    for key in list(st.session_state.keys()):
+        del st.session_state[key]
+
+
+def _with_budgets(session_budget, process_budget, func):
+    original = (memory.SESSION_MEMORY_BUDGET, memory.PROCESS_MEMORY_BUDGET, memory.gc.collect)
+    collections = []
+    memory.SESSION_MEMORY_BUDGET, memory.PROCESS_MEMORY_BUDGET = session_budget, process_budget
+    memory.gc.collect = lambda: collections.append(1)
+    try:
+        return func(), collections
+    finally:
+        memory.SESSION_MEMORY_BUDGET, memory.PROCESS_MEMORY_BUDGET, memory.gc.collect = original
+
+
+def test_estimate_bytes():
+    embedding = [0.1] * 1536
+    assert estimate_bytes(embedding) >= 1536 * 24
+    # Jobs belong to the shared job store and are not charged to sessions
+    job = Job(title="Engineer", company="Acme", url="#", description="x" * 5000)
+    assert estimate_bytes([{'job': job}]) < 1000
+    assert estimate_bytes({'a': "b" * 1000}) > 1000
+
+
+def test_session_budget_evicts_least_recently_used_and_collects():
+    _reset_session()
+    st.session_state.jobs_cache = {
+        f"search{i}": {
+            'job_ids': [f"{i}-{n:032d}" for n in range(200)],
+            'timestamp': f"2024-01-01T00:00:{i:02d}",
+        }
+        for i in range(10)
+    }
+    # A cache hit makes an old search the most recently used
+    st.session_state.jobs_cache["search0"]['last_used'] = "2024-01-02T00:00:00"
+    per_entry = estimate_bytes(st.session_state.jobs_cache["search1"])
+
+    usage, collections = _with_budgets(10 ** 9, 10 ** 12, enforce_memory_budgets)
+    assert not usage['budget_crossed'] and not collections
+    assert usage['session']['jobs_cache'] >= 9 * per_entry
+
+    budget = int(per_entry * 4.5)
+    usage, collections = _with_budgets(budget, 10 ** 12, enforce_memory_budgets)
+    assert usage['budget_crossed'] and collections == [1]
+    assert sorted(st.session_state.jobs_cache) == ["search0", "search7", "search8", "search9"]
+    assert usage['session_total'] <= budget
+
+
+def test_process_budget_trims_registered_caches():
+    _reset_session()
+    store = JobStore()
+    for i in range(20):
+        store.add({'title': f"Role {i}", 'company': "Acme", 'url': f"#{i}", 'description': f"{i} " * 2000})
+
+    original_caches = memory._process_caches
+    memory._process_caches = {}
+    memory.register_process_cache('test_jobs', lambda: store.nbytes, store.trim_to)
+    try:
+        before = get_memory_usage()['process']['test_jobs']
+        usage, _ = _with_budgets(10 ** 9, before // 2, enforce_memory_budgets)
+    finally:
+        memory._process_caches = original_caches
+
+    assert usage['budget_crossed']
+    assert usage['process']['test_jobs'] <= before // 2
+    # Least recently used postings went first
+    assert store.get(job_hash({'title': "Role 19", 'company': "Acme", 'url': "#19"})) is not None
+    assert store.get(job_hash({'title': "Role 0", 'company': "Acme", 'url': "#0"})) is None
+
+
+def test_session_budget_evicts_rebuildable_values_and_collects_once():
+    _reset_session()
+    st.session_state.jobs_cache = {"search": {'job_ids': ["a" * 32], 'timestamp': "2024-01-01T00:00:00"}}
+    st.session_state.search_history = ["data analyst"] * 5
+    st.session_state.resume_text = "x" * 50000
+    st.session_state.resume_embedding = [0.1] * 1536
+    st.session_state.generated_resume = {'summary': "y" * 20000}
+    st.session_state.match_score = 0.8
+    st.session_state.show_resume_generator = True
+
+    usage, collections = _with_budgets(10 ** 9, 10 ** 12, enforce_memory_budgets)
+    assert not usage['budget_crossed'] and not collections
+
+    # resume_text alone is over budget; the generated resume is kept while its page is open
+    usage, collections = _with_budgets(1000, 10 ** 12, enforce_memory_budgets)
+    assert usage['budget_crossed'] and collections == [1]
+    assert st.session_state.jobs_cache == {} and st.session_state.search_history == []
+    assert st.session_state.resume_embedding is None
+    assert st.session_state.generated_resume and st.session_state.match_score == 0.8
+
+    st.session_state.show_resume_generator = False
+    usage, collections = _with_budgets(1000, 10 ** 12, enforce_memory_budgets)
+    assert usage['budget_crossed'] and collections == [1]
+    assert st.session_state.generated_resume is None and st.session_state.match_score is None
+    assert st.session_state.resume_text
+
+    # Nothing left to evict: later reruns neither evict nor collect
+    usage, collections = _with_budgets(1000, 10 ** 12, enforce_memory_budgets)
+    assert not usage['budget_crossed'] and not collections
+    assert usage['session_total'] > 1000
+
+
+def _fixed_cache(size):
+    """A registered cache of size bytes whose trim_fn records the targets it was given."""
+    cache = {'size': size, 'targets': []}
+
+    def trim(max_bytes):
+        cache['targets'].append(max_bytes)
+        freed = max(0, cache['size'] - max_bytes)
+        cache['size'] -= freed
+        return freed
+    return cache, trim
+
+
+def test_other_sessions_and_untrimmable_caches_do_not_flush_shared_caches():
+    _reset_session()
+    jobs, trim_jobs = _fixed_cache(300)
+    notes, trim_notes = _fixed_cache(100)
+    original = (memory._process_caches, dict(memory._session_usage))
+    memory._process_caches = {}
+    memory.register_process_cache('jobs', lambda: jobs['size'], trim_jobs)
+    memory.register_process_cache('notes', lambda: notes['size'], trim_notes)
+    try:
+        # Other sessions hold far more than the process budget, but the shared caches fit
+        memory._session_usage['other-session'] = (10 ** 6, memory.time.time())
+        usage, collections = _with_budgets(10 ** 9, 1000, enforce_memory_budgets)
+        assert usage['process_total'] > 1000 and usage['caches_total'] == 400
+        assert not usage['budget_crossed'] and not collections
+        assert jobs['targets'] == notes['targets'] == []
+
+        # Over budget by 200: both caches give up half, in proportion to their size
+        usage, _ = _with_budgets(10 ** 9, 200, enforce_memory_budgets)
+        assert usage['budget_crossed']
+        assert (jobs['size'], notes['size']) == (150, 50)
+
+        # An untrimmable cache over the budget on its own leaves the others their minimum share
+        memory.register_process_cache('embeddings', lambda: 10 ** 6)
+        usage, _ = _with_budgets(10 ** 9, 400, enforce_memory_budgets)
+        assert usage['budget_crossed']
+        assert (jobs['size'], notes['size']) == (75, 25)
+
+        # Still over budget on the next rerun, but nothing is left to trim: no trim calls, no collection
+        calls = len(jobs['targets'])
+        usage, collections = _with_budgets(10 ** 9, 400, enforce_memory_budgets)
+        assert not usage['budget_crossed'] and not collections
+        assert len(jobs['targets']) == calls
+    finally:
+        memory._process_caches = original[0]
+        memory._session_usage.clear()
+        memory._session_usage.update(original[1])
+
+
+if __name__ == "__main__":
+    test_estimate_bytes()
+    test_session_budget_evicts_least_recently_used_and_collects()
+    test_process_budget_trims_registered_caches()
+    test_session_budget_evicts_rebuildable_values_and_collects_once()
+    test_other_sessions_and_untrimmable_caches_do_not_flush_shared_caches()
+    print("✅ All tests passed!")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for the metrics registry, Prometheus export and the salary memo
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.utils import metrics, helpers
+from modules.utils.api_clients import TokenUsageTracker
+from modules.analysis import match_analysis
+
+
+class _Response:
+    def __init__(self, status_code, payload=None):
+        self.status_code = status_code
+        self.headers = {}
+        self.text = ""
+        self._payload = payload or {}
+
+    def json(self):
+        return self._payload
+
+
+def test_histogram_quantiles_and_summary():
+    metrics.get_metrics_registry().reset()
+    for value in [0.02] * 90 + [3.0] * 10:
+        metrics.observe('careerlens_stage_seconds', value, stage='index')
+    metrics.observe('careerlens_stage_seconds', 0.2, stage='fetch')
+
+    stages = metrics.metrics_summary()['stages']
+    assert stages['index']['count'] == 100
+    assert 0.01 <= stages['index']['p50'] <= 0.025
+    assert 2.5 <= stages['index']['p95'] <= 5.0
+    assert stages['fetch']['count'] == 1
+
+
+def test_cache_ratios_tokens_and_prometheus_text():
+    metrics.get_metrics_registry().reset()
+    metrics.record_cache_lookup('jobs', hits=3, misses=1)
+    tracker = TokenUsageTracker()
+    tracker.add_embedding_tokens(1000)
+    tracker.add_completion_tokens(200, 50)
+    metrics.observe('careerlens_analysis_tokens', 1250)
+
+    assert metrics.cache_hit_ratios() == {'jobs': 0.75}
+    text = metrics.render_prometheus()
+    assert '# TYPE careerlens_tokens_total counter' in text
+    assert 'careerlens_tokens_total{kind="embedding"} 1000' in text
+    assert 'careerlens_tokens_total{kind="completion"} 50' in text
+    assert 'careerlens_cache_hit_ratio{cache="jobs"} 0.75' in text
+    assert 'careerlens_analysis_tokens_bucket{le="2500"} 1' in text
+    assert 'careerlens_analysis_tokens_bucket{le="+Inf"} 1' in text
+    assert 'careerlens_analysis_tokens_count 1' in text
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = metrics.dump_metrics(os.path.join(tmp, 'metrics.prom'))
+        with open(path) as f:
+            assert 'careerlens_cost_usd_total' in f.read()
+
+
+def test_api_attempts_are_counted_per_endpoint_and_status():
+    metrics.get_metrics_registry().reset()
+    responses = iter([_Response(429), _Response(200)])
+    original_sleep = helpers._chunked_sleep
+    helpers._chunked_sleep = lambda delay, message_prefix="": None
+    try:
+        helpers.api_call_with_retry(lambda: next(responses), max_retries=3, provider='rapidapi', endpoint='indeed_search')
+    finally:
+        helpers._chunked_sleep = original_sleep
+
+    requests_total = {dict(labels)['status']: count for labels, count in
+                      metrics.get_metrics_registry().series('careerlens_api_requests_total').items()}
+    assert requests_total == {'429': 1, '200': 1}
+    registry = metrics.get_metrics_registry()
+    assert list(registry.series('careerlens_api_rate_limited_total').values()) == [1]
+    assert list(registry.series('careerlens_api_retries_total').values()) == [1]
+    assert metrics.histogram_quantiles('careerlens_api_request_seconds', by='endpoint')['indeed_search']['count'] == 2
+
+
+def test_salary_extraction_is_memoized_only_when_the_model_answered():
+    metrics.get_metrics_registry().reset()
+    match_analysis._salary_cache.clear()
+    calls = []
+
+    class _TextGen:
+        url = "http://mock"
+        headers = {}
+        token_tracker = None
+
+    answer = {'choices': [{'message': {'content': '{"found": true, "min_salary_hkd_monthly": 30000, '
+                                                  '"max_salary_hkd_monthly": 40000}'}}]}
+    status = {'code': 500}
+
+    def fake_call(make_request, **kwargs):
+        calls.append(kwargs)
+        return _Response(status['code'], answer)
+
+    original = (match_analysis.get_text_generator, match_analysis.api_call_with_retry)
+    match_analysis.get_text_generator = lambda: _TextGen()
+    match_analysis.api_call_with_retry = fake_call
+    try:
+        text = "Analyst role, HKD 25,000 - 35,000 per month"
+        assert match_analysis.extract_salary_from_text(text) == (25000, 35000)  # API down: regex
+        status['code'] = 200
+        assert match_analysis.extract_salary_from_text(text) == (30000, 40000)
+        assert match_analysis.extract_salary_from_text(text) == (30000, 40000)
+    finally:
+        match_analysis.get_text_generator, match_analysis.api_call_with_retry = original
+        match_analysis._salary_cache.clear()
+
+    assert len(calls) == 2
+    assert calls[0]['endpoint'] == 'chat'
+    assert metrics.cache_hit_ratios()['salary'] == round(1 / 3, 4)
+
+
+if __name__ == "__main__":
+    test_histogram_quantiles_and_summary()
+    test_cache_ratios_tokens_and_prometheus_text()
+    test_api_attempts_are_counted_per_endpoint_and_status()
+    test_salary_extraction_is_memoized_only_when_the_model_answered()
+    print("✅ All tests passed!")
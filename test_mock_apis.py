@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Tests for the local Azure OpenAI / RapidAPI Indeed mock server
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import requests
+from mock_apis import MockAPIServer, MockConfig
+from modules.utils.api_clients import APIMEmbeddingGenerator, AzureOpenAITextGenerator, IndeedScraperAPI
+
+MOCK_KEY = "mock-key-0123456789abcdef"
+
+
+def test_clients_work_against_the_mock():
+    with MockAPIServer(MockConfig(seed=7, embedding_dimensions=64)) as server:
+        scraper = IndeedScraperAPI(MOCK_KEY, base_url=server.base_url)
+        scraper.rate_limiter.max_requests_per_minute = 0
+        jobs = scraper.search_jobs("data analyst", max_rows=12)
+        again = scraper.search_jobs("data analyst", max_rows=12)
+        assert len(jobs) == 12
+        assert [job['url'] for job in jobs] == [job['url'] for job in again]
+        assert all(job['skills'] and job['description'] for job in jobs)
+
+        embedder = APIMEmbeddingGenerator(MOCK_KEY, server.base_url)
+        vector, tokens = embedder.get_embedding("Python data analyst")
+        assert len(vector) == 64 and tokens > 0
+        batch, _ = embedder.get_embeddings_batch(["Python data analyst", "Chef"], batch_size=2)
+        assert batch[0] == vector
+
+        text_gen = AzureOpenAITextGenerator(MOCK_KEY, server.base_url)
+        keywords = text_gen.extract_job_keywords("We need Python, SQL and AWS experience.")
+        assert {"Python", "SQL", "AWS"} <= set(keywords)
+        notes = text_gen.generate_recruiter_notes_batch(
+            [(jobs[0], 0.8, 0.5), (jobs[1], 0.7, 0.4)], {'summary': "Analyst", 'experience': "5 years"}
+        )
+        assert sorted(notes) == [0, 1]
+
+        stats = server.stats()
+        assert stats['indeed']['ok'] == 2
+        assert stats['embeddings']['items'] == 3
+        assert stats['chat']['completion_tokens'] > 0
+
+
+def test_rate_limits_latency_and_hangs():
+    config = MockConfig.from_dict({
+        'embeddings': {'requests_per_minute': 1, 'retry_after': 3},
+        'chat': {'latency': 'fixed:150'},
+        'indeed': {'timeout_rate': 1.0, 'hang_seconds': 0.1},
+    })
+    with MockAPIServer(config) as server:
+        url = f"{server.base_url}/openai/deployments/text-embedding-3-small/embeddings?api-version=2024-02-01"
+        headers = {'api-key': MOCK_KEY}
+        assert requests.post(url, json={'input': "a"}, headers=headers).status_code == 200
+        limited = requests.post(url, json={'input': "a"}, headers=headers)
+        assert limited.status_code == 429 and limited.headers['Retry-After'] == "3"
+        assert requests.post(url, json={'input': "a"}).status_code == 401
+
+        start = time.perf_counter()
+        chat_url = f"{server.base_url}/openai/deployments/gpt-4o-mini/chat/completions"
+        assert requests.post(chat_url, json={'messages': []}, headers=headers).status_code == 200
+        assert time.perf_counter() - start >= 0.15
+
+        try:
+            requests.post(f"{server.base_url}/api/job", json={'scraper': {}},
+                          headers={'x-rapidapi-key': MOCK_KEY}, timeout=5)
+            raise AssertionError("hung request should not get a response")
+        except requests.exceptions.ConnectionError:
+            pass
+
+        stats = requests.get(f"{server.base_url}/__mock__/stats").json()
+        assert stats['embeddings']['rate_limited'] == 1
+        assert stats['indeed']['hangs'] == 1
+
+
+if __name__ == "__main__":
+    test_clients_work_against_the_mock()
+    test_rate_limits_latency_and_hangs()
+    print("✅ All tests passed!")
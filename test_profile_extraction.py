@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Tests for two-pass profile extraction and the concurrent resume embedding
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.resume_upload import profile_extraction
+
+
+RESUME = """Jane Doe
+Python developer
+
+EXPERIENCE
+Data Engineer, Acme Ltd, 2019 - 2023
+Built ETL pipelines in Python and SQL
+
+EDUCATION
+BSc Computer Science, HKU, 2015 - 2019
+"""
+
+PASS1_PROFILE = {
+    'name': "Jane Doe",
+    'summary': "Python developer",
+    'experience': "Data Engineer, Acme, 2019",
+    'education': "BSc, HKU",
+    'skills': "Python, SQL",
+}
+
+PASS2_FIELDS_VERIFIED = {
+    'experience': "Data Engineer, Acme Ltd, 2019 - 2023",
+    'education': "BSc Computer Science, HKU, 2015 - 2019",
+    # Pass 2 is only trusted for PASS2_FIELDS; anything else must be ignored
+    'name': "Someone Else",
+    'skills': "COBOL",
+}
+
+
+class _Response:
+    status_code = 200
+    text = ""
+
+    def __init__(self, content):
+        self._content = content
+
+    def json(self):
+        return {'choices': [{'message': {'content': json.dumps(self._content)}}]}
+
+
+class _Requests:
+    """Stands in for the requests module: answers pass 1 and pass 2 by prompt."""
+
+    def __init__(self, pass2_error=None):
+        self.pass2_error = pass2_error
+        self.calls = []
+
+    def post(self, url, headers, json, timeout):
+        system_prompt = json['messages'][0]['content']
+        if system_prompt.startswith("You are a resume quality checker"):
+            self.calls.append('pass2')
+            if self.pass2_error:
+                raise self.pass2_error
+            return _Response(PASS2_FIELDS_VERIFIED)
+        self.calls.append('pass1')
+        return _Response(PASS1_PROFILE)
+
+
+class _TextGen:
+    url = "https://example.openai.azure.com/openai/deployments/gpt/chat/completions"
+    headers = {}
+    token_tracker = None
+
+
+def _run_extraction(fake_requests, pass2_enabled=True):
+    embedded = []
+
+    def fake_embedding(resume_text):
+        embedded.append(resume_text)
+        return [0.1, 0.2, 0.3]
+
+    originals = (
+        profile_extraction.requests,
+        profile_extraction.get_text_generator,
+        profile_extraction.api_call_with_retry,
+        profile_extraction.generate_and_store_resume_embedding,
+        profile_extraction.ENABLE_PROFILE_PASS2,
+    )
+    profile_extraction.requests = fake_requests
+    profile_extraction.get_text_generator = lambda: _TextGen()
+    profile_extraction.api_call_with_retry = lambda make_request, **kwargs: make_request()
+    profile_extraction.generate_and_store_resume_embedding = fake_embedding
+    profile_extraction.ENABLE_PROFILE_PASS2 = pass2_enabled
+    try:
+        profile, embedding = profile_extraction.extract_profile_with_embedding(RESUME)
+    finally:
+        (
+            profile_extraction.requests,
+            profile_extraction.get_text_generator,
+            profile_extraction.api_call_with_retry,
+            profile_extraction.generate_and_store_resume_embedding,
+            profile_extraction.ENABLE_PROFILE_PASS2,
+        ) = originals
+    return profile, embedding, embedded
+
+
+def test_pass2_overwrites_only_experience_and_education():
+    fake_requests = _Requests()
+    profile, embedding, embedded = _run_extraction(fake_requests)
+
+    assert sorted(fake_requests.calls) == ['pass1', 'pass2']
+    for field in profile_extraction.PASS2_FIELDS:
+        assert profile[field] == PASS2_FIELDS_VERIFIED[field]
+    for field in set(PASS1_PROFILE) - set(profile_extraction.PASS2_FIELDS):
+        assert profile[field] == PASS1_PROFILE[field]
+    assert embedding == [0.1, 0.2, 0.3]
+    assert embedded == [RESUME]
+
+
+def test_verification_only_sees_experience_and_education():
+    fake_requests = _Requests()
+    original = profile_extraction.requests
+    profile_extraction.requests = fake_requests
+    original_retry = profile_extraction.api_call_with_retry
+    profile_extraction.api_call_with_retry = lambda make_request, **kwargs: make_request()
+    try:
+        verified = profile_extraction._verify_experience_and_education(_TextGen(), RESUME)
+    finally:
+        profile_extraction.requests = original
+        profile_extraction.api_call_with_retry = original_retry
+    assert verified == PASS2_FIELDS_VERIFIED
+    assert fake_requests.calls == ['pass2']
+
+
+def test_failed_pass2_keeps_pass1_profile():
+    profile, embedding, _ = _run_extraction(_Requests(pass2_error=RuntimeError("503 Service Unavailable")))
+    assert profile == PASS1_PROFILE
+    assert embedding == [0.1, 0.2, 0.3]
+
+
+def test_raising_pass2_keeps_pass1_profile():
+    original = profile_extraction._verify_experience_and_education
+
+    def raising_verify(text_gen, resume_text):
+        raise RuntimeError("pass 2 crashed")
+
+    profile_extraction._verify_experience_and_education = raising_verify
+    try:
+        profile, embedding, _ = _run_extraction(_Requests())
+    finally:
+        profile_extraction._verify_experience_and_education = original
+    assert profile == PASS1_PROFILE
+    assert embedding == [0.1, 0.2, 0.3]
+
+
+def test_pass2_disabled_returns_pass1_profile():
+    fake_requests = _Requests()
+    profile, embedding, _ = _run_extraction(fake_requests, pass2_enabled=False)
+    assert fake_requests.calls == ['pass1']
+    assert profile == PASS1_PROFILE
+    assert embedding == [0.1, 0.2, 0.3]
+
+
+if __name__ == "__main__":
+    test_pass2_overwrites_only_experience_and_education()
+    test_verification_only_sees_experience_and_education()
+    test_failed_pass2_keeps_pass1_profile()
+    test_raising_pass2_keeps_pass1_profile()
+    test_pass2_disabled_returns_pass1_profile()
+    print("✅ All tests passed!")
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Tests for the opt-in profiler and admin token gating
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.utils import profiling
+from modules.utils.tracing import trace_span
+
+
+def _busy_work():
+    blocks = [bytearray(4096) for _ in range(200)]
+    return sum(len(block) for block in blocks) + sum(i * i for i in range(20000)), blocks
+
+
+def test_profile_block_records_functions_and_allocations():
+    profiling.clear_profiles()
+    with trace_span('request') as span:
+        with profiling.profile_block('run'):
+            _, kept = _busy_work()
+
+    profile = profiling.get_profiles()[0]
+    assert profile['name'] == 'run' and profile['trace_id'] == span.trace_id
+    assert any(row['function'] == '_busy_work' for row in profile['top_functions'])
+    assert profile['top_allocations'] and profile['top_allocations'][0]['size_kb'] > 100
+    assert 'test_profiling.py' in profile['top_allocations'][0]['location']
+    assert not profiling.tracemalloc.is_tracing()
+    del kept
+
+
+def test_nested_blocks_share_the_cpu_profiler():
+    profiling.clear_profiles()
+    with profiling.profile_block('run'):
+        with profiling.profile_block('index'):
+            _busy_work()
+    inner, outer = profiling.get_profiles()[1], profiling.get_profiles()[0]
+    assert outer['name'] == 'run' and outer['top_functions']
+    assert inner['name'] == 'index' and inner['top_functions'] == []
+    assert not profiling.tracemalloc.is_tracing()
+
+
+def test_profiling_is_gated_by_targets_and_admin_token():
+    original = (profiling.ADMIN_TOKEN, profiling.PROFILE_TARGETS, profiling.PROFILING_ENABLED)
+    try:
+        profiling.ADMIN_TOKEN = ""
+        assert not profiling.is_admin_token("")
+        profiling.ADMIN_TOKEN = "s3cret"
+        assert profiling.is_admin_token("s3cret")
+        assert not profiling.is_admin_token("guess") and not profiling.is_admin_token(None)
+
+        profiling.clear_profiles()
+        profiling.PROFILING_ENABLED = True
+        profiling.PROFILE_TARGETS = "run, index"
+        with profiling.profile_if_enabled('fetch'):
+            pass
+        with profiling.profile_if_enabled('index'):
+            pass
+        assert [profile['name'] for profile in profiling.get_profiles()] == ['index']
+
+        profiling.PROFILING_ENABLED = False
+        with profiling.profile_if_enabled('index'):
+            pass
+        assert len(profiling.get_profiles()) == 1
+    finally:
+        profiling.ADMIN_TOKEN, profiling.PROFILE_TARGETS, profiling.PROFILING_ENABLED = original
+        profiling.clear_profiles()
+
+
+def _admin_page():
+    import streamlit as st
+    from modules.utils import profiling
+    profiling.apply_admin_query_params()
+    st.write(bool(st.session_state.get('is_admin')))
+
+
+def test_admin_token_is_removed_from_the_url():
+    from streamlit.testing.v1 import AppTest
+    original = profiling.ADMIN_TOKEN
+    profiling.ADMIN_TOKEN = "s3cret"
+    try:
+        at = AppTest.from_function(_admin_page)
+        at.query_params['admin'] = "s3cret"
+        at.query_params['diagnostics'] = "1"
+        at.run()
+        assert not at.exception
+        assert at.session_state.is_admin and at.session_state.show_diagnostics
+        assert 'admin' not in at.query_params and at.query_params['diagnostics'] == "1"
+
+        # Admin stays on for the session without the token in the URL
+        at.run()
+        assert at.session_state.is_admin
+    finally:
+        profiling.ADMIN_TOKEN = original
+
+
+if __name__ == "__main__":
+    test_profile_block_records_functions_and_allocations()
+    test_nested_blocks_share_the_cpu_profiler()
+    test_profiling_is_gated_by_targets_and_admin_token()
+    test_admin_token_is_removed_from_the_url()
+    print("✅ All tests passed!")
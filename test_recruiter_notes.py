@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for batched, cached recruiter notes
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.analysis import recruiter_notes
+from modules.utils.api_clients import AzureOpenAITextGenerator
+
+
+class _TextGen:
+    fallback_recruiter_note = staticmethod(AzureOpenAITextGenerator.fallback_recruiter_note)
+
+    def __init__(self):
+        self.batch_calls = []
+        self.single_calls = 0
+
+    def generate_recruiter_notes_batch(self, matches, user_profile):
+        self.batch_calls.append(len(matches))
+        return {idx: f"Note for {job['title']}" for idx, (job, _, _) in enumerate(matches)}
+
+    def generate_recruiter_note(self, job, user_profile, semantic_score, skill_score):
+        self.single_calls += 1
+        return f"Single note for {job['title']}"
+
+
+def _matches(count):
+    return [
+        {
+            'job': {'title': f"Engineer {i}", 'company': "Acme", 'url': f"https://jobs/{i}"},
+            'similarity_score': 0.8 - i * 0.01,
+            'skill_match_score': 0.5,
+        }
+        for i in range(count)
+    ]
+
+
+def test_prefetch_batches_top_matches_and_serves_clicks_from_cache():
+    text_gen = _TextGen()
+    original = recruiter_notes.get_text_generator
+    recruiter_notes.get_text_generator = lambda: text_gen
+    recruiter_notes._notes_cache.clear()
+    profile = {'summary': "Backend engineer", 'experience': "5 years"}
+    matched_jobs = _matches(12)
+    try:
+        future = recruiter_notes.prefetch_recruiter_notes(matched_jobs, profile, top_n=10)
+        future.result(timeout=5)
+        # A rerun with the same results must not send another batch
+        assert recruiter_notes.prefetch_recruiter_notes(matched_jobs, profile, top_n=10) is None
+
+        first = matched_jobs[0]
+        note = recruiter_notes.get_recruiter_note(
+            first['job'], profile, first['similarity_score'], first['skill_match_score']
+        )
+        assert note == "Note for Engineer 0"
+        assert text_gen.batch_calls == [10]
+        assert text_gen.single_calls == 0
+
+        # Rows outside the prefetched top N are generated on demand and cached
+        last = matched_jobs[-1]
+        for _ in range(2):
+            recruiter_notes.get_recruiter_note(
+                last['job'], profile, last['similarity_score'], last['skill_match_score']
+            )
+        assert text_gen.single_calls == 1
+    finally:
+        recruiter_notes.get_text_generator = original
+        recruiter_notes._notes_cache.clear()
+
+
+class _FailingTextGen(_TextGen):
+    def generate_recruiter_notes_batch(self, matches, user_profile):
+        self.batch_calls.append(len(matches))
+        raise RuntimeError("429 Too Many Requests")
+
+    def generate_recruiter_note(self, job, user_profile, semantic_score, skill_score):
+        self.single_calls += 1
+        return self.fallback_recruiter_note(job, semantic_score)
+
+
+def test_failed_calls_back_off_until_the_retry_window_passes():
+    text_gen = _FailingTextGen()
+    original = recruiter_notes.get_text_generator
+    recruiter_notes.get_text_generator = lambda: text_gen
+    recruiter_notes._notes_cache.clear()
+    recruiter_notes._failed_notes.clear()
+    profile = {'summary': "Backend engineer", 'experience': "5 years"}
+    matched_jobs = _matches(12)
+    first, last = matched_jobs[0], matched_jobs[-1]
+    try:
+        future = recruiter_notes.prefetch_recruiter_notes(matched_jobs, profile, top_n=10)
+        future.result(timeout=5)
+        assert not recruiter_notes._pending_notes
+        # Reruns neither resend the batch nor fall back to single calls for its jobs
+        assert recruiter_notes.prefetch_recruiter_notes(matched_jobs, profile, top_n=10) is None
+        note = recruiter_notes.get_recruiter_note(
+            first['job'], profile, first['similarity_score'], first['skill_match_score']
+        )
+        assert note == text_gen.fallback_recruiter_note(first['job'], first['similarity_score'])
+        assert text_gen.batch_calls == [10] and text_gen.single_calls == 0
+
+        # A failed single call backs off too
+        for _ in range(2):
+            recruiter_notes.get_recruiter_note(
+                last['job'], profile, last['similarity_score'], last['skill_match_score']
+            )
+        assert text_gen.single_calls == 1
+
+        # Once the window has passed the batch is retried
+        for key in recruiter_notes._failed_notes:
+            recruiter_notes._failed_notes[key] = 0
+        future = recruiter_notes.prefetch_recruiter_notes(matched_jobs, profile, top_n=10)
+        future.result(timeout=5)
+        assert text_gen.batch_calls == [10, 10]
+    finally:
+        recruiter_notes.get_text_generator = original
+        recruiter_notes._notes_cache.clear()
+        recruiter_notes._failed_notes.clear()
+
+
+if __name__ == "__main__":
+    test_prefetch_batches_top_matches_and_serves_clicks_from_cache()
+    test_failed_calls_back_off_until_the_retry_window_passes()
+    print("✅ All tests passed!")
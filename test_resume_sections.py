@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for resume section segmentation
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.resume_upload import iter_resume_sections, extract_relevant_resume_sections
+
+SAMPLE_RESUME = """Jane Doe
+jane@example.com | Hong Kong
+
+PROFESSIONAL SUMMARY
+Data engineer with 8 years of experience building pipelines.
+
+WORK EXPERIENCE
+Senior Data Engineer - Acme Corp (Jan 2020 - Present)
+- Built streaming pipelines with Kafka and Spark
+Data Engineer - Beta Ltd (2016 - 2019)
+
+EDUCATION
+BSc Computer Science, University of Hong Kong, 2016
+
+TECHNICAL SKILLS
+Python, SQL, Spark, Kafka
+
+CERTIFICATIONS
+AWS Certified Solutions Architect
+"""
+
+
+def test_sections_are_typed_in_document_order():
+    sections = {name: body for name, _, body in iter_resume_sections(SAMPLE_RESUME)}
+    assert list(sections) == ['preamble', 'summary', 'experience', 'education', 'skills', 'certifications']
+    # Body lines that merely mention a section keyword stay in their section
+    assert "8 years of experience" in sections['summary']
+    assert "Acme Corp" in sections['experience']
+    assert "Beta Ltd" in sections['experience']
+    assert sections['skills'] == "Python, SQL, Spark, Kafka"
+    assert "jane@example.com" in sections['preamble']
+    assert list(iter_resume_sections("")) == []
+
+
+def test_relevant_sections_keep_only_experience_and_education():
+    result = extract_relevant_resume_sections(SAMPLE_RESUME)
+    assert result.startswith("WORK EXPERIENCE\n")
+    assert "EDUCATION\nBSc Computer Science" in result
+    assert "Python, SQL" not in result
+    assert "AWS Certified" not in result
+
+
+def test_relevant_sections_fall_back_to_dated_lines():
+    text = "Acme Corp 2019 - 2021\nBuilt things\nBeta Ltd 2015"
+    assert extract_relevant_resume_sections(text) == text
+    assert extract_relevant_resume_sections("") == ""
+
+
+if __name__ == "__main__":
+    test_sections_are_typed_in_document_order()
+    test_relevant_sections_keep_only_experience_and_education()
+    test_relevant_sections_fall_back_to_dated_lines()
+    print("✅ All tests passed!")
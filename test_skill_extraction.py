@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Tests for keyword skill extraction and the app.py entry point shim
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.skills import extract_skills_from_text
+
+REPO_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_extracts_display_names_with_title_skills_first():
+    skills = extract_skills_from_text(
+        "Build dashboards in Tableau, write SQL and Python, deploy on AWS (k8s). Knowledge of R.",
+        "Python Data Engineer"
+    )
+    assert skills[0] == 'Python'
+    assert {'SQL', 'AWS', 'Tableau', 'Kubernetes', 'R'} <= set(skills)
+    # 'r' only matches as a word, not inside "programming" or "engineer"
+    assert 'R' not in extract_skills_from_text("Strong programming background", "Engineer")
+    assert extract_skills_from_text("", "Python Developer") == []
+
+
+def test_case_insensitive_matches_and_limit():
+    assert extract_skills_from_text("ſql and PYTHON", "") == ['Python', 'SQL']
+    many = " ".join(['python', 'java', 'sql', 'docker', 'kubernetes', 'react', 'angular', 'django', 'flask',
+                     'excel', 'tableau', 'jira', 'figma', 'agile', 'scrum', 'leadership', 'english'])
+    assert len(extract_skills_from_text(many)) == 15
+
+
+def test_app_py_delegates_to_the_modular_app():
+    from streamlit.testing.v1 import AppTest
+    with open(os.path.join(REPO_ROOT, 'app.py'), encoding='utf-8') as f:
+        assert len(f.read().splitlines()) < 30
+    at = AppTest.from_file(os.path.join(REPO_ROOT, 'app.py'), default_timeout=60)
+    at.run()
+    assert not at.exception
+    assert [button.label for button in at.sidebar.button] == ['Analyze Profile & Find Matches']
+
+
+if __name__ == "__main__":
+    test_extracts_display_names_with_title_skills_first()
+    test_case_insensitive_matches_and_limit()
+    test_app_py_delegates_to_the_modular_app()
+    print("✅ All tests passed!")
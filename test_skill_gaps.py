@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Tests for skill gap aggregation across a result set
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.skills import analyze_skill_gaps
+
+
+def _result(skills):
+    return {'job': {'title': "Role", 'company': "Acme", 'skills': skills}}
+
+
+def test_gap_report_counts_matches_and_missing_skills():
+    matched_jobs = [
+        _result(["Python", "K8s", "Terraform"]),
+        _result(["python3", "Terraform", "Go", "Go"]),
+        _result([]),
+    ]
+    report = analyze_skill_gaps(matched_jobs, "Python, Kubernetes")
+
+    assert report.job_matching_skills == (("Python", "K8s"), ("python3",), ())
+    assert report.job_missing_skills == (("Terraform",), ("Terraform", "Go"), ())
+    assert report.job_matched_counts == (2, 1, 0)
+    assert report.job_skill_counts == (3, 3, 0)
+    assert report.gap_count == 2
+    assert report.top_missing[0] == ("Terraform", 2)
+
+    # Same result set and profile are served from the memo
+    assert analyze_skill_gaps(matched_jobs, "Python, Kubernetes") is report
+
+
+if __name__ == "__main__":
+    test_gap_report_counts_matches_and_missing_skills()
+    print("✅ All tests passed!")
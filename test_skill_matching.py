@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Tests for vectorized semantic skill matching across all jobs
+"""
+
+import os
+import sys
+import zlib
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.semantic_search import job_search
+from modules.semantic_search.job_search import SemanticJobSearch
+from modules.semantic_search.skill_store import SkillEmbeddingStore, normalize_skill
+from modules.skills import SkillIndex, get_skill_index, canonicalize_skills, analyze_skill_gaps
+
+
+def _canonical_vector(skill):
+    return _vector(normalize_skill(get_skill_index().canonical_name(skill)))
+
+
+def _vector(text):
+    # Skills sharing a first letter point the same way, so they match above the threshold
+    base = np.random.default_rng(ord(text[0].lower())).normal(size=16)
+    noise = np.random.default_rng(zlib.crc32(text.encode())).normal(size=16)
+    return list(base + 0.3 * noise)
+
+
+class _EmbeddingGen:
+    def __init__(self):
+        self.batches = []
+
+    def get_embeddings_batch(self, texts, batch_size=None):
+        self.batches.append(list(texts))
+        return [_vector(text) for text in texts], len(texts)
+
+
+def _reference_match(user_skills_list, job_skills_list):
+    """Per-job loop the vectorized engine replaces"""
+    user_embs = np.array([_canonical_vector(s) for s in user_skills_list])
+    job_embs = np.array([_canonical_vector(s) for s in job_skills_list])
+    user_embs /= np.linalg.norm(user_embs, axis=1, keepdims=True)
+    job_embs /= np.linalg.norm(job_embs, axis=1, keepdims=True)
+    similarity_matrix = job_embs @ user_embs.T
+    matched_skills, matched_indices = [], set()
+    for job_idx, job_skill in enumerate(job_skills_list):
+        best_match_idx = int(np.argmax(similarity_matrix[job_idx]))
+        if similarity_matrix[job_idx][best_match_idx] >= 0.7 and best_match_idx not in matched_indices:
+            matched_skills.append(job_skill)
+            matched_indices.add(best_match_idx)
+    missing = [js for js in job_skills_list if js not in matched_skills]
+    return len(matched_skills) / len(job_skills_list), missing[:5]
+
+
+def test_batch_matches_per_job_reference():
+    user_skills = "Python, SQL, Docker, Kubernetes"
+    jobs_skills = [
+        ["Python", "PySpark", "Pandas", "Scala"],
+        ["SQL", "Spark", "Salesforce", "Excel", "Docker"],
+        [],
+        ["Kotlin", "Kafka", "Java"],
+        ["Python", "SQL"],
+    ]
+    embedding_gen = _EmbeddingGen()
+    engine = SemanticJobSearch(embedding_gen, use_persistent_store=False)
+    store = SkillEmbeddingStore()
+    original = (job_search.USE_FAST_SKILL_MATCHING, job_search.get_skill_embedding_store)
+    job_search.USE_FAST_SKILL_MATCHING = False
+    job_search.get_skill_embedding_store = lambda: store
+    try:
+        results = engine.calculate_skill_matches(user_skills, jobs_skills)
+        # Second run is served from the caches without any embedding call
+        engine.calculate_skill_matches(user_skills, jobs_skills)
+    finally:
+        job_search.USE_FAST_SKILL_MATCHING, job_search.get_skill_embedding_store = original
+
+    user_skills_list = [s.strip() for s in user_skills.split(',')]
+    for job_skills_list, (score, missing) in zip(jobs_skills, results):
+        if not job_skills_list:
+            assert (score, missing) == (0.0, [])
+            continue
+        expected_score, expected_missing = _reference_match(user_skills_list, job_skills_list)
+        assert abs(score - expected_score) < 1e-6
+        assert missing == expected_missing
+
+    # User skills and every unique job skill are embedded in a single call
+    assert len(embedding_gen.batches) == 1
+    assert len(embedding_gen.batches[0]) == len(set(embedding_gen.batches[0])) == 13
+
+
+def test_store_shares_rows_across_jobs_and_persists():
+    import tempfile
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "skills.npz")
+        embedding_gen = _EmbeddingGen()
+        store = SkillEmbeddingStore(path=path)
+        _, present = store.get_vectors(["Python", "SQL"], embedding_gen)
+        matrix, present = store.get_vectors([" python ", "Spark", "sql"], embedding_gen)
+        assert present == [True, True, True]
+        assert embedding_gen.batches == [["python", "sql"], ["spark"]]
+        assert matrix.dtype == np.float32 and matrix.shape == (3, 16)
+        assert np.allclose(np.linalg.norm(matrix, axis=1), 1.0, atol=1e-5)
+
+        # Saves are batched: nothing is written until save_every skills were added or the store is flushed
+        assert not os.path.exists(path)
+        assert store.flush() and not store.flush()
+
+        reloaded = SkillEmbeddingStore(path=path)
+        assert len(reloaded) == 3
+        reloaded_matrix, _ = reloaded.get_vectors(["python", "spark", "sql"])
+        assert np.allclose(reloaded_matrix, matrix)
+
+
+def test_filling_the_store_keeps_the_skills_being_looked_up():
+    embedding_gen = _EmbeddingGen()
+    store = SkillEmbeddingStore(max_skills=4)
+    first, _ = store.get_vectors(["a", "b", "c"], embedding_gen)
+    matrix, present = store.get_vectors(["a", "b", "d", "e", "f"], embedding_gen)
+    assert present == [True] * 5
+    assert embedding_gen.batches[-1] == ["d", "e", "f"]
+    assert np.allclose(matrix[:2], first[:2])
+    assert "c" not in store and len(store) == 5
+
+
+def test_trim_keeps_the_most_recently_looked_up_skills():
+    embedding_gen = _EmbeddingGen()
+    store = SkillEmbeddingStore()
+    store.get_vectors(["a", "b", "c", "d"], embedding_gen)
+    recent, _ = store.get_vectors(["c", "a"], embedding_gen)
+    assert store.nbytes == 4 * 16 * 4
+
+    assert store.trim_to(2 * 16 * 4) == 2 * 16 * 4
+    assert len(store) == 2 and "a" in store and "c" in store and "b" not in store
+    matrix, present = store.get_vectors(["c", "a"])
+    assert present == [True, True] and np.allclose(matrix, recent)
+    assert store.trim_to(2 * 16 * 4) == 0
+
+    # Trimmed skills are embedded again on their next lookup
+    _, present = store.get_vectors(["b"], embedding_gen)
+    assert present == [True] and embedding_gen.batches[-1] == ["b"]
+
+
+def test_store_saves_in_the_background_every_save_every_additions():
+    import tempfile
+    import time
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "skills.npz")
+        store = SkillEmbeddingStore(path=path, save_every=3)
+        store.get_vectors(["a", "b"], _EmbeddingGen())
+        assert not os.path.exists(path)
+        store.get_vectors(["c"], _EmbeddingGen())
+        deadline = time.monotonic() + 5
+        while not os.path.exists(path) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert len(SkillEmbeddingStore(path=path)) == 3
+
+
+def test_aliases_resolve_to_one_id_and_match_by_set():
+    ids = canonicalize_skills(["k8s", "Kubernetes", "nodejs", "Node.js", "Power-BI", "powerbi", "", None])
+    assert ids[0] == ids[1] and ids[2] == ids[3] and ids[4] == ids[5]
+    assert ids[6:] == (-1, -1)
+
+    engine = SemanticJobSearch(_EmbeddingGen(), use_persistent_store=False)
+    score, missing = engine._calculate_skill_match_string_based(
+        ["K8s", "NodeJS", "python3"],
+        ["Kubernetes", "Node.js", "Python", "Terraform"]
+    )
+    assert score == 0.75
+    assert missing == ["Terraform"]
+
+
+def test_unknown_skills_get_stable_ids_without_growing_the_index():
+    index = SkillIndex(max_adhoc_names=3)
+    dictionary_size = len(index)
+    ids = [index.skill_id(f"Internal Tool {i}") for i in range(10)]
+    assert len(set(ids)) == 10 and min(ids) >= dictionary_size
+    assert len(index) == dictionary_size + 3
+    # Same skill, same ID, even after its display name was evicted
+    assert index.skill_id("internal-tool 0") == ids[0]
+    assert index.name(ids[1], "fallback") == "fallback"
+    assert index.canonical_name("Internal Tool 1") == "Internal Tool 1"
+    assert index.lookup("Internal Tool 9") is None
+    assert index.trim_to(0) > 0 and len(index) == dictionary_size
+
+    # Hashed IDs are far apart; gap analysis still counts them per distinct skill
+    jobs = [{'job': {'skills': ["Internal Tool 0", "Python"]}}, {'job': {'skills': ["internal tool 0"]}}]
+    report = analyze_skill_gaps(jobs, "Python")
+    assert report.top_missing == (("Internal Tool 0", 2),)
+    assert report.job_matched_counts == (1, 0)
+
+
+if __name__ == "__main__":
+    test_batch_matches_per_job_reference()
+    test_store_shares_rows_across_jobs_and_persists()
+    test_filling_the_store_keeps_the_skills_being_looked_up()
+    test_trim_keeps_the_most_recently_looked_up_skills()
+    test_store_saves_in_the_background_every_save_every_additions()
+    test_aliases_resolve_to_one_id_and_match_by_set()
+    test_unknown_skills_get_stable_ids_without_growing_the_index()
+    print("✅ All tests passed!")
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Tests for tracing spans: nesting, errors, the ring buffer, the JSONL file and retry attributes
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.utils import tracing, helpers
+from modules.utils.tracing import trace_span, traced, current_span, get_recent_spans, clear_spans
+
+
+class _Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+        self.headers = {}
+        self.text = ""
+
+    def json(self):
+        return {}
+
+
+def test_spans_nest_and_record_errors():
+    clear_spans()
+
+    @traced('inner', kind='decorated')
+    def inner():
+        current_span().add('tokens', 5).add('tokens', 2)
+
+    with trace_span('outer', query='analyst') as outer:
+        inner()
+        try:
+            with trace_span('failing'):
+                raise ValueError("boom")
+        except ValueError:
+            pass
+
+    spans = {span['name']: span for span in get_recent_spans(trace_id=outer.trace_id)}
+    assert set(spans) == {'outer', 'inner', 'failing'}
+    assert spans['outer']['parent_id'] is None and spans['outer']['attributes']['query'] == 'analyst'
+    assert spans['inner']['parent_id'] == spans['outer']['span_id']
+    assert spans['inner']['attributes'] == {'kind': 'decorated', 'tokens': 7}
+    assert spans['failing']['status'] == 'error' and spans['failing']['error'] == "ValueError: boom"
+    assert spans['outer']['duration_ms'] >= spans['inner']['duration_ms']
+
+    # Outside any span annotations are dropped instead of failing
+    current_span().set(ignored=True).add('ignored')
+    assert "failing" in tracing.format_trace(list(spans.values()))
+
+
+def test_background_work_nests_under_the_caller():
+    clear_spans()
+
+    def work():
+        with trace_span('child'):
+            pass
+
+    with trace_span('parent') as parent:
+        helpers.run_in_background(work).result()
+    child = next(span for span in get_recent_spans() if span['name'] == 'child')
+    assert child['parent_id'] == parent.span_id
+
+
+def test_ring_buffer_and_trace_file():
+    clear_spans()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'traces', 'spans.jsonl')
+        tracing.set_trace_file(path)
+        try:
+            for index in range(3):
+                with trace_span('step', index=index):
+                    pass
+        finally:
+            tracing.set_trace_file(None)
+        written = tracing.load_spans(path)
+    assert [span['attributes']['index'] for span in written] == [0, 1, 2]
+    assert len(get_recent_spans(limit=2)) == 2
+    assert tracing._finished_spans.maxlen == tracing.TRACE_BUFFER_SIZE
+
+
+def test_retries_are_recorded_on_the_http_span():
+    clear_spans()
+    responses = iter([_Response(429), _Response(200)])
+    original_sleep = helpers._chunked_sleep
+    helpers._chunked_sleep = lambda delay, message_prefix="": None
+    try:
+        with trace_span('api.test') as parent:
+            response = helpers.api_call_with_retry(lambda: next(responses), max_retries=3)
+    finally:
+        helpers._chunked_sleep = original_sleep
+    assert response.status_code == 200
+    http = next(span for span in get_recent_spans(trace_id=parent.trace_id) if span['name'] == 'http.request')
+    assert http['parent_id'] == parent.span_id
+    assert http['attributes']['attempts'] == 2
+    assert http['attributes']['rate_limited'] == 1
+    assert http['attributes']['status_code'] == 200
+    assert http['attributes']['backoff_s'] >= 1
+
+
+if __name__ == "__main__":
+    test_spans_nest_and_record_errors()
+    test_background_work_nests_under_the_caller()
+    test_ring_buffer_and_trace_file()
+    test_retries_are_recorded_on_the_http_span()
+    print("✅ All tests passed!")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Tests for the static asset pipeline: minification, hashed builds and the inline fallback
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from modules.ui import assets
+
+
+def test_minifiers_keep_meaning():
+    css = """
+    /* comment */
+    html[data-theme="dark"] :root {
+        --navy: #1e293b;
+        color: red;
+    }
+    .a > .b, .c { margin: 0 auto; }
+    """
+    assert assets.minify_css(css) == 'html[data-theme="dark"] :root{--navy: #1e293b;color: red}.a>.b,.c{margin: 0 auto}'
+    js = """
+    (function() {
+        // set up
+        const x = 1
+        return x;
+    })();
+    """
+    assert assets.minify_js(js) == "(function() {\nconst x = 1\nreturn x;\n})();"
+
+
+def test_assets_are_built_once_under_a_content_hash():
+    original = (assets.STATIC_DIR, assets._static_serving_enabled)
+    with tempfile.TemporaryDirectory() as tmp:
+        with open(os.path.join(tmp, 'site.css'), 'w') as f:
+            f.write("body {\n    color: red;\n}\n")
+        assets.STATIC_DIR = tmp
+        assets._static_serving_enabled = lambda: True
+        assets.clear_assets()
+        try:
+            asset = assets.get_asset('site.css')
+            assert asset.text == "body{color: red}"
+            assert asset.url == f"app/static/site.{asset.digest}.min.css"
+            with open(os.path.join(tmp, f"site.{asset.digest}.min.css")) as f:
+                assert f.read() == asset.text
+            assert assets.get_asset('site.css') is asset
+
+            # Static serving off: same hash, inlined instead of served
+            assets._static_serving_enabled = lambda: False
+            assets.clear_assets()
+            inline = assets.get_asset('site.css')
+            assert inline.url is None and inline.digest == asset.digest
+            assert assets.static_file_url('site.css') is None
+        finally:
+            assets.STATIC_DIR, assets._static_serving_enabled = original
+            assets.clear_assets()
+
+
+def test_shipped_assets_exist_and_are_plain_css():
+    with open(os.path.join(assets.STATIC_DIR, 'careerlens.css')) as f:
+        css = f.read()
+    assert '{{' not in css and '.hero-bg-logo' in css
+    assert os.path.exists(os.path.join(assets.STATIC_DIR, 'careerlens.js'))
+    assert os.path.exists(os.path.join(assets.STATIC_DIR, 'CareerLens_Logo.png'))
+
+
+if __name__ == "__main__":
+    test_minifiers_keep_meaning()
+    test_assets_are_built_once_under_a_content_hash()
+    test_shipped_assets_exist_and_are_plain_css()
+    print("✅ All tests passed!")